@@ -0,0 +1,13 @@
+"""
+Pytest configuration for the examples
+Makes the reusable helpers and fixtures in ../templates available here.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "templates"))
+
+# Registered as plugins, not star-imported: both modules define the same
+# pytest_* hooks, and a star import would also skip _odoo_db_reset
+pytest_plugins = ["odoo_fixtures", "odoo_shard_plugin"]
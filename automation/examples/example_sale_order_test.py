@@ -6,30 +6,27 @@ This demonstrates a full workflow test for creating and confirming a sale order.
 import pytest
 from playwright.sync_api import Page, expect
 
+from odoo_form_test import OdooFormTest, OdooRPCTracker
+
 
 @pytest.fixture(scope="function")
-def logged_in_page(page: Page):
-    """Fixture to provide a logged-in Odoo session"""
-    # Navigate to Odoo
-    page.goto("http://localhost:8069")
-    
-    # Login
-    page.fill("input[name='login']", "admin")
-    page.fill("input[name='password']", "admin")
-    page.click("button[type='submit']")
-    
-    # Wait for successful login
-    page.wait_for_selector(".o_main_navbar", timeout=10000)
+def logged_in_page(pooled_page: Page):
+    """
+    Fixture to provide a logged-in Odoo session
     
-    return page
+    pooled_page (templates/odoo_fixtures.py) hands out a warm browser
+    context that already carries the stored session, instead of a fresh
+    context and a login form fill for every test.
+    """
+    return pooled_page
 
 
-def test_create_and_confirm_sale_order(logged_in_page: Page):
+def test_create_and_confirm_sale_order(logged_in_page: Page, odoo_menu_resolver):
     """
     Complete test: Create a sale order, add products, and confirm it
     
     This test demonstrates:
-    - Navigation through Odoo menus
+    - Direct navigation to a menu's action
     - Form field manipulation
     - Many2one field selection
     - One2many line creation
@@ -37,14 +34,11 @@ def test_create_and_confirm_sale_order(logged_in_page: Page):
     - State verification
     """
     page = logged_in_page
+    rpc = OdooRPCTracker.for_page(page)
     
-    # Step 1: Navigate to Sales module
-    page.click("a.o_nav_entry:has-text('Sales')")
-    page.wait_for_load_state("networkidle")
-    
-    # Step 2: Open Quotations
-    page.click("a.o_nav_entry:has-text('Orders')")
-    page.click("a.o_nav_entry:has-text('Quotations')")
+    # Steps 1-2: Open Sales > Orders > Quotations directly via its action URL
+    # (falls back to clicking through the menus if the cached action is stale)
+    OdooFormTest.open_menu(page, ["Sales", "Orders", "Quotations"], resolver=odoo_menu_resolver)
     page.wait_for_selector(".o_list_view")
     
     # Step 3: Create new quotation
@@ -55,10 +49,10 @@ def test_create_and_confirm_sale_order(logged_in_page: Page):
     page.click("div[name='partner_id'] input")
     page.fill("div[name='partner_id'] input", "Azure Interior")
     page.wait_for_selector(".ui-autocomplete")
-    page.click(".ui-autocomplete li:has-text('Azure Interior')")
     
-    # Wait for customer details to load
-    page.wait_for_load_state("networkidle")
+    # Wait for customer details (onchange) to load
+    with rpc.expect_rpc(method="onchange"):
+        page.click(".ui-autocomplete li:has-text('Azure Interior')")
     
     # Step 5: Add first product line
     page.click("a.o_field_x2many_list_row_add")
@@ -73,7 +67,7 @@ def test_create_and_confirm_sale_order(logged_in_page: Page):
     page.fill("input[name='product_uom_qty']", "5")
     
     # Wait for price calculation
-    page.wait_for_load_state("networkidle")
+    rpc.wait_for_idle()
     
     # Step 6: Add second product line
     page.click("a.o_field_x2many_list_row_add")
@@ -84,7 +78,7 @@ def test_create_and_confirm_sale_order(logged_in_page: Page):
     page.click(".ui-autocomplete li:has-text('Office Chair')")
     
     page.fill("input[name='product_uom_qty']", "10")
-    page.wait_for_load_state("networkidle")
+    rpc.wait_for_idle()
     
     # Step 7: Verify total amount is calculated
     total_amount = page.locator("span[name='amount_total']")
@@ -103,8 +97,9 @@ def test_create_and_confirm_sale_order(logged_in_page: Page):
     print(f"Created quotation: {quotation_number}")
     
     # Step 11: Confirm the sale order
-    page.click("button[name='action_confirm']")
-    page.wait_for_load_state("networkidle")
+    with rpc.expect_rpc(method="action_confirm"):
+        page.click("button[name='action_confirm']")
+    rpc.wait_for_idle()
     
     # Step 12: Verify state changed to Sale Order
     expect(state_field).to_contain_text("Sale Order")
@@ -123,6 +118,7 @@ def test_create_and_confirm_sale_order(logged_in_page: Page):
 def test_sale_order_with_discount(logged_in_page: Page):
     """Test creating a sale order with discounted products"""
     page = logged_in_page
+    rpc = OdooRPCTracker.for_page(page)
     
     # Navigate to create new quotation
     page.goto("http://localhost:8069/web#model=sale.order&view_type=form")
@@ -146,7 +142,7 @@ def test_sale_order_with_discount(logged_in_page: Page):
     page.fill("input[name='product_uom_qty']", "3")
     page.fill("input[name='discount']", "10")
     
-    page.wait_for_load_state("networkidle")
+    rpc.wait_for_idle()
     
     # Save and verify
     page.click("button.o_form_button_save")
@@ -183,33 +179,29 @@ def test_sale_order_validation(logged_in_page: Page):
     print("✅ Form validation working correctly!")
 
 
-def test_cancel_sale_order(logged_in_page: Page):
+def test_cancel_sale_order(logged_in_page: Page, odoo_records):
     """Test canceling a draft sale order"""
     page = logged_in_page
     
-    # Create a simple quotation
-    page.goto("http://localhost:8069/web#model=sale.order&view_type=form")
-    page.click("button.o_list_button_add")
-    page.wait_for_selector(".o_form_view")
+    # Seed a simple quotation through the API instead of the form
+    order = odoo_records.create("sale.order", {
+        "partner_id": odoo_records.find("res.partner", "Azure Interior"),
+    })
     
-    # Select customer
-    page.click("div[name='partner_id'] input")
-    page.fill("div[name='partner_id'] input", "Azure Interior")
-    page.wait_for_selector(".ui-autocomplete")
-    page.click(".ui-autocomplete li:has-text('Azure Interior')")
-    
-    # Save
-    page.click("button.o_form_button_save")
-    page.wait_for_selector(".o_form_readonly")
+    # Open it directly
+    page.goto(order.url)
+    page.wait_for_selector(".o_form_view")
     
     # Cancel the order
-    page.click("button[name='action_cancel']")
+    rpc = OdooRPCTracker.for_page(page)
+    with rpc.expect_rpc(method="action_cancel"):
+        page.click("button[name='action_cancel']")
     
     # Confirm cancellation in dialog (if appears)
     if page.locator(".modal-footer button.btn-primary").is_visible():
         page.click(".modal-footer button.btn-primary")
     
-    page.wait_for_load_state("networkidle")
+    rpc.wait_for_idle()
     
     # Verify state is cancelled
     state_field = page.locator("span[name='state']")
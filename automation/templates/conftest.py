@@ -0,0 +1,5 @@
+"""
+Pytest configuration shared by the Odoo templates
+"""
+
+pytest_plugins = ["odoo_fixtures", "odoo_shard_plugin"]
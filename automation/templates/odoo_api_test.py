@@ -3,15 +3,152 @@ Odoo API Test Template - Python Requests
 This template provides patterns for testing Odoo REST/JSON-RPC APIs.
 """
 
+import gzip
+import itertools
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-import json
 import pytest
+from requests.adapters import HTTPAdapter
+
+from odoo_columnar import OdooColumns
+from odoo_field_cache import OdooFieldCache
+from odoo_metrics import OdooMetrics
+from odoo_record_cache import OdooRecordCache, READ_ONLY_METHODS
+from odoo_record_types import to_records
+from odoo_serializers import StreamedError, get_serializer, stream_result
+from odoo_session_store import OdooSessionStore
+from odoo_test_data import OdooDataTracker
+
+# Gateway errors worth retrying (proxy/worker restarts)
+RETRY_STATUS_CODES = {502, 503, 504}
+
+# How stock Odoo answers an array body: it calls .get() on the request
+# and replies with one error that belongs to no request id
+BATCH_REJECTED_ERRORS = {"builtins.AttributeError", "builtins.TypeError",
+                         "werkzeug.exceptions.BadRequest"}
+
+
+class OdooAPIError(Exception):
+    """Error payload returned by an Odoo JSON-RPC call"""
+    
+    def __init__(self, error):
+        super().__init__(f"API Error: {error}")
+        self.error = error
+
+
+class OdooBatchCall:
+    """Handle for a single call queued in an OdooBatch"""
+    
+    def __init__(self, model: str, method: str, args: list = None, kwargs: dict = None):
+        self.model = model
+        self.method = method
+        self.args = args or []
+        self.kwargs = kwargs or {}
+        self.done = False
+        self._result = None
+        self._error = None
+    
+    def _resolve(self, response: dict):
+        """Store the JSON-RPC response (or a transport exception) for this call"""
+        if isinstance(response, Exception):
+            self._error = response
+        elif response is None:
+            self._error = OdooAPIError("No response returned for this call")
+        elif "error" in response:
+            self._error = OdooAPIError(response["error"])
+        else:
+            self._result = response.get("result")
+        self.done = True
+    
+    def result(self):
+        """
+        Return the call result, raising the call's own error if it failed
+        
+        Returns:
+            API response result
+        """
+        if not self.done:
+            raise RuntimeError("Batch has not been sent yet")
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class OdooBatch:
+    """
+    Queue of model calls sent together in one JSON-RPC batch
+    
+    Usage:
+        with client.batch() as batch:
+            partners = batch.call("res.partner", "search_count", [[]])
+            orders = batch.call("sale.order", "search_count", [[]])
+        print(partners.result(), orders.result())
+    """
+    
+    def __init__(self, client: "OdooAPIClient"):
+        self.client = client
+        self.calls = []
+    
+    def call(self, model: str, method: str, args: list = None, kwargs: dict = None):
+        """Queue a model method call and return its OdooBatchCall handle"""
+        handle = OdooBatchCall(model, method, args, kwargs)
+        self.calls.append(handle)
+        return handle
+    
+    def send(self):
+        """Send every queued call and resolve their handles"""
+        calls, self.calls = self.calls, []
+        self.client._send_batch(calls)
+        return calls
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.send()
+        return False
+
+
+class OdooBulkResult:
+    """
+    Outcome of a chunked create_many/write_many/unlink_many call
+    
+    ids keeps the input order. For create_many, records from a failed chunk
+    are None. For write_many/unlink_many, only successfully processed IDs
+    are listed. errors holds one entry per failed chunk.
+    """
+    
+    def __init__(self):
+        self.ids = []
+        self.errors = []
+    
+    @property
+    def ok(self):
+        return not self.errors
+    
+    def _add_error(self, chunk: int, offset: int, size: int, error: Exception):
+        self.errors.append({"chunk": chunk, "offset": offset, "size": size, "error": error})
+    
+    def __repr__(self):
+        return f"<OdooBulkResult ids={len(self.ids)} errors={len(self.errors)}>"
 
 
 class OdooAPIClient:
     """Client for interacting with Odoo API"""
     
-    def __init__(self, url: str, db: str, username: str, password: str):
+    def __init__(self, url: str, db: str, username: str, password: str,
+                 pipeline_workers: int = 4, chunk_size: int = 500,
+                 cache: OdooRecordCache = None, pool_size: int = 10,
+                 timeout: tuple = (5, 60), max_retries: int = 3,
+                 backoff_factor: float = 0.5, backoff_max: float = 10.0,
+                 compress_requests: bool = False,
+                 session_store: OdooSessionStore = None,
+                 metrics: OdooMetrics = None, serializer=None,
+                 field_cache: OdooFieldCache = None):
         """
         Initialize Odoo API client
         
@@ -20,16 +157,89 @@ class OdooAPIClient:
             db: Database name
             username: Login username
             password: Login password
+            pipeline_workers: Parallel requests used when the server rejects
+                JSON-RPC batch arrays
+            chunk_size: Default records per request for bulk operations
+            cache: Optional OdooRecordCache for read()/search_read() results,
+                invalidated per model by any non-read call made through
+                this client
+            pool_size: Maximum keep-alive connections kept per host
+            timeout: (connect, read) timeouts in seconds
+            max_retries: Retries on connection errors and 502/503/504.
+                Only read-only methods are retried once a request may have
+                reached the server; connect timeouts are always retried.
+            backoff_factor: Base delay for jittered exponential backoff
+            backoff_max: Upper bound for a single backoff delay
+            compress_requests: Gzip request bodies over 1 KB. Only enable
+                when the server or proxy accepts gzip-encoded bodies;
+                gzip responses are always accepted.
+            session_store: Optional OdooSessionStore to reuse a session
+                saved by another test or xdist worker
+            metrics: Optional OdooMetrics recording latency, payload bytes
+                and errors of every request per (model, method)
+            serializer: JSON backend name ("orjson", "ujson", "json") or
+                object with dumps()/loads(); defaults to the fastest installed
+            field_cache: Optional OdooFieldCache used to reject unknown
+                fields locally, warn about expensive ones and choose the
+                default field list of read()/search_read()
         """
         self.url = url
         self.db = db
         self.username = username
         self.password = password
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.compress_requests = compress_requests
+        self.retry_count = 0
         self.uid = None
+        self.pipeline_workers = pipeline_workers
+        self.chunk_size = chunk_size
+        self.cache = cache
+        self.session_store = session_store
+        self.metrics = metrics
+        self.serializer = get_serializer(serializer)
+        self.field_cache = field_cache
+        # Set by OdooDataTracker.track() to record created IDs
+        self.tracker = None
+        # None until the first batch tells us whether the server accepts arrays
+        self.batch_supported = None
+        self._request_ids = itertools.count(1)
+        
+    def authenticate(self, force: bool = False):
+        """
+        Authenticate and get user ID
+        
+        With a session_store, a stored session for (url, db, username) is
+        reused instead of logging in again, unless force is True.
+        """
+        if self.session_store is None:
+            return self._login()
         
-    def authenticate(self):
-        """Authenticate and get user ID"""
+        key = (self.url, self.db, self.username)
+        with self.session_store.lock(*key):
+            entry = None if force else self.session_store.load(*key)
+            if entry:
+                self.session.cookies.set("session_id", entry["session_id"])
+                self.uid = entry["uid"]
+                return True
+            
+            # Drop the stale cookie so the fresh one is the only session_id
+            self.session.cookies.clear()
+            if not self._login():
+                self.session_store.clear(*key)
+                return False
+            self.session_store.save(*key, self.session.cookies.get("session_id"), self.uid)
+            return True
+    
+    def _login(self):
         endpoint = f"{self.url}/web/session/authenticate"
         
         payload = {
@@ -41,14 +251,48 @@ class OdooAPIClient:
             }
         }
         
-        response = self.session.post(endpoint, json=payload)
-        result = response.json()
+        result = self._post(endpoint, payload, idempotent=True)
         
         if "result" in result and result["result"].get("uid"):
             self.uid = result["result"]["uid"]
             return True
         return False
     
+    @staticmethod
+    def _session_expired(error) -> bool:
+        if not isinstance(error, dict):
+            return False
+        data = error.get("data") or {}
+        return error.get("code") == 100 or data.get("name") == "odoo.http.SessionExpiredException"
+    
+    def _resend_expired(self, payloads: list, responses: list, send) -> list:
+        """
+        Log in again once and re-send the payloads whose session expired
+        
+        A stored session may have expired server-side. Only the calls that
+        failed for that reason are sent again, so calls that already ran
+        (creates, writes) are not repeated.
+        
+        Args:
+            payloads: JSON-RPC payloads that were sent
+            responses: Their responses, in the same order
+            send: Callable(payloads) -> responses in the same order
+            
+        Returns:
+            responses, with the re-sent payloads' new responses in place
+        """
+        expired = [
+            n for n, response in enumerate(responses)
+            if isinstance(response, dict) and self._session_expired(response.get("error"))
+        ]
+        if not expired or not self.authenticate(force=True):
+            return responses
+        
+        responses = list(responses)
+        for n, response in zip(expired, send([payloads[n] for n in expired])):
+            responses[n] = response
+        return responses
+    
     def call(self, model: str, method: str, args: list = None, kwargs: dict = None):
         """
         Call Odoo model method via JSON-RPC
@@ -62,12 +306,142 @@ class OdooAPIClient:
         Returns:
             API response result
         """
-        if not self.uid:
-            raise Exception("Not authenticated. Call authenticate() first.")
+        self._require_auth()
         
+        if self.cache is not None:
+            self.cache.invalidate_for_call(model, method)
+        
+        payload = self._build_call_payload(model, method, args, kwargs)
         endpoint = f"{self.url}/web/dataset/call_kw"
         
-        payload = {
+        def send(payloads):
+            return [self._post(endpoint, p, idempotent=method in READ_ONLY_METHODS)
+                    for p in payloads]
+        
+        result = self._resend_expired([payload], send([payload]), send)[0]
+        
+        if "error" in result:
+            raise OdooAPIError(result["error"])
+        
+        if self.tracker is not None:
+            self.tracker.observe(model, method, args or [], result.get("result"))
+        
+        return result.get("result")
+    
+    def stream(self, model: str, method: str, args: list = None, kwargs: dict = None):
+        """
+        Call a method returning a list and yield its items as they are parsed
+        
+        The body is parsed from the socket with ijson instead of being read
+        whole and then decoded, so a read of thousands of records never
+        holds the raw body and all decoded records at once. Results are not
+        cached. The request is sent with _post's retries and compression,
+        and an expired session is renewed once before any item is yielded.
+        
+        Args:
+            model: Odoo model name
+            method: Method returning a list (e.g. 'read', 'search_read')
+            args: Positional arguments
+            kwargs: Keyword arguments
+            
+        Yields:
+            Items of the result list
+        """
+        self._require_auth()
+        
+        if self.cache is not None:
+            self.cache.invalidate_for_call(model, method)
+        
+        payload = self._build_call_payload(model, method, args, kwargs)
+        endpoint = f"{self.url}/web/dataset/call_kw"
+        data, headers = self._encode(payload)
+        idempotent = method in READ_ONLY_METHODS
+        
+        for attempt in range(2):
+            start = time.perf_counter()
+            error = None
+            with self._send(endpoint, payload, data, headers, idempotent, start,
+                            stream=True) as response:
+                if response.status_code != 200:
+                    self._record_metrics(endpoint, payload, start, len(data),
+                                         len(response.content), None)
+                    raise OdooAPIError(self._http_error(response))
+                # Let urllib3 undo gzip while ijson reads the raw stream
+                response.raw.decode_content = True
+                try:
+                    yield from stream_result(response.raw)
+                except StreamedError as e:
+                    error = e.error
+                except ValueError as e:
+                    error = {"code": response.status_code, "message": str(e)}
+                finally:
+                    self._record_metrics(endpoint, payload, start, len(data),
+                                         response.raw.tell(),
+                                         {"error": error} if error else {"result": None})
+            
+            if error is None:
+                return
+            # Nothing was yielded yet, so an expired session can be renewed
+            if attempt == 0 and self._session_expired(error) and self.authenticate(force=True):
+                continue
+            raise OdooAPIError(error)
+    
+    @staticmethod
+    def _http_error(response) -> dict:
+        """The JSON-RPC error in a non-200 response, or one built from the status"""
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        if isinstance(body, dict) and isinstance(body.get("error"), dict):
+            return body["error"]
+        return {"code": response.status_code,
+                "message": f"HTTP {response.status_code} {response.reason}",
+                "data": {"body": response.text[:500]}}
+    
+    def batch(self):
+        """
+        Start a batch of calls sent as one JSON-RPC 2.0 array
+        
+        Returns:
+            OdooBatch, usable as a context manager that sends on exit
+        """
+        return OdooBatch(self)
+    
+    def call_many(self, calls: list, raise_on_error: bool = True):
+        """
+        Call several model methods in a single round trip
+        
+        Args:
+            calls: List of (model, method[, args[, kwargs]]) tuples
+            raise_on_error: Raise the first error instead of returning it
+                in place of the failed call's result
+            
+        Returns:
+            List of results in the same order as calls
+        """
+        batch = self.batch()
+        for call in calls:
+            batch.call(*call)
+        
+        results = []
+        for handle in batch.send():
+            try:
+                results.append(handle.result())
+            except Exception as e:
+                if raise_on_error:
+                    raise
+                results.append(e)
+        return results
+    
+    def _require_auth(self):
+        if not self.uid:
+            raise Exception("Not authenticated. Call authenticate() first.")
+    
+    def _build_call_payload(self, model: str, method: str, args: list = None,
+                            kwargs: dict = None):
+        """Build a call_kw JSON-RPC payload with a unique request id"""
+        return {
             "jsonrpc": "2.0",
             "method": "call",
             "params": {
@@ -76,18 +450,196 @@ class OdooAPIClient:
                 "args": args or [],
                 "kwargs": kwargs or {}
             },
-            "id": 1
+            "id": next(self._request_ids)
+        }
+    
+    def _post(self, endpoint: str, payload, idempotent: bool = False):
+        """
+        POST a JSON-RPC payload and return the decoded response
+        
+        Connect timeouts are retried for every request because nothing
+        reached the server. Other connection errors, read timeouts and
+        gateway errors are only retried when idempotent is True.
+        """
+        data, headers = self._encode(payload)
+        start = time.perf_counter()
+        response = self._send(endpoint, payload, data, headers, idempotent, start)
+        try:
+            result = self.serializer.loads(response.content)
+        except ValueError:
+            self._record_metrics(endpoint, payload, start, len(data),
+                                 len(response.content), None)
+            raise
+        self._record_metrics(endpoint, payload, start, len(data),
+                             len(response.content), result)
+        return result
+    
+    def _encode(self, payload):
+        """Serialize payload, gzipped when compress_requests applies"""
+        data = self.serializer.dumps(payload)
+        headers = {"Content-Type": "application/json"}
+        if self.compress_requests and len(data) > 1024:
+            data = gzip.compress(data)
+            headers["Content-Encoding"] = "gzip"
+        return data, headers
+    
+    def _send(self, endpoint: str, payload, data: bytes, headers: dict, idempotent: bool,
+              start: float, stream: bool = False):
+        """POST encoded data with _post's retry policy and return the response"""
+        attempt = 0
+        while True:
+            try:
+                response = self.session.post(endpoint, data=data, headers=headers,
+                                             timeout=self.timeout, stream=stream)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                safe = idempotent or isinstance(e, requests.ConnectTimeout)
+                if not safe or attempt >= self.max_retries:
+                    self._record_metrics(endpoint, payload, start, len(data), 0, None)
+                    raise
+            else:
+                if (response.status_code not in RETRY_STATUS_CODES
+                        or not idempotent or attempt >= self.max_retries):
+                    return response
+                response.close()
+            
+            self._backoff(attempt)
+            attempt += 1
+    
+    def _record_metrics(self, endpoint: str, payload, start: float, sent: int,
+                        received: int, result):
+        """Record one request (retries included) in self.metrics, if set"""
+        if self.metrics is None:
+            return
+        if isinstance(payload, list):
+            model, method = "batch", "call_kw"
+        elif "model" in payload.get("params", {}):
+            model, method = payload["params"]["model"], payload["params"]["method"]
+        else:
+            model, method = "session", endpoint.rsplit("/", 1)[-1]
+        responses = result if isinstance(result, list) else [result]
+        error = any(not isinstance(r, dict) or "error" in r for r in responses)
+        self.metrics.record(model, method, time.perf_counter() - start, sent, received, error)
+    
+    def _backoff(self, attempt: int):
+        """Sleep for a full-jitter exponential backoff delay"""
+        self.retry_count += 1
+        delay = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        time.sleep(random.uniform(0, delay))
+    
+    def connection_stats(self):
+        """
+        Report connection reuse across the session's pools
+        
+        Returns:
+            Dictionary with requests sent, connections opened, connections
+            reused and retries performed
+        """
+        opened = sent = 0
+        for adapter in set(self.session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    opened += pool.num_connections
+                    sent += pool.num_requests
+        return {
+            "requests": sent,
+            "connections_opened": opened,
+            "connections_reused": max(0, sent - opened),
+            "retries": self.retry_count,
         }
+    
+    def _send_batch(self, calls: list):
+        """Send queued calls as one batch, or pipeline them if batches are rejected"""
+        if not calls:
+            return
+        self._require_auth()
         
-        response = self.session.post(endpoint, json=payload)
-        result = response.json()
+        if self.cache is not None:
+            for call in calls:
+                self.cache.invalidate_for_call(call.model, call.method)
         
-        if "error" in result:
-            raise Exception(f"API Error: {result['error']}")
+        endpoint = f"{self.url}/web/dataset/call_kw"
+        payloads = [
+            self._build_call_payload(c.model, c.method, c.args, c.kwargs)
+            for c in calls
+        ]
         
-        return result.get("result")
+        def send(payloads):
+            responses = None
+            if self.batch_supported is not False:
+                responses = self._post_batch(endpoint, payloads)
+            if responses is None:
+                responses = self._pipeline(endpoint, payloads)
+            return responses
+        
+        responses = self._resend_expired(payloads, send(payloads), send)
+        
+        for call, response in zip(calls, responses):
+            call._resolve(response)
+        
+        if self.tracker is not None:
+            for call in calls:
+                if call._error is None:
+                    self.tracker.observe(call.model, call.method, call.args, call._result)
+    
+    def _post_batch(self, endpoint: str, payloads: list):
+        """
+        Send a batch array
+        
+        Sets batch_supported from the reply. An error for the whole request
+        (access, expired session...) is repeated for every payload; it says
+        nothing about batch support.
+        
+        Returns:
+            One response per payload, in order, or None when the server
+            rejects array bodies
+        """
+        idempotent = all(p["params"]["method"] in READ_ONLY_METHODS for p in payloads)
+        try:
+            responses = self._post(endpoint, payloads, idempotent=idempotent)
+        except ValueError:
+            responses = None
+        if responses is None or self._batch_rejected(responses):
+            self.batch_supported = False
+            return None
+        if not isinstance(responses, list):
+            return [responses] * len(payloads)
+        
+        self.batch_supported = True
+        by_id = {r.get("id"): r for r in responses if isinstance(r, dict)}
+        return [by_id.get(payload["id"]) for payload in payloads]
+    
+    @staticmethod
+    def _batch_rejected(response) -> bool:
+        """Whether response is the server refusing array bodies altogether"""
+        if not isinstance(response, dict) or response.get("id") is not None:
+            return False
+        error = response.get("error")
+        if not isinstance(error, dict):
+            return False
+        return (error.get("data") or {}).get("name") in BATCH_REJECTED_ERRORS
     
-    def search(self, model: str, domain: list, fields: list = None, limit: int = None):
+    def _pipeline(self, endpoint: str, payloads: list) -> list:
+        """
+        Fallback: send payloads concurrently over the shared keep-alive session
+        
+        Returns:
+            One response (or transport exception) per payload, in order
+        """
+        def send(payload):
+            try:
+                return self._post(endpoint, payload,
+                                  idempotent=payload["params"]["method"] in READ_ONLY_METHODS)
+            except Exception as e:
+                return e
+        
+        workers = max(1, min(self.pipeline_workers, len(payloads)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(send, payloads))
+    
+    def search(self, model: str, domain: list, fields: list = None, limit: int = None,
+               offset: int = 0, order: str = None, columnar: bool = False):
         """
         Search records in Odoo model
         
@@ -96,24 +648,187 @@ class OdooAPIClient:
             domain: Search domain (e.g., [['state', '=', 'draft']])
             fields: Fields to retrieve
             limit: Maximum number of records
+            offset: Number of records to skip
+            order: Sort specification (e.g., 'name asc, id desc')
+            columnar: Return OdooColumns (NumPy arrays) instead of dicts;
+                only used together with fields
             
         Returns:
-            List of records
+            List of records, or list of IDs when no fields are given
         """
+        if fields:
+            return self.search_read(model, domain, fields, offset=offset,
+                                    limit=limit, order=order, columnar=columnar)
+        
         kwargs = {}
+        if offset:
+            kwargs["offset"] = offset
+        if limit:
+            kwargs["limit"] = limit
+        if order:
+            kwargs["order"] = order
+        
+        return self.call(model, "search", args=[domain], kwargs=kwargs)
+    
+    def search_read(self, model: str, domain: list, fields: list = None,
+                    offset: int = 0, limit: int = None, order: str = None,
+                    use_cache: bool = True, columnar: bool = False):
+        """
+        Search and read records in a single round trip
+        
+        Args:
+            model: Odoo model name
+            domain: Search domain
+            fields: Fields to retrieve (all fields if omitted)
+            offset: Number of records to skip
+            limit: Maximum number of records
+            order: Sort specification
+            use_cache: Serve/store the result through self.cache if set
+            columnar: Return OdooColumns (one NumPy array per field)
+            
+        Returns:
+            List of record dictionaries, or OdooColumns
+        """
+        fields = self._prepare_fields(model, fields)
+        if columnar:
+            records = self.search_read(model, domain, fields, offset, limit, order, use_cache)
+            return OdooColumns.from_records(records, fields, self._field_types(model, fields))
+        
+        kwargs = {"domain": domain}
         if fields:
             kwargs["fields"] = fields
+        if offset:
+            kwargs["offset"] = offset
         if limit:
             kwargs["limit"] = limit
+        if order:
+            kwargs["order"] = order
+        
+        if self.cache is None or not use_cache:
+            return self.call(model, "search_read", kwargs=kwargs)
+        
+        query = {"domain": domain, "offset": offset, "limit": limit, "order": order}
+        key = OdooRecordCache.make_key(model, query, fields)
+        return self.cache.get_or_fetch(
+            key, lambda: self.call(model, "search_read", kwargs=kwargs)
+        )
+    
+    def read(self, model: str, record_ids: list, fields: list = None, context: dict = None,
+             columnar: bool = False):
+        """
+        Read records by ID, served from self.cache when possible
+        
+        Args:
+            model: Odoo model name
+            record_ids: IDs of records to read
+            fields: Fields to retrieve (all fields if omitted)
+            context: Optional context passed to the server
+            columnar: Return OdooColumns (one NumPy array per field)
+            
+        Returns:
+            List of record dictionaries, or OdooColumns
+        """
+        fields = self._prepare_fields(model, fields)
+        if columnar:
+            return OdooColumns.from_records(self.read(model, record_ids, fields, context), fields,
+                                            self._field_types(model, fields))
+        
+        kwargs = {}
+        if fields:
+            kwargs["fields"] = fields
+        if context:
+            kwargs["context"] = context
+        
+        def fetch():
+            return self.call(model, "read", args=[list(record_ids)], kwargs=kwargs)
+        
+        if self.cache is None:
+            return fetch()
+        
+        key = OdooRecordCache.make_key(model, list(record_ids), fields, context)
+        return self.cache.get_or_fetch(key, fetch)
+    
+    def iter_read(self, model: str, record_ids: list, fields: list = None,
+                  context: dict = None, typed: bool = False):
+        """
+        Read records in one request, yielding each as soon as it is parsed
+        
+        Prefer this over read() for thousands of records (see stream()).
+        With typed=True records are compact __slots__ objects (see
+        iter_search).
+        
+        Yields:
+            Record dictionaries, or typed records
+        """
+        fields = self._prepare_fields(model, fields)
+        kwargs = {}
+        if fields:
+            kwargs["fields"] = fields
+        if context:
+            kwargs["context"] = context
+        records = self.stream(model, "read", args=[list(record_ids)], kwargs=kwargs)
+        yield from to_records(model, records, fields) if typed else records
+    
+    def _prepare_fields(self, model: str, fields: list = None):
+        """Check fields against self.field_cache, or pick its default list"""
+        if self.field_cache is None:
+            return fields
+        return self.field_cache.prepare(self, model, fields)
+    
+    def _field_types(self, model: str, fields: list = None) -> dict:
+        """Odoo type per field, from self.field_cache or one fields_get call"""
+        if self.field_cache is not None:
+            definitions = self.field_cache.get(self, model)
+        else:
+            definitions = self.call(model, "fields_get", args=[fields or []],
+                                    kwargs={"attributes": ["type"]})
+        return {name: definition.get("type") for name, definition in definitions.items()}
+    
+    def iter_search(self, model: str, domain: list, fields: list = None,
+                    page_size: int = 1000, order: str = None, typed: bool = False):
+        """
+        Lazily stream matching records, fetching one page per request
+        
+        Without an explicit order, pages are fetched by id ("id > last seen"),
+        which stays fast on large tables. With an order, offset paging is used.
         
-        # First search for IDs
-        ids = self.call(model, "search", args=[domain], kwargs=kwargs)
+        Args:
+            model: Odoo model name
+            domain: Search domain
+            fields: Fields to retrieve
+            page_size: Records fetched per request
+            order: Sort specification
+            typed: Yield compact __slots__ records (attribute or ["field"]
+                access) generated once per (model, fields) instead of dicts,
+                for exports that keep many rows in memory
+            
+        Yields:
+            Record dictionaries, or typed records
+        """
+        if typed:
+            records = self.iter_search(model, domain, fields, page_size, order)
+            yield from to_records(model, records, fields)
+            return
         
-        # Then read the records
-        if ids and fields:
-            return self.call(model, "read", args=[ids], kwargs={"fields": fields})
+        if order is None:
+            last_id = 0
+            while True:
+                page = self.search_read(model, list(domain) + [["id", ">", last_id]],
+                                        fields, limit=page_size, order="id",
+                                        use_cache=False)
+                yield from page
+                if len(page) < page_size:
+                    return
+                last_id = page[-1]["id"]
         
-        return ids
+        offset = 0
+        while True:
+            page = self.search_read(model, domain, fields, offset=offset,
+                                    limit=page_size, order=order, use_cache=False)
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
     
     def create(self, model: str, values: dict):
         """
@@ -154,22 +869,109 @@ class OdooAPIClient:
             True if successful
         """
         return self.call(model, "unlink", args=[[record_id]])
+    
+    def create_many(self, model: str, values_list: list, chunk_size: int = None):
+        """
+        Create many records, sending one multi-record create per chunk
+        
+        Args:
+            model: Odoo model name
+            values_list: List of field value dictionaries
+            chunk_size: Records per request (defaults to self.chunk_size)
+            
+        Returns:
+            OdooBulkResult with created IDs in input order
+        """
+        result = OdooBulkResult()
+        for n, offset, chunk in self._chunks(values_list, chunk_size):
+            try:
+                ids = self.call(model, "create", args=[chunk])
+            except Exception as e:
+                result._add_error(n, offset, len(chunk), e)
+                ids = [None] * len(chunk)
+            result.ids.extend(ids)
+        return result
+    
+    def write_many(self, model: str, record_ids: list, values: dict, chunk_size: int = None):
+        """
+        Apply the same values to many records, one write per chunk
+        
+        Args:
+            model: Odoo model name
+            record_ids: IDs of records to update
+            values: Dictionary of field values to update
+            chunk_size: Records per request (defaults to self.chunk_size)
+            
+        Returns:
+            OdooBulkResult listing the IDs that were updated
+        """
+        result = OdooBulkResult()
+        for n, offset, chunk in self._chunks(record_ids, chunk_size):
+            try:
+                self.call(model, "write", args=[chunk, values])
+            except Exception as e:
+                result._add_error(n, offset, len(chunk), e)
+            else:
+                result.ids.extend(chunk)
+        return result
+    
+    def unlink_many(self, model: str, record_ids: list, chunk_size: int = None):
+        """
+        Delete many records, one unlink per chunk
+        
+        Args:
+            model: Odoo model name
+            record_ids: IDs of records to delete
+            chunk_size: Records per request (defaults to self.chunk_size)
+            
+        Returns:
+            OdooBulkResult listing the IDs that were deleted
+        """
+        result = OdooBulkResult()
+        for n, offset, chunk in self._chunks(record_ids, chunk_size):
+            try:
+                self.call(model, "unlink", args=[chunk])
+            except Exception as e:
+                result._add_error(n, offset, len(chunk), e)
+            else:
+                result.ids.extend(chunk)
+        return result
+    
+    def _chunks(self, items: list, chunk_size: int = None):
+        """Yield (chunk number, offset, chunk) slices of items"""
+        size = chunk_size or self.chunk_size
+        items = list(items)
+        for n, offset in enumerate(range(0, len(items), size)):
+            yield n, offset, items[offset:offset + size]
 
 
 # Pytest fixtures
 @pytest.fixture(scope="session")
-def odoo_client():
+def odoo_client(odoo_metrics):
     """Fixture to provide authenticated Odoo API client"""
     client = OdooAPIClient(
         url="http://localhost:8069",
         db="your_database",
         username="admin",
-        password="admin"
+        password="admin",
+        # Reuse one login across tests and xdist workers
+        session_store=OdooSessionStore(),
+        # Timings show up in the session summary and --odoo-metrics-json
+        metrics=odoo_metrics,
+        # Typos in field lists fail before a request is sent
+        field_cache=OdooFieldCache()
     )
     client.authenticate()
     return client
 
 
+@pytest.fixture
+def isolated_client(odoo_client):
+    """odoo_client that deletes every record the test created, in bulk"""
+    with OdooDataTracker().track(odoo_client):
+        yield odoo_client
+
+
 # Test examples
 def test_authentication():
     """Test Odoo authentication"""
@@ -212,11 +1014,254 @@ def test_search_partners(odoo_client):
         assert "name" in partners[0]
 
 
-def test_create_sale_order(odoo_client):
+def test_iter_search_partners(odoo_client):
+    """Test streaming partners page by page"""
+    seen = 0
+    last_id = 0
+    for partner in odoo_client.iter_search(
+        model="res.partner",
+        domain=[],
+        fields=["name"],
+        page_size=50
+    ):
+        assert partner["id"] > last_id
+        last_id = partner["id"]
+        seen += 1
+    
+    assert seen == odoo_client.call("res.partner", "search_count", [[]])
+
+
+def test_typed_iter_search(odoo_client):
+    """Test exporting partners as compact typed records"""
+    fields = ["name", "email"]
+    dicts = list(odoo_client.iter_search("res.partner", [], fields, page_size=50))
+    records = list(odoo_client.iter_search("res.partner", [], fields, page_size=50, typed=True))
+    
+    assert records == dicts
+    if records:
+        partner = records[0]
+        assert partner.name == partner["name"] == dicts[0]["name"]
+        assert not hasattr(partner, "__dict__")
+
+
+def test_typed_records_without_fields():
+    """Test that typed reads without a field list skip non-attribute keys"""
+    from odoo_stub_server import OdooStubServer
+    
+    # Odoo 16 and older add __last_update to every plain read
+    records = list(to_records("res.partner", [{"id": 1, "__last_update": "x", "name": "a"}]))
+    assert records[0]._fields == ("id", "name")
+    assert records[0].name == "a"
+    
+    with OdooStubServer().load_fixtures(partners=5) as server:
+        client = OdooAPIClient(server.url, "stub", "admin", "admin")
+        client.authenticate()
+        ids = client.search("res.partner", [])
+        
+        typed = list(client.iter_read("res.partner", ids, typed=True))
+        
+        assert typed == client.read("res.partner", ids)
+
+
+def test_cached_reference_reads():
+    """Test that repeated reads are served from the record cache"""
+    cache = OdooRecordCache(max_size=256, ttl=60)
+    client = OdooAPIClient(
+        url="http://localhost:8069",
+        db="your_database",
+        username="admin",
+        password="admin",
+        cache=cache
+    )
+    client.authenticate()
+    
+    first = client.search_read("res.partner", [["is_company", "=", True]], ["name"], limit=5)
+    second = client.search_read("res.partner", [["is_company", "=", True]], ["name"], limit=5)
+    
+    assert first == second
+    assert cache.stats()["hits"] == 1
+    
+    # A write through the same client invalidates the model
+    if first:
+        client.write("res.partner", first[0]["id"], {"comment": "cache test"})
+        client.search_read("res.partner", [["is_company", "=", True]], ["name"], limit=5)
+        assert cache.stats()["misses"] == 2
+
+
+def test_columnar_order_totals(odoo_client):
+    """Test vectorized totals over order lines in columnar mode"""
+    fields = ["order_id", "product_uom_qty", "price_subtotal"]
+    records = odoo_client.search_read("sale.order.line", [], fields, limit=5000)
+    lines = odoo_client.search_read("sale.order.line", [], fields, limit=5000, columnar=True)
+    
+    assert len(lines) == len(records)
+    assert lines["price_subtotal"].sum() == pytest.approx(sum(r["price_subtotal"] for r in records))
+    
+    # Per-order totals without a Python loop over rows
+    totals = lines.group_sum("order_id", "price_subtotal")
+    for record in records[:10]:
+        order_id = record["order_id"][0]
+        expected = sum(r["price_subtotal"] for r in records if r["order_id"][0] == order_id)
+        assert totals[order_id] == pytest.approx(expected)
+
+
+def test_columnar_dtypes_follow_field_types():
+    """Test that a page of empty numeric values keeps its numeric dtype"""
+    import numpy as np
+    from odoo_stub_server import OdooStubServer
+    
+    with OdooStubServer().load_fixtures(orders=5) as server:
+        client = OdooAPIClient(server.url, "stub", "admin", "admin")
+        client.authenticate()
+        ids = client.search("sale.order.line", [], order="id")
+        client.write_many("sale.order.line", ids[:5], {"price_subtotal": False})
+        
+        empty = client.read("sale.order.line", ids[:5], ["price_subtotal"], columnar=True)
+        full = client.read("sale.order.line", ids[5:], ["price_subtotal"], columnar=True)
+    
+    assert empty["price_subtotal"].dtype == full["price_subtotal"].dtype == np.float64
+    assert np.isnan(empty["price_subtotal"]).all()
+    # Without types an all-False column can only be guessed
+    guessed = OdooColumns.from_records([{"id": 1, "amount": False}])
+    assert guessed["amount"].dtype == bool
+    typed = OdooColumns.from_records([{"id": 1, "amount": False}], types={"amount": "monetary"})
+    assert typed["amount"].dtype == np.float64
+
+
+def test_streamed_read(odoo_client):
+    """Test that iter_read yields the same records as read"""
+    ids = odoo_client.search("res.partner", [], limit=200)
+    
+    streamed = odoo_client.iter_read("res.partner", ids, ["name", "email"])
+    
+    assert list(streamed) == odoo_client.read("res.partner", ids, ["name", "email"])
+
+
+def test_streamed_read_errors():
+    """Test that streamed calls renew expired sessions and raise OdooAPIError"""
+    from odoo_stub_server import OdooStubServer
+    
+    with OdooStubServer().load_fixtures(partners=10) as server:
+        client = OdooAPIClient(server.url, "stub", "admin", "admin")
+        client.authenticate()
+        server.expire_sessions()
+        
+        assert len(list(client.stream("res.partner", "search_read", [[]]))) == 10
+        with pytest.raises(OdooAPIError):
+            list(client.stream("res.partner", "no_such_method"))
+        # A method whose result is not a list
+        with pytest.raises(OdooAPIError, match="Expected a result array"):
+            list(client.stream("res.partner", "search_count", [[]]))
+
+
+def test_unknown_field_rejected_locally(odoo_client):
+    """Test that a misspelled field fails without a server round trip"""
+    from odoo_field_cache import OdooFieldError
+    
+    odoo_client.field_cache.get(odoo_client, "res.partner")
+    calls = odoo_client.metrics.histogram("res.partner", "search_read").count
+    
+    with pytest.raises(OdooFieldError, match="did you mean 'email'"):
+        odoo_client.search("res.partner", [], fields=["name", "emial"], limit=1)
+    
+    assert odoo_client.metrics.histogram("res.partner", "search_read").count == calls
+    assert "name" in odoo_client.field_cache.minimal_fields(odoo_client, "res.partner")
+
+
+def test_field_cache_without_module_access(tmp_path):
+    """Test that users who cannot read ir.module.module skip field checks"""
+    from odoo_field_cache import OdooFieldWarning
+    from odoo_stub_server import OdooStubServer
+    
+    with OdooStubServer(denied_models={"ir.module.module"}).load_fixtures(partners=5) as server:
+        client = OdooAPIClient(server.url, "stub", "admin", "admin",
+                               field_cache=OdooFieldCache(tmp_path))
+        client.authenticate()
+        
+        with pytest.warns(OdooFieldWarning, match="cannot read ir.module.module"):
+            partners = client.search_read("res.partner", [], ["name", "emial"])
+        
+        assert len(partners) == 5
+        assert not list(tmp_path.iterdir())
+
+
+def test_connection_reuse(odoo_client):
+    """Test that repeated calls reuse pooled keep-alive connections"""
+    for _ in range(5):
+        odoo_client.call("res.partner", "search_count", [[]])
+    
+    stats = odoo_client.connection_stats()
+    assert stats["connections_reused"] >= 5
+    assert stats["connections_opened"] <= odoo_client.pool_size
+
+
+def test_call_metrics(odoo_client):
+    """Test that every call is timed per (model, method)"""
+    histogram = odoo_client.metrics.histogram("res.partner", "search_count")
+    before = histogram.count
+    
+    odoo_client.call("res.partner", "search_count", [[]])
+    
+    histogram = odoo_client.metrics.histogram("res.partner", "search_count")
+    assert histogram.count == before + 1
+    assert 0 < histogram.percentile(50) <= histogram.percentile(99)
+    
+    row = next(r for r in odoo_client.metrics.summary()
+               if (r["model"], r["method"]) == ("res.partner", "search_count"))
+    assert row["request_bytes"] > 0 and row["response_bytes"] > 0
+
+
+def test_batch_calls(odoo_client):
+    """Test sending several calls in one JSON-RPC batch"""
+    partner_count, order_count = odoo_client.call_many([
+        ("res.partner", "search_count", [[]]),
+        ("sale.order", "search_count", [[]]),
+    ])
+    
+    assert partner_count >= 0
+    assert order_count >= 0
+    
+    # Errors are routed back to the call that caused them
+    with odoo_client.batch() as batch:
+        ok = batch.call("res.partner", "search_count", [[]])
+        bad = batch.call("res.partner", "no_such_method")
+    
+    assert ok.result() == partner_count
+    with pytest.raises(OdooAPIError):
+        bad.result()
+
+
+@pytest.mark.parametrize("accept_batch", [True, False], ids=["batched", "pipelined"])
+def test_batch_after_session_expired(accept_batch):
+    """Test that batches log in again when the stored session has expired"""
+    from odoo_stub_server import OdooStubServer
+    
+    with OdooStubServer(accept_batch=accept_batch).load_fixtures(partners=10) as server:
+        client = OdooAPIClient(server.url, "stub", "admin", "admin")
+        client.authenticate()
+        tracker = OdooDataTracker()
+        with tracker.track(client):
+            client.create("res.partner", {"name": "Expiring session"})
+            server.expire_sessions()
+            
+            counts = client.call_many([
+                ("res.partner", "search_count", [[]]),
+                ("sale.order", "search_count", [[]]),
+            ])
+            assert counts == [11, 200]
+            assert client.batch_supported is accept_batch
+            
+            server.expire_sessions()
+        
+        # Cleanup goes through the same path and must not leak the record
+        assert client.call("res.partner", "search_count", [[]]) == 10
+
+
+def test_create_sale_order(isolated_client):
     """Test creating a sale order via API"""
     
     # First, get a partner
-    partners = odoo_client.search(
+    partners = isolated_client.search(
         model="res.partner",
         domain=[["is_company", "=", True]],
         limit=1
@@ -229,13 +1274,13 @@ def test_create_sale_order(odoo_client):
         "date_order": "2025-11-06",
     }
     
-    order_id = odoo_client.create("sale.order", order_data)
+    order_id = isolated_client.create("sale.order", order_data)
     
     assert isinstance(order_id, int)
     assert order_id > 0
     
     # Verify creation
-    order = odoo_client.search(
+    order = isolated_client.search(
         model="sale.order",
         domain=[["id", "=", order_id]],
         fields=["name", "state", "partner_id"]
@@ -244,11 +1289,34 @@ def test_create_sale_order(odoo_client):
     assert len(order) == 1
     assert order[0]["state"] == "draft"
     
+    # No manual cleanup: isolated_client removes the order even if an assert fails
+
+
+def test_bulk_create_and_unlink(odoo_client):
+    """Test creating and deleting records in chunks"""
+    values = [{"name": f"Bulk Partner {i}"} for i in range(25)]
+    
+    created = odoo_client.create_many("res.partner", values, chunk_size=10)
+    
+    assert created.ok, created.errors
+    assert len(created.ids) == 25
+    
+    # IDs come back in input order
+    partners = odoo_client.search_read(
+        "res.partner", [["id", "in", created.ids]], ["name"], order="id"
+    )
+    names = {p["id"]: p["name"] for p in partners}
+    assert [names[i] for i in created.ids] == [v["name"] for v in values]
+    
+    updated = odoo_client.write_many("res.partner", created.ids, {"city": "Bulk City"})
+    assert updated.ids == created.ids
+    
     # Cleanup
-    odoo_client.unlink("sale.order", order_id)
+    deleted = odoo_client.unlink_many("res.partner", created.ids, chunk_size=10)
+    assert deleted.ok
 
 
-def test_update_record(odoo_client):
+def test_update_record(isolated_client):
     """Test updating a record via API"""
     
     # Create a partner
@@ -257,7 +1325,7 @@ def test_update_record(odoo_client):
         "email": "test@example.com"
     }
     
-    partner_id = odoo_client.create("res.partner", partner_data)
+    partner_id = isolated_client.create("res.partner", partner_data)
     
     # Update the partner
     update_data = {
@@ -265,11 +1333,11 @@ def test_update_record(odoo_client):
         "city": "Test City"
     }
     
-    result = odoo_client.write("res.partner", partner_id, update_data)
+    result = isolated_client.write("res.partner", partner_id, update_data)
     assert result is True
     
     # Verify update
-    partner = odoo_client.search(
+    partner = isolated_client.search(
         model="res.partner",
         domain=[["id", "=", partner_id]],
         fields=["phone", "city"]
@@ -278,31 +1346,52 @@ def test_update_record(odoo_client):
     assert partner[0]["phone"] == "+1234567890"
     assert partner[0]["city"] == "Test City"
     
-    # Cleanup
-    odoo_client.unlink("res.partner", partner_id)
+    # No manual cleanup: isolated_client removes the partner after the test
 
 
-def test_custom_endpoint():
-    """Test custom REST endpoint"""
+@pytest.mark.slow
+def test_load_profile_on_stub_server():
+    """Test a short closed-loop load run against the local stub server"""
+    from odoo_load_generator import DEFAULT_SCENARIOS, OdooLoadTest
+    from odoo_stub_server import OdooStubServer
     
-    # Authenticate first
-    session = requests.Session()
-    auth_response = session.post(
-        "http://localhost:8069/web/session/authenticate",
-        json={
-            "jsonrpc": "2.0",
-            "params": {
-                "db": "your_database",
-                "login": "admin",
-                "password": "admin"
-            }
-        }
-    )
+    with OdooStubServer(latency=0.002).load_fixtures() as server:
+        load = OdooLoadTest(
+            DEFAULT_SCENARIOS,
+            lambda: OdooAPIClient(server.url, "stub", "admin", "admin"),
+            users=5, ramp_up=0.5, iterations=10, seed=1
+        )
+        stats = load.run()
+    
+    rows = {(row["kind"], row["name"]): row for row in stats.summary()}
+    assert sum(r["count"] for (kind, _), r in rows.items() if kind == "scenario") == 50
+    assert not any(row["errors"] for row in rows.values()), stats.error_samples
+    assert rows[("call", "sale.order.create")]["p95_ms"] < 1000
+
+
+@pytest.mark.slow
+def test_benchmarks_against_baseline():
+    """Test the benchmark harness and its regression check on the stub server"""
+    from odoo_benchmarks import compare, run_benchmarks
     
-    assert auth_response.status_code == 200
+    run = run_benchmarks(count=20, latency=0.001, repeat=1,
+                         names=["call", "call_many batched", "async create"])
+    assert all(r["ops_per_sec"] > 0 for r in run["results"].values())
+    
+    # Twice the throughput in the baseline means a 50% drop now
+    baseline = {"results": {
+        name: dict(result, ops_per_sec=result["ops_per_sec"] * 2)
+        for name, result in run["results"].items()
+    }}
+    assert not any(row["regressed"] for row in compare(run, run))
+    assert all(row["regressed"] for row in compare(run, baseline, threshold=0.2))
+
+
+def test_custom_endpoint(odoo_client):
+    """Test custom REST endpoint"""
     
-    # Call custom endpoint
-    response = session.get("http://localhost:8069/api/sale_orders")
+    # Reuse the already authenticated session
+    response = odoo_client.session.get("http://localhost:8069/api/sale_orders")
     
     assert response.status_code == 200
     data = response.json()
@@ -0,0 +1,226 @@
+"""
+Odoo Async API Client - asyncio + aiohttp
+Concurrent counterpart of OdooAPIClient for data seeding and API tests
+that would otherwise be serialized on network latency.
+"""
+
+import asyncio
+import itertools
+import time
+
+import aiohttp
+
+from odoo_api_test import OdooAPIError
+from odoo_metrics import OdooMetrics
+from odoo_serializers import get_serializer
+
+
+class AsyncOdooAPIClient:
+    """
+    Asynchronous client for interacting with Odoo API
+
+    Usage:
+        async with AsyncOdooAPIClient(url, db, "admin", "admin") as client:
+            await client.authenticate()
+            ids = await client.create_all("res.partner", [{"name": "A"}, {"name": "B"}])
+    """
+
+    def __init__(self, url: str, db: str, username: str, password: str,
+                 concurrency: int = 20, pool_size: int = None,
+                 keepalive_timeout: float = 30.0, metrics: OdooMetrics = None,
+                 serializer=None):
+        """
+        Initialize async Odoo API client
+
+        Args:
+            url: Odoo server URL (e.g., 'http://localhost:8069')
+            db: Database name
+            username: Login username
+            password: Login password
+            concurrency: Maximum number of requests in flight at once
+            pool_size: Maximum pooled connections (defaults to concurrency)
+            keepalive_timeout: Seconds an idle connection is kept open
+            metrics: Optional OdooMetrics recording every request, as in
+                OdooAPIClient
+            serializer: JSON backend name or object, as in OdooAPIClient
+        """
+        self.url = url
+        self.db = db
+        self.username = username
+        self.password = password
+        self.concurrency = concurrency
+        self.pool_size = pool_size or concurrency
+        self.keepalive_timeout = keepalive_timeout
+        self.metrics = metrics
+        self.serializer = get_serializer(serializer)
+        self.uid = None
+        self._session = None
+        self._semaphore = None
+        self._request_ids = itertools.count(1)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
+
+    async def close(self):
+        """Close the pooled HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the session and semaphore bind to the running loop
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            # unsafe=True keeps the session cookie for IP-address hosts like 127.0.0.1
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.CookieJar(unsafe=True)
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._session
+
+    async def _post(self, endpoint: str, payload: dict) -> dict:
+        session = self._get_session()
+        data = self.serializer.dumps(payload)
+        async with self._semaphore:
+            start = time.perf_counter()
+            body = b""
+            result = None
+            try:
+                async with session.post(endpoint, data=data,
+                                        headers={"Content-Type": "application/json"}) as response:
+                    body = await response.read()
+                    result = self.serializer.loads(body)
+                    return result
+            finally:
+                if self.metrics is not None:
+                    params = payload.get("params", {})
+                    if "model" in params:
+                        model, method = params["model"], params["method"]
+                    else:
+                        model, method = "session", endpoint.rsplit("/", 1)[-1]
+                    error = not isinstance(result, dict) or "error" in result
+                    self.metrics.record(model, method, time.perf_counter() - start,
+                                        len(data), len(body), error)
+
+    async def authenticate(self):
+        """Authenticate and get user ID"""
+        payload = {
+            "jsonrpc": "2.0",
+            "params": {
+                "db": self.db,
+                "login": self.username,
+                "password": self.password
+            }
+        }
+
+        result = await self._post(f"{self.url}/web/session/authenticate", payload)
+
+        if "result" in result and result["result"].get("uid"):
+            self.uid = result["result"]["uid"]
+            return True
+        return False
+
+    async def call(self, model: str, method: str, args: list = None, kwargs: dict = None):
+        """
+        Call Odoo model method via JSON-RPC
+
+        Args:
+            model: Odoo model name (e.g., 'sale.order')
+            method: Method name (e.g., 'create', 'search', 'read')
+            args: Positional arguments
+            kwargs: Keyword arguments
+
+        Returns:
+            API response result
+        """
+        if not self.uid:
+            raise Exception("Not authenticated. Call authenticate() first.")
+
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {
+                "model": model,
+                "method": method,
+                "args": args or [],
+                "kwargs": kwargs or {}
+            },
+            "id": next(self._request_ids)
+        }
+
+        result = await self._post(f"{self.url}/web/dataset/call_kw", payload)
+
+        if "error" in result:
+            raise OdooAPIError(result["error"])
+
+        return result.get("result")
+
+    async def search(self, model: str, domain: list, fields: list = None, limit: int = None,
+                     offset: int = 0, order: str = None):
+        """
+        Search records in Odoo model
+
+        Returns:
+            List of records, or list of IDs when no fields are given
+        """
+        kwargs = {}
+        if offset:
+            kwargs["offset"] = offset
+        if limit:
+            kwargs["limit"] = limit
+        if order:
+            kwargs["order"] = order
+
+        if fields:
+            return await self.call(model, "search_read",
+                                   kwargs=dict(kwargs, domain=domain, fields=fields))
+        return await self.call(model, "search", args=[domain], kwargs=kwargs)
+
+    async def create(self, model: str, values: dict):
+        """Create a new record and return its ID"""
+        return await self.call(model, "create", args=[values])
+
+    async def write(self, model: str, record_id: int, values: dict):
+        """Update existing record"""
+        return await self.call(model, "write", args=[[record_id], values])
+
+    async def unlink(self, model: str, record_id: int):
+        """Delete a record"""
+        return await self.call(model, "unlink", args=[[record_id]])
+
+    async def gather(self, calls: list, return_exceptions: bool = False):
+        """
+        Run many model calls concurrently, bounded by the concurrency limit
+
+        Args:
+            calls: List of (model, method[, args[, kwargs]]) tuples
+            return_exceptions: Return errors in place of results instead of
+                raising the first one
+
+        Returns:
+            List of results in the same order as calls
+        """
+        return await asyncio.gather(
+            *(self.call(*call) for call in calls),
+            return_exceptions=return_exceptions
+        )
+
+    async def create_all(self, model: str, values_list: list, return_exceptions: bool = False):
+        """
+        Create many records concurrently, one request per record
+
+        Returns:
+            List of created IDs in the same order as values_list
+        """
+        return await self.gather(
+            [(model, "create", [values]) for values in values_list],
+            return_exceptions=return_exceptions
+        )
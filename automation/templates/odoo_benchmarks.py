@@ -0,0 +1,303 @@
+"""
+Odoo API Client Benchmarks
+Measures client-side throughput of the call, search, bulk and concurrent
+paths against the local OdooStubServer, so no live Odoo instance is
+needed. Results can be saved as JSON and compared with a baseline run;
+the exit status is 1 when any benchmark regressed past the threshold.
+
+Run:
+    python odoo_benchmarks.py
+    python odoo_benchmarks.py --save test-results/benchmarks.json
+    python odoo_benchmarks.py --baseline baseline.json --threshold 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from odoo_api_test import OdooAPIClient
+from odoo_async_client import AsyncOdooAPIClient
+from odoo_stub_server import OdooStubServer
+
+# name -> (unit, function(url, count, concurrency) returning (operations, seconds))
+BENCHMARKS = {}
+
+
+def benchmark(name: str, unit: str = "calls"):
+    """Register a benchmark function under name"""
+    def register(func):
+        BENCHMARKS[name] = (unit, func)
+        return func
+    return register
+
+
+def _client(url: str) -> OdooAPIClient:
+    client = OdooAPIClient(url, "stub", "admin", "admin")
+    client.authenticate()
+    return client
+
+
+@benchmark("call")
+def bench_call(url: str, count: int, concurrency: int):
+    """Sequential call() round trips"""
+    client = _client(url)
+    start = time.perf_counter()
+    for _ in range(count):
+        client.call("res.partner", "search_count", [[]])
+    return count, time.perf_counter() - start
+
+
+@benchmark("search_read")
+def bench_search_read(url: str, count: int, concurrency: int):
+    """search() with fields: one page of 80 partners per call"""
+    client = _client(url)
+    start = time.perf_counter()
+    for i in range(count):
+        client.search("res.partner", [["id", ">", i % 20]],
+                      fields=["name", "email", "city"], limit=80)
+    return count, time.perf_counter() - start
+
+
+@benchmark("read all orders", unit="records")
+def bench_read(url: str, count: int, concurrency: int):
+    """read() of every sale order with all fields, one call per pass"""
+    client = _client(url)
+    ids = client.search("sale.order", [])
+    passes = max(count // 50, 1)
+    start = time.perf_counter()
+    for _ in range(passes):
+        client.read("sale.order", ids)
+    return len(ids) * passes, time.perf_counter() - start
+
+
+@benchmark("iter_read all orders", unit="records")
+def bench_iter_read(url: str, count: int, concurrency: int):
+    """iter_read() of every sale order, parsed incrementally"""
+    client = _client(url)
+    ids = client.search("sale.order", [])
+    passes = max(count // 50, 1)
+    start = time.perf_counter()
+    for _ in range(passes):
+        for _ in client.iter_read("sale.order", ids):
+            pass
+    return len(ids) * passes, time.perf_counter() - start
+
+
+@benchmark("iter_search lines", unit="records")
+def bench_iter_search(url: str, count: int, concurrency: int):
+    """Keyset-paged iter_search over every order line"""
+    client = _client(url)
+    start = time.perf_counter()
+    records = sum(1 for _ in client.iter_search(
+        "sale.order.line", [], ["product_id", "price_subtotal"], page_size=100
+    ))
+    return records, time.perf_counter() - start
+
+
+@benchmark("create one by one", unit="records")
+def bench_sync_create(url: str, count: int, concurrency: int):
+    """Create records one by one with the synchronous client"""
+    client = _client(url)
+    start = time.perf_counter()
+    for i in range(count):
+        client.create("res.partner", {"name": f"Sync Partner {i}"})
+    return count, time.perf_counter() - start
+
+
+@benchmark("create/write/unlink_many", unit="records")
+def bench_bulk(url: str, count: int, concurrency: int):
+    """Chunked bulk create, write and unlink of the same records"""
+    client = _client(url)
+    start = time.perf_counter()
+    created = client.create_many("res.partner", [{"name": f"Bulk {i}"} for i in range(count)],
+                                 chunk_size=100)
+    client.write_many("res.partner", created.ids, {"city": "Bulk City"}, chunk_size=100)
+    client.unlink_many("res.partner", created.ids, chunk_size=100)
+    return count * 3, time.perf_counter() - start
+
+
+@benchmark("call_many batched")
+def bench_call_many(url: str, count: int, concurrency: int):
+    """JSON-RPC batch arrays of 50 calls"""
+    client = _client(url)
+    calls = [("res.partner", "search_count", [[["id", ">", i]]]) for i in range(count)]
+    start = time.perf_counter()
+    for offset in range(0, count, 50):
+        client.call_many(calls[offset:offset + 50])
+    return count, time.perf_counter() - start
+
+
+@benchmark("call_many pipelined")
+def bench_call_many_pipelined(url: str, count: int, concurrency: int):
+    """The concurrent fallback used when a server rejects batch arrays"""
+    client = OdooAPIClient(url, "stub", "admin", "admin", pipeline_workers=concurrency,
+                           pool_size=concurrency)
+    client.authenticate()
+    client.batch_supported = False
+    calls = [("res.partner", "search_count", [[["id", ">", i]]]) for i in range(count)]
+    start = time.perf_counter()
+    client.call_many(calls)
+    return count, time.perf_counter() - start
+
+
+@benchmark("threaded search_read")
+def bench_threaded(url: str, count: int, concurrency: int):
+    """One shared client used from a thread pool"""
+    client = OdooAPIClient(url, "stub", "admin", "admin", pool_size=concurrency)
+    client.authenticate()
+
+    def search(i):
+        return client.search("res.partner", [["id", ">", i % 20]], fields=["name"], limit=80)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(search, range(count)))
+    return count, time.perf_counter() - start
+
+
+@benchmark("async create", unit="records")
+def bench_async_create(url: str, count: int, concurrency: int):
+    """Create records concurrently with the asynchronous client"""
+    async def run():
+        async with AsyncOdooAPIClient(url, "stub", "admin", "admin",
+                                      concurrency=concurrency) as client:
+            await client.authenticate()
+            start = time.perf_counter()
+            await client.create_all(
+                "res.partner",
+                [{"name": f"Async Partner {i}"} for i in range(count)]
+            )
+            return count, time.perf_counter() - start
+
+    return asyncio.run(run())
+
+
+def run_benchmarks(count: int = 200, latency: float = 0.005, payload_size: int = 0,
+                   concurrency: int = 8, repeat: int = 3, names: list = None) -> dict:
+    """
+    Run benchmarks, each against a fresh stub server loaded with fixtures
+
+    Each benchmark runs repeat times, every run on its own server so the
+    records created by one run never slow down the next one; the median
+    throughput is kept.
+
+    Returns:
+        Dictionary with the run parameters, environment and per-benchmark
+        results (unit, operations, seconds, ops_per_sec)
+    """
+    params = {"count": count, "latency": latency, "payload_size": payload_size,
+              "concurrency": concurrency, "repeat": repeat}
+    def measure(func):
+        with OdooStubServer(latency=latency, payload_size=payload_size,
+                            accept_batch=True).load_fixtures() as server:
+            return func(server.url, count, concurrency)
+
+    results = {}
+    for name in names or BENCHMARKS:
+        unit, func = BENCHMARKS[name]
+        runs = sorted((measure(func) for _ in range(repeat)),
+                      key=lambda run: run[0] / run[1])
+        ops, seconds = runs[len(runs) // 2]
+        results[name] = {"unit": unit, "operations": ops, "seconds": seconds,
+                         "ops_per_sec": ops / seconds}
+    return {
+        "params": params,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.time(),
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.2) -> list:
+    """
+    Compare throughput with a baseline run
+
+    Args:
+        current: run_benchmarks() output
+        baseline: Earlier run_benchmarks() output
+        threshold: Allowed relative throughput drop (0.2 = 20% slower)
+
+    Returns:
+        List of dicts with name, baseline and current ops/sec, relative
+        change, and regressed; benchmarks missing from either run are skipped
+    """
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        change = result["ops_per_sec"] / base["ops_per_sec"] - 1
+        rows.append({
+            "name": name,
+            "baseline": base["ops_per_sec"],
+            "current": result["ops_per_sec"],
+            "change": change,
+            "regressed": change < -threshold,
+        })
+    return rows
+
+
+def save(run: dict, path: str):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(run, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200, help="operations per benchmark")
+    parser.add_argument("--latency", type=float, default=0.005,
+                        help="simulated server latency in seconds")
+    parser.add_argument("--payload-size", type=int, default=0,
+                        help="filler bytes added to every record the stub returns")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark (median kept)")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), metavar="NAME",
+                        help="run a subset of benchmarks")
+    parser.add_argument("--save", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare with a saved run")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed throughput drop vs baseline (default: 0.2)")
+    args = parser.parse_args()
+
+    run = run_benchmarks(args.count, args.latency, args.payload_size, args.concurrency,
+                         args.repeat, args.only)
+
+    print(f"{'Benchmark':<28} {'Ops':>7} {'Seconds':>9} {'Ops/s':>10}  Unit")
+    print("-" * 65)
+    for name, result in run["results"].items():
+        print(f"{name:<28} {result['operations']:>7} {result['seconds']:>9.3f} "
+              f"{result['ops_per_sec']:>10.1f}  {result['unit']}")
+
+    if args.save:
+        save(run, args.save)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline["params"] != run["params"]:
+        print(f"\nWarning: baseline parameters differ: {baseline['params']}")
+
+    rows = compare(run, baseline, args.threshold)
+    print(f"\n{'Benchmark':<28} {'Baseline':>10} {'Current':>10} {'Change':>8}")
+    print("-" * 59)
+    for row in rows:
+        flag = "  REGRESSION" if row["regressed"] else ""
+        print(f"{row['name']:<28} {row['baseline']:>10.1f} {row['current']:>10.1f} "
+              f"{row['change']:>+8.1%}{flag}")
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
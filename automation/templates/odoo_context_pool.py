@@ -0,0 +1,130 @@
+"""
+Odoo Browser Context Pool - Warm, authenticated Playwright contexts
+Reuses browser contexts between tests instead of building a fresh one
+(cold asset cache, new login) for every test.
+"""
+
+
+class OdooContextPool:
+    """
+    Pool of logged-in browser contexts for one pytest worker
+
+    A released page is reset cheaply (discard unsaved form changes, close
+    dialogs and extra tabs, go back to the base action) and handed to the
+    next test. Pages that fail to reset are closed and replaced.
+
+    Usage:
+        pool = OdooContextPool(browser, storage_state, "http://localhost:8069")
+        page = pool.acquire()
+        ...
+        pool.release(page)
+    """
+
+    def __init__(self, browser, storage_state: dict, base_url: str, size: int = 2,
+                 base_action: str = None, context_args: dict = None,
+                 refresh_state=None):
+        """
+        Args:
+            browser: Playwright Browser
+            storage_state: Authenticated storage_state for new contexts
+            base_url: Odoo server URL
+            size: Maximum number of idle contexts kept warm
+            base_action: Action (id or XML id) pages return to between tests;
+                the home menu is used when omitted
+            context_args: Extra keyword arguments for browser.new_context()
+            refresh_state: Optional callable returning a new storage_state
+                once the session in storage_state has expired
+        """
+        self.browser = browser
+        self.storage_state = storage_state
+        self.refresh_state = refresh_state
+        self.base_url = base_url
+        self.size = size
+        self.base_action = base_action
+        self.context_args = context_args or {}
+        self.created = 0
+        self.reused = 0
+        self._idle = []
+
+    @property
+    def reset_url(self) -> str:
+        if self.base_action:
+            return f"{self.base_url}/web#action={self.base_action}"
+        return f"{self.base_url}/web"
+
+    def prewarm(self):
+        """Open contexts until size idle pages are ready"""
+        while len(self._idle) < self.size:
+            self._idle.append(self._new_page())
+
+    def acquire(self):
+        """Return a ready page, reusing an idle context when possible"""
+        if self._idle:
+            self.reused += 1
+            return self._idle.pop()
+        return self._new_page()
+
+    def release(self, page, reusable: bool = True):
+        """
+        Return a page to the pool
+
+        Args:
+            page: Page obtained from acquire()
+            reusable: False to close the context (e.g., after a failed test)
+        """
+        if reusable and len(self._idle) < self.size and self._reset(page):
+            self._idle.append(page)
+        else:
+            page.context.close()
+
+    def close(self):
+        """Close every idle context"""
+        while self._idle:
+            self._idle.pop().context.close()
+
+    def _new_page(self):
+        for attempt in range(2):
+            context = self.browser.new_context(storage_state=self.storage_state,
+                                               **self.context_args)
+            page = context.new_page()
+            try:
+                page.goto(self.reset_url)
+                if "/web/login" in page.url:
+                    raise RuntimeError("Odoo session expired")
+                page.wait_for_selector(".o_main_navbar", timeout=10000)
+            except Exception:
+                context.close()
+                if attempt or self.refresh_state is None:
+                    raise
+                # Log in again once; later contexts start from the new state
+                self.storage_state = self.refresh_state()
+                continue
+            self.created += 1
+            return page
+
+    def _reset(self, page) -> bool:
+        """Bring a used page back to a clean state; False if it must be discarded"""
+        try:
+            if page.is_closed():
+                return False
+            for other in page.context.pages:
+                if other is not page:
+                    other.close()
+
+            # Leave no dirty record behind: newer Odoo versions auto-save on navigation
+            discard = page.locator(".o_form_button_cancel")
+            if discard.count() and discard.first.is_visible():
+                discard.first.click()
+            for _ in range(3):
+                close_dialog = page.locator(".modal .btn-close")
+                if not close_dialog.count():
+                    break
+                close_dialog.first.click()
+
+            page.goto(self.reset_url)
+            if "/web/login" in page.url:
+                return False
+            page.wait_for_selector(".o_main_navbar", timeout=5000)
+            return True
+        except Exception:
+            return False
@@ -0,0 +1,185 @@
+"""
+Odoo Field Cache - fields_get metadata kept on disk
+Fetches each model's field definitions once, stores them per database and
+installed module versions, and uses them to reject unknown fields before
+a request is sent, warn about fields that are expensive to read, and pick
+a small default field list instead of reading every field.
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import threading
+import warnings
+from pathlib import Path
+
+ATTRIBUTES = ["type", "string", "store", "relation", "required", "readonly"]
+
+# Types worth reading by default: scalar values and many2one [id, name] pairs
+MINIMAL_TYPES = {
+    "boolean", "char", "date", "datetime", "float", "integer", "monetary",
+    "selection", "many2one",
+}
+
+# Types whose values can be large: id lists, file contents, rich text
+HEAVY_TYPES = {"one2many", "many2many", "binary", "html"}
+
+# Odoo's answer to a read the user has no access rights for
+ACCESS_ERRORS = {"odoo.exceptions.AccessError"}
+
+
+def _access_denied(exception) -> bool:
+    # OdooAPIError carries the JSON-RPC error dictionary
+    error = getattr(exception, "error", None)
+    return isinstance(error, dict) and (error.get("data") or {}).get("name") in ACCESS_ERRORS
+
+
+class OdooFieldError(ValueError):
+    """A field list names fields the model does not have"""
+
+
+class OdooFieldWarning(UserWarning):
+    """A requested field is computed on every read or has large values"""
+
+
+class OdooFieldCache:
+    """
+    Per-database fields_get cache shared by clients and test runs
+
+    The cache file name includes a hash of the installed modules and their
+    versions, so upgrading or installing a module starts a fresh cache.
+    Users who may not read ir.module.module get no cache: field lists are
+    sent unchecked, with one OdooFieldWarning per database.
+
+    Usage:
+        client = OdooAPIClient(url, db, user, password, field_cache=OdooFieldCache())
+        client.search("res.partner", [], fields=["nmae"])   # OdooFieldError, no request
+        client.search_read("res.partner", [])               # all fields
+        client = OdooAPIClient(..., field_cache=OdooFieldCache(minimal_default=True))
+        client.search_read("res.partner", [])               # minimal_fields() only
+    """
+
+    def __init__(self, cache_dir: str = None, minimal_default: bool = False):
+        """
+        Args:
+            cache_dir: Directory for the cache files (defaults to
+                $ODOO_CACHE_DIR or .odoo_cache)
+            minimal_default: Read minimal_fields() instead of every field
+                when a read or search_read gives no field list
+        """
+        self.directory = Path(cache_dir or os.getenv("ODOO_CACHE_DIR", ".odoo_cache"))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.minimal_default = minimal_default
+        self._files = {}
+        self._models = {}
+        self._warned = set()
+        self._lock = threading.Lock()
+
+    def _cache_file(self, client):
+        """Cache file for the client's database and installed module versions
+
+        Returns:
+            Path, or None if the user may not read the installed modules
+        """
+        key = (client.url, client.db)
+        if key not in self._files:
+            try:
+                modules = client.call("ir.module.module", "search_read", kwargs={
+                    "domain": [["state", "=", "installed"]],
+                    "fields": ["name", "latest_version"],
+                })
+            except Exception as e:
+                if not _access_denied(e):
+                    raise
+                warnings.warn(f"No field cache for {client.db}: {client.username} cannot read "
+                              f"ir.module.module, field lists are not checked",
+                              OdooFieldWarning)
+                self._files[key] = None
+                return None
+            versions = sorted((m["name"], m["latest_version"] or "") for m in modules)
+            digest = hashlib.sha1(json.dumps(versions).encode()).hexdigest()[:12]
+            self._files[key] = self.directory / f"fields_{client.db}_{digest}.json"
+        return self._files[key]
+
+    def _load(self, path: Path) -> dict:
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, path: Path, model: str, fields: dict):
+        # Merge with what other workers saved since we last read the file
+        models = self._load(path)
+        models[model] = fields
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(models))
+        os.replace(tmp_path, path)
+
+    def get(self, client, model: str) -> dict:
+        """
+        Field definitions of model, from memory, disk or one fields_get call
+
+        Returns:
+            Dictionary of field name to attributes (type, string, store, ...)
+        """
+        path = self._cache_file(client)
+        if path is None:
+            return client.call(model, "fields_get", kwargs={"attributes": ATTRIBUTES})
+        with self._lock:
+            models = self._models.get(path)
+            if models is None:
+                models = self._models[path] = self._load(path)
+            if model in models:
+                return models[model]
+
+        fields = client.call(model, "fields_get", kwargs={"attributes": ATTRIBUTES})
+        with self._lock:
+            self._models[path][model] = fields
+            self._save(path, model, fields)
+        return fields
+
+    def validate(self, client, model: str, fields: list):
+        """
+        Raise OdooFieldError for unknown fields and warn about expensive ones
+
+        Raises:
+            OdooFieldError: With close-match suggestions for typos
+        """
+        known = self.get(client, model)
+        unknown = [f for f in fields if f not in known]
+        if unknown:
+            hints = []
+            for field in unknown:
+                matches = difflib.get_close_matches(field, known, n=1)
+                hints.append(f"'{field}'" + (f" (did you mean '{matches[0]}'?)" if matches else ""))
+            raise OdooFieldError(f"Unknown field(s) on {model}: {', '.join(hints)}")
+
+        for field in fields:
+            definition = known[field]
+            reason = None
+            if definition.get("type") in HEAVY_TYPES:
+                reason = f"is a {definition['type']} field, whose values can be large"
+            elif definition.get("store") is False:
+                reason = "is computed on every read (not stored)"
+            if reason and (model, field) not in self._warned:
+                self._warned.add((model, field))
+                warnings.warn(f"{model}.{field} {reason}", OdooFieldWarning, stacklevel=4)
+
+    def minimal_fields(self, client, model: str) -> list:
+        """Stored scalar and many2one fields: a cheap default field list"""
+        return sorted(
+            name for name, definition in self.get(client, model).items()
+            if definition.get("store", True) and definition.get("type") in MINIMAL_TYPES
+        )
+
+    def prepare(self, client, model: str, fields: list = None) -> list:
+        """Validate an explicit field list, or choose the default one"""
+        if self._cache_file(client) is None:
+            return fields
+        if fields:
+            self.validate(client, model, fields)
+            return fields
+        if self.minimal_default:
+            return self.minimal_fields(client, model)
+        return fields
@@ -0,0 +1,277 @@
+"""
+Odoo Pytest Fixtures - Shared across API and UI templates
+Loaded as a pytest plugin from conftest.py. Configure the target instance
+with ODOO_URL, ODOO_DB, ODOO_USER and ODOO_PASSWORD (see .env in README).
+"""
+
+import os
+
+import pytest
+
+from odoo_api_test import OdooAPIClient
+from odoo_context_pool import OdooContextPool
+from odoo_field_cache import OdooFieldCache
+from odoo_metrics import OdooMetrics
+from odoo_navigation import OdooMenuResolver
+from odoo_session_store import OdooSessionStore
+from odoo_test_data import OdooDatabaseSnapshot, OdooDataTracker, OdooRecordFactory
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("odoo")
+    group.addoption("--no-context-pool", action="store_true",
+                    help="give every UI test a fresh browser context "
+                         "(baseline for timing the context pool)")
+    group.addoption("--context-pool-size", type=int, default=2,
+                    help="warm browser contexts kept per worker (default: 2)")
+    group.addoption("--odoo-metrics-json", metavar="PATH",
+                    help="write per-(model, method) JSON-RPC latency histograms "
+                         "to PATH for comparing runs")
+
+
+_METRICS_KEY = pytest.StashKey[OdooMetrics]()
+
+
+def pytest_configure(config):
+    config.stash[_METRICS_KEY] = OdooMetrics()
+
+
+def pytest_sessionfinish(session):
+    # xdist workers hand their histograms to the controller
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["odoo_metrics"] = session.config.stash[_METRICS_KEY].to_dict()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    data = getattr(node, "workeroutput", {}).get("odoo_metrics")
+    if data:
+        node.config.stash[_METRICS_KEY].merge(OdooMetrics.from_dict(data))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    metrics = config.stash[_METRICS_KEY]
+    if not metrics or hasattr(config, "workerinput"):
+        return
+    terminalreporter.write_sep("=", "Odoo JSON-RPC calls")
+    for line in metrics.report().splitlines():
+        terminalreporter.write_line(line)
+    path = config.getoption("odoo_metrics_json")
+    if path:
+        metrics.write_json(path)
+        terminalreporter.write_line(f"Odoo call metrics written to {path}")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Expose each phase's report to fixtures as item.rep_setup/rep_call/rep_teardown
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+@pytest.fixture(scope="session")
+def odoo_settings():
+    """Connection settings for the Odoo instance under test"""
+    return {
+        "url": os.getenv("ODOO_URL", "http://localhost:8069"),
+        "db": os.getenv("ODOO_DB", "your_database"),
+        "username": os.getenv("ODOO_USER", "admin"),
+        "password": os.getenv("ODOO_PASSWORD", "admin"),
+    }
+
+
+@pytest.fixture(scope="session")
+def odoo_metrics(request):
+    """
+    Session-wide OdooMetrics shown in the terminal summary
+
+    Pass it to any extra client (metrics=odoo_metrics) to include its
+    calls; --odoo-metrics-json also saves it for trend comparison.
+    """
+    return request.config.stash[_METRICS_KEY]
+
+
+@pytest.fixture(scope="session")
+def odoo_session_store():
+    """
+    On-disk session store shared by every test and xdist worker
+
+    Workers on the same machine share one directory, so the whole run
+    authenticates once per (url, db, user) until the session expires.
+    """
+    return OdooSessionStore()
+
+
+@pytest.fixture(scope="session")
+def odoo_api(odoo_settings, odoo_session_store, odoo_metrics):
+    """Authenticated OdooAPIClient reusing the stored session"""
+    client = OdooAPIClient(session_store=odoo_session_store, metrics=odoo_metrics,
+                           field_cache=OdooFieldCache(), **odoo_settings)
+    assert client.authenticate(), "Odoo authentication failed"
+    return client
+
+
+@pytest.fixture(scope="session")
+def odoo_records(odoo_api):
+    """
+    Factory that seeds records through the API for UI tests
+
+    Everything it created is deleted in bulk when the session ends.
+    """
+    factory = OdooRecordFactory(odoo_api)
+    yield factory
+    factory.cleanup()
+
+
+@pytest.fixture
+def odoo_isolated(odoo_api):
+    """
+    odoo_api with per-test data isolation
+
+    Every record created through the client during the test is deleted in
+    bulk afterwards, newest model first, even if the test failed.
+    """
+    with OdooDataTracker().track(odoo_api):
+        yield odoo_api
+
+
+@pytest.fixture(scope="session")
+def odoo_db_snapshot(odoo_settings):
+    """
+    Template copy of the test database, taken once per session
+
+    Needs ODOO_MASTER_PASSWORD. Used by tests marked odoo_db_reset.
+    """
+    master_password = os.getenv("ODOO_MASTER_PASSWORD")
+    if not master_password:
+        pytest.skip("Set ODOO_MASTER_PASSWORD to use database snapshots")
+    snapshot = OdooDatabaseSnapshot(odoo_settings["url"], master_password, odoo_settings["db"])
+    snapshot.snapshot()
+    yield snapshot
+    snapshot.discard()
+
+
+@pytest.fixture(autouse=True)
+def _odoo_db_reset(request):
+    """Restore the database from the snapshot after tests marked odoo_db_reset"""
+    if request.node.get_closest_marker("odoo_db_reset") is None:
+        yield
+        return
+    snapshot = request.getfixturevalue("odoo_db_snapshot")
+    yield
+    snapshot.restore()
+
+
+@pytest.fixture(scope="session")
+def odoo_menu_resolver(odoo_api):
+    """Menu path to action resolver, cached on disk per database"""
+    return OdooMenuResolver(odoo_api)
+
+
+def login_with_form(page, odoo_settings):
+    """Log a page in through Odoo's login form (when no stored session exists)"""
+    page.goto(f"{odoo_settings['url']}/web/login")
+    page.fill("input[name='login']", odoo_settings["username"])
+    page.fill("input[name='password']", odoo_settings["password"])
+    page.click("button[type='submit']")
+    page.wait_for_selector(".o_main_navbar", timeout=10000)
+    return page
+
+
+def stored_storage_state(browser, odoo_api, odoo_session_store, odoo_settings,
+                         force: bool = False):
+    """
+    Playwright storage_state carrying the shared Odoo session cookie
+
+    With force, the API client logs in again first (the stored session
+    expired). If the store has no session, the state is taken from a
+    context logged in through the form instead.
+    """
+    if force:
+        odoo_api.authenticate(force=True)
+    entry = odoo_session_store.load(odoo_settings["url"], odoo_settings["db"],
+                                    odoo_settings["username"])
+    if entry is not None:
+        return OdooSessionStore.storage_state(entry)
+
+    context = browser.new_context()
+    try:
+        login_with_form(context.new_page(), odoo_settings)
+        return context.storage_state()
+    finally:
+        context.close()
+
+
+@pytest.fixture(scope="session")
+def odoo_storage_state(browser, odoo_api, odoo_session_store, odoo_settings):
+    """Playwright storage_state carrying the shared Odoo session cookie"""
+    return stored_storage_state(browser, odoo_api, odoo_session_store, odoo_settings)
+
+
+def login_with_stored_session(page, odoo_api, odoo_session_store, odoo_settings):
+    """
+    Put a page into a logged-in state without filling the login form
+
+    Adds the stored session cookie to the page's context and opens /web.
+    If Odoo redirects to the login page the session expired: authenticate
+    again through the API and retry once. Without a stored session the
+    page logs in through the form.
+    """
+    key = (odoo_settings["url"], odoo_settings["db"], odoo_settings["username"])
+    for attempt in range(2):
+        if attempt:
+            odoo_api.authenticate(force=True)
+        entry = odoo_session_store.load(*key)
+        if entry is None:
+            return login_with_form(page, odoo_settings)
+        page.context.add_cookies(OdooSessionStore.storage_state(entry)["cookies"])
+        page.goto(f"{odoo_settings['url']}/web")
+        if "/web/login" not in page.url:
+            page.wait_for_selector(".o_main_navbar", timeout=10000)
+            return page
+    raise RuntimeError("Could not restore an Odoo session for the browser")
+
+
+@pytest.fixture
+def authenticated_page(page, odoo_api, odoo_session_store, odoo_settings):
+    """Playwright page that starts logged in via the shared session"""
+    return login_with_stored_session(page, odoo_api, odoo_session_store, odoo_settings)
+
+
+@pytest.fixture(scope="session")
+def odoo_context_pool(request, browser, odoo_storage_state, odoo_api, odoo_session_store,
+                      odoo_settings):
+    """Per-worker pool of warm, authenticated browser contexts"""
+    pool = OdooContextPool(
+        browser,
+        odoo_storage_state,
+        odoo_settings["url"],
+        size=request.config.getoption("context_pool_size"),
+        refresh_state=lambda: stored_storage_state(browser, odoo_api, odoo_session_store,
+                                                   odoo_settings, force=True)
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def pooled_page(request, odoo_api, odoo_session_store, odoo_settings):
+    """
+    Logged-in page borrowed from the context pool
+
+    The context is reset and reused by the next test unless this test
+    failed, in which case it is closed so no broken state leaks. Run with
+    --no-context-pool to compare against a fresh context per test.
+    """
+    if request.config.getoption("no_context_pool"):
+        page = request.getfixturevalue("page")
+        yield login_with_stored_session(page, odoo_api, odoo_session_store, odoo_settings)
+        return
+
+    pool = request.getfixturevalue("odoo_context_pool")
+    page = pool.acquire()
+    yield page
+
+    report = getattr(request.node, "rep_call", None)
+    pool.release(page, reusable=not (report and report.failed))
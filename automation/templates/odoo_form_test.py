@@ -3,8 +3,115 @@ Odoo Form Test Template - Playwright
 This template provides reusable patterns for testing Odoo form views.
 """
 
+import time
+from contextlib import contextmanager
+
 import pytest
 from playwright.sync_api import Page, expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+# Odoo RPC endpoints worth waiting for; long-polling bus traffic is ignored
+RPC_PATHS = ("/web/dataset/call_kw", "/web/dataset/call_button", "/web/action/")
+
+
+class OdooRPCTracker:
+    """
+    Tracks in-flight Odoo RPC requests on a page
+    
+    Replaces wait_for_load_state("networkidle"), which always sits through
+    a 500 ms quiet window and can hang on long-polling bus requests.
+    
+    Usage:
+        rpc = OdooRPCTracker.for_page(page)
+        with rpc.expect_rpc(method="action_confirm"):
+            page.click("button[name='action_confirm']")
+        rpc.wait_for_idle()
+    """
+    
+    DEFAULT_TIMEOUT = 10000
+    
+    def __init__(self, page: Page, paths: tuple = RPC_PATHS):
+        self.page = page
+        self.paths = paths
+        self.pending = set()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_finished)
+        page.on("requestfailed", self._on_finished)
+    
+    @classmethod
+    def for_page(cls, page: Page):
+        """Return the tracker attached to page, attaching one on first use"""
+        tracker = getattr(page, "_odoo_rpc_tracker", None)
+        if tracker is None:
+            tracker = cls(page)
+            page._odoo_rpc_tracker = tracker
+        return tracker
+    
+    def is_rpc(self, request) -> bool:
+        return request.method == "POST" and any(p in request.url for p in self.paths)
+    
+    def _on_request(self, request):
+        if self.is_rpc(request):
+            self.pending.add(request)
+    
+    def _on_finished(self, request):
+        self.pending.discard(request)
+    
+    @staticmethod
+    def _rpc_method(request):
+        try:
+            return (request.post_data_json or {}).get("params", {}).get("method")
+        except Exception:
+            return None
+    
+    @contextmanager
+    def expect_rpc(self, method: str = None, path: str = "/web/dataset/",
+                   timeout: float = None):
+        """
+        Wait for the RPC triggered inside the block to complete
+        
+        Args:
+            method: Model method to match (e.g., 'action_confirm', 'onchange');
+                any RPC on path matches when omitted
+            path: URL fragment the request must contain
+            timeout: Milliseconds to wait
+        """
+        def matches(response):
+            request = response.request
+            if not self.is_rpc(request) or path not in request.url:
+                return False
+            return method is None or self._rpc_method(request) == method
+        
+        with self.page.expect_response(matches, timeout=timeout or self.DEFAULT_TIMEOUT) as info:
+            yield info
+        info.value.finished()
+    
+    def wait_for_idle(self, timeout: float = None, grace: float = 100):
+        """
+        Wait until no tracked RPC is in flight
+        
+        Args:
+            timeout: Milliseconds to wait for in-flight RPCs to finish
+            grace: Milliseconds to wait for an RPC to start when none is
+                pending yet (the triggering event may still be in flight)
+        """
+        if not self.pending:
+            try:
+                self.page.wait_for_event("request", predicate=self.is_rpc, timeout=grace)
+            except PlaywrightTimeoutError:
+                return
+        
+        deadline = time.monotonic() + (timeout or self.DEFAULT_TIMEOUT) / 1000
+        while self.pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                urls = ", ".join(r.url for r in self.pending)
+                raise PlaywrightTimeoutError(f"RPCs still in flight: {urls}")
+            try:
+                # Short slices so failed requests (no requestfinished) are noticed too
+                self.page.wait_for_event("requestfinished", timeout=min(remaining * 1000, 250))
+            except PlaywrightTimeoutError:
+                pass
 
 
 class OdooFormTest:
@@ -13,17 +120,79 @@ class OdooFormTest:
     ODOO_URL = "http://localhost:8069"
     
     @staticmethod
-    def navigate_to_menu(page: Page, menu_path: list):
+    def run_and_wait(page: Page, action, wait: str = "idle", method: str = None,
+                     timeout: float = None):
+        """
+        Run action() and wait for the RPC traffic it causes
+        
+        Args:
+            page: Playwright page object
+            action: Callable performing the UI interaction
+            wait: 'rpc' waits for the RPC calling method, 'idle' for all
+                tracked RPCs to finish, 'networkidle' uses Playwright's load
+                state (legacy behaviour), None does not wait
+            method: Model method expected when wait is 'rpc'
+            timeout: Milliseconds to wait
+        """
+        tracker = OdooRPCTracker.for_page(page)
+        if wait == "rpc":
+            with tracker.expect_rpc(method=method, timeout=timeout):
+                action()
+            # The RPC usually triggers a reload of the record; wait for it too
+            tracker.wait_for_idle(timeout=timeout)
+        elif wait == "idle":
+            action()
+            tracker.wait_for_idle(timeout=timeout)
+        elif wait == "networkidle":
+            action()
+            page.wait_for_load_state("networkidle")
+        else:
+            action()
+    
+    @staticmethod
+    def navigate_to_menu(page: Page, menu_path: list, wait: str = "idle"):
         """
         Navigate through Odoo menu structure
         
         Args:
             page: Playwright page object
             menu_path: List of menu items to click (e.g., ['Sales', 'Orders', 'Quotations'])
+            wait: Wait strategy after each click (see run_and_wait)
         """
         for menu_item in menu_path:
-            page.click(f"a.o_nav_entry:has-text('{menu_item}')")
-            page.wait_for_load_state("networkidle")
+            OdooFormTest.run_and_wait(
+                page,
+                lambda: page.click(f"a.o_nav_entry:has-text('{menu_item}')"),
+                wait=wait
+            )
+    
+    @staticmethod
+    def open_menu(page: Page, menu_path: list, resolver=None, wait: str = "idle",
+                  timeout: float = 5000):
+        """
+        Open a menu's action directly by URL, clicking through as a fallback
+        
+        Args:
+            page: Playwright page object
+            menu_path: List of menu items (e.g., ['Sales', 'Orders', 'Quotations'])
+            resolver: OdooMenuResolver; without one this is navigate_to_menu
+            wait: Wait strategy used by the click-through fallback
+            timeout: Milliseconds to wait for the action's view to appear
+        """
+        if resolver is not None:
+            entry = resolver.resolve(menu_path)
+            view = f".o_{entry['view_type']}_view" if entry["view_type"] else ".o_action"
+            page.goto(resolver.url(menu_path))
+            try:
+                page.wait_for_selector(f".o_action_manager {view}", timeout=timeout)
+                return
+            except PlaywrightTimeoutError:
+                # Stale mapping (menus/actions recreated): look it up again next time
+                resolver.invalidate(menu_path)
+                page.goto(f"{resolver.client.url}/web")
+                page.wait_for_selector(".o_main_navbar")
+        
+        OdooFormTest.navigate_to_menu(page, menu_path, wait=wait)
     
     @staticmethod
     def create_new_record(page: Page):
@@ -44,15 +213,21 @@ class OdooFormTest:
         page.wait_for_selector(".o_form_editable")
     
     @staticmethod
-    def confirm_record(page: Page, button_name: str = "action_confirm"):
+    def confirm_record(page: Page, button_name: str = "action_confirm", wait: str = "rpc"):
         """
         Click a confirmation button (like 'Confirm' on Sale Orders)
         
         Args:
             button_name: The name attribute of the button
+            wait: Wait strategy (see run_and_wait); 'rpc' waits for the
+                button's own method call to finish
         """
-        page.click(f"button[name='{button_name}']")
-        page.wait_for_load_state("networkidle")
+        OdooFormTest.run_and_wait(
+            page,
+            lambda: page.click(f"button[name='{button_name}']"),
+            wait=wait,
+            method=button_name
+        )
     
     @staticmethod
     def fill_field(page: Page, field_name: str, value: str):
@@ -78,13 +253,14 @@ class OdooFormTest:
         page.click(f"option:has-text('{option_text}')")
     
     @staticmethod
-    def select_many2one(page: Page, field_name: str, record_name: str):
+    def select_many2one(page: Page, field_name: str, record_name: str, wait: str = "idle"):
         """
         Select a record in a Many2one field
         
         Args:
             field_name: The name attribute of the field
             record_name: The name of the record to select
+            wait: Wait strategy for the onchange triggered by the selection
         """
         # Click the Many2one field
         page.click(f"div[name='{field_name}'] input")
@@ -94,7 +270,11 @@ class OdooFormTest:
         
         # Wait for dropdown and select
         page.wait_for_selector(".ui-autocomplete")
-        page.click(f".ui-autocomplete li:has-text('{record_name}')")
+        OdooFormTest.run_and_wait(
+            page,
+            lambda: page.click(f".ui-autocomplete li:has-text('{record_name}')"),
+            wait=wait
+        )
     
     @staticmethod
     def assert_notification(page: Page, notification_type: str, message: str):
@@ -122,14 +302,14 @@ class OdooFormTest:
         expect(field_locator).to_have_value(expected_value)
 
 
-def test_create_sale_order(page: Page):
+def test_create_sale_order(pooled_page: Page, odoo_menu_resolver):
     """Example: Test creating a Sale Order in Odoo"""
     
-    # Login (assuming login fixture is available)
-    page.goto("http://localhost:8069/web")
+    # Already logged in: the page comes warm from the context pool
+    page = pooled_page
     
-    # Navigate to Sales > Orders > Quotations
-    OdooFormTest.navigate_to_menu(page, ["Sales", "Orders", "Quotations"])
+    # Open Sales > Orders > Quotations directly via its action URL
+    OdooFormTest.open_menu(page, ["Sales", "Orders", "Quotations"], resolver=odoo_menu_resolver)
     
     # Create new record
     OdooFormTest.create_new_record(page)
@@ -157,11 +337,15 @@ def test_create_sale_order(page: Page):
     expect(page.locator(".o_field_widget[name='state']")).to_contain_text("Sale Order")
 
 
-def test_edit_existing_record(page: Page):
+def test_edit_existing_record(pooled_page: Page, odoo_records):
     """Example: Test editing an existing record"""
+    page = pooled_page
     
-    # Navigate to record
-    page.goto("http://localhost:8069/web#id=1&model=sale.order&view_type=form")
+    # Seed the record through the API, then navigate straight to it
+    order = odoo_records.create("sale.order", {
+        "partner_id": odoo_records.find("res.partner", "Azure Interior"),
+    })
+    page.goto(order.url)
     
     # Click Edit
     OdooFormTest.edit_record(page)
@@ -176,8 +360,9 @@ def test_edit_existing_record(page: Page):
     OdooFormTest.assert_field_value(page, "client_order_ref", "TEST-REF-001")
 
 
-def test_form_validation(page: Page):
+def test_form_validation(pooled_page: Page):
     """Example: Test form validation"""
+    page = pooled_page
     
     # Navigate to form
     page.goto("http://localhost:8069/web#model=sale.order&view_type=form")
@@ -0,0 +1,469 @@
+"""
+Odoo Load Generator - Weighted scenario load tests in Python
+Virtual users run weighted scenarios written against OdooAPIClient or
+AsyncOdooAPIClient, with a user ramp-up, think time and closed- or
+open-loop arrivals. Throughput and p50/p95/p99 latency are reported per
+scenario and per model.method, and the whole run works against the
+local OdooStubServer, so it fits in CI.
+
+Run:
+    python odoo_load_generator.py --users 20 --ramp-up 5 --duration 30
+    python odoo_load_generator.py --rate 50 --users 20 --async
+    python odoo_load_generator.py --url http://localhost:8069 --db test_db
+"""
+
+import argparse
+import asyncio
+import inspect
+import math
+import queue
+import random
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from odoo_api_test import OdooAPIClient
+from odoo_async_client import AsyncOdooAPIClient
+from odoo_metrics import OdooMetrics
+from odoo_stub_server import OdooStubServer
+
+Scenario = namedtuple("Scenario", ["name", "weight", "func"])
+
+
+class LoadStats:
+    """
+    Results of a load run: scenario and JSON-RPC call histograms
+
+    Scenario latencies are kept under the pseudo model "scenario"; every
+    client the run logs in records its calls into `calls`, keyed by
+    (model, method) like any OdooMetrics registry.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished = None
+        self.scenarios = OdooMetrics()
+        self.calls = OdooMetrics()
+        self.error_samples = []
+        self._lock = threading.Lock()
+
+    def record_scenario(self, name: str, seconds: float, error: Exception = None):
+        self.scenarios.record("scenario", name, seconds, error=error is not None)
+        if error is not None:
+            with self._lock:
+                if len(self.error_samples) < 20:
+                    self.error_samples.append(f"{name}: {error}")
+
+    def stop(self):
+        self.finished = time.perf_counter()
+
+    def summary(self) -> list:
+        """
+        Per-scenario then per-call statistics
+
+        Returns:
+            List of dicts with kind ("scenario" or "call"), name, count,
+            errors, rps and mean/p50/p95/p99/max latency in milliseconds
+        """
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        rows = []
+        for kind, metrics in (("scenario", self.scenarios), ("call", self.calls)):
+            for row in sorted(metrics.summary(), key=lambda r: (r["model"], r["method"])):
+                name = row["method"] if kind == "scenario" else f"{row['model']}.{row['method']}"
+                rows.append({
+                    "kind": kind,
+                    "name": name,
+                    "count": row["count"],
+                    "errors": row["errors"],
+                    "rps": row["count"] / elapsed if elapsed else 0.0,
+                    **{key: row[key] for key in ("mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")},
+                })
+        return rows
+
+    def report(self) -> str:
+        """Summary as a plain-text table"""
+        lines = [
+            f"{'Kind':<9} {'Name':<32} {'Count':>7} {'Errors':>7} {'Req/s':>8} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'Max ms':>8}",
+            "-" * 105,
+        ]
+        for row in self.summary():
+            lines.append(
+                f"{row['kind']:<9} {row['name']:<32} {row['count']:>7} {row['errors']:>7} "
+                f"{row['rps']:>8.1f} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} "
+                f"{row['p99_ms']:>8.1f} {row['max_ms']:>8.1f}"
+            )
+        return "\n".join(lines)
+
+
+class OdooLoadTest:
+    """
+    Runs weighted scenarios with a population of virtual users
+
+    Closed loop (default): each of `users` virtual users logs in, then
+    repeatedly picks a scenario by weight, runs it and thinks. Users start
+    evenly spread over ramp_up seconds, like a JMeter thread group.
+
+    Open loop (arrival_rate set): scenarios start at Poisson-distributed
+    times at arrival_rate per second, whether or not earlier ones have
+    finished; `users` logged-in clients serve them. The rate ramps up in
+    `users` steps over ramp_up. Scenario latency is measured from the
+    scheduled start, so time spent queued for a free user counts.
+
+    Scenarios are functions taking a client. Plain functions run on
+    OdooAPIClient in threads; coroutine functions run on
+    AsyncOdooAPIClient in one event loop.
+
+    Usage:
+        def search_products(client):
+            client.search("product.product", [["sale_ok", "=", True]], fields=["name"], limit=80)
+
+        load = OdooLoadTest(
+            [Scenario("search products", 5, search_products)],
+            lambda: OdooAPIClient(url, db, "admin", "admin"),
+            users=20, ramp_up=5, duration=30, think_time=(0.5, 2.0)
+        )
+        print(load.run().report())
+    """
+
+    def __init__(self, scenarios: list, client_factory, users: int = 10,
+                 ramp_up: float = 0.0, duration: float = None, iterations: int = None,
+                 think_time: tuple = (0.0, 0.0), arrival_rate: float = None,
+                 seed: int = None):
+        """
+        Args:
+            scenarios: List of Scenario(name, weight, func)
+            client_factory: Callable returning a new, unauthenticated client;
+                its metrics registry is replaced by the run's stats.calls
+            users: Virtual users (closed loop) or logged-in clients (open loop)
+            ramp_up: Seconds until all users are active / the full rate is reached
+            duration: Seconds to generate load (defaults to 60 without iterations)
+            iterations: Scenario runs per user (closed loop) or in total (open loop)
+            think_time: (min, max) seconds of pause after each scenario, closed loop
+            arrival_rate: Scenario starts per second; switches to open loop
+            seed: Seed for scenario choice, think time and arrivals
+        """
+        kinds = {inspect.iscoroutinefunction(s.func) for s in scenarios}
+        if not scenarios or len(kinds) > 1:
+            raise ValueError("Scenarios must be all plain functions or all coroutine functions")
+        if any(s.weight <= 0 for s in scenarios):
+            raise ValueError("Scenario weights must be positive")
+
+        self.scenarios = scenarios
+        self.client_factory = client_factory
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration if duration is not None or iterations else 60.0
+        self.iterations = iterations
+        self.think_time = think_time
+        self.arrival_rate = arrival_rate
+        self.is_async = kinds == {True}
+        self.stats = None
+        self._rng = random.Random(seed)
+        self._weights = [s.weight for s in scenarios]
+
+    def run(self) -> LoadStats:
+        """Generate the load and return the collected statistics"""
+        self.stats = LoadStats()
+        if self.is_async:
+            asyncio.run(self._run_async())
+        elif self.arrival_rate:
+            self._run_open()
+        else:
+            self._run_closed()
+        self.stats.stop()
+        return self.stats
+
+    # Shared helpers
+
+    def _deadline(self) -> float:
+        return self.stats.started + self.duration if self.duration else math.inf
+
+    def _pick(self, rng: random.Random) -> Scenario:
+        return rng.choices(self.scenarios, weights=self._weights)[0]
+
+    def _think(self, rng: random.Random, deadline: float) -> float:
+        low, high = self.think_time
+        pause = rng.uniform(low, high) if high else 0.0
+        return max(min(pause, deadline - time.perf_counter()), 0.0)
+
+    def _user_start(self, index: int) -> float:
+        return self.stats.started + self.ramp_up * index / self.users
+
+    def _arrivals(self) -> list:
+        """Scheduled start times of an open-loop run, as absolute perf_counter values"""
+        arrivals = []
+        offset = 0.0
+        step = self.ramp_up / self.users if self.ramp_up else 0.0
+        limit = self.iterations or math.inf
+        while len(arrivals) < limit:
+            # The rate ramps up in one step per user, starting at the first
+            rate = self.arrival_rate
+            if self.ramp_up and offset < self.ramp_up:
+                rate *= (math.floor(offset / step) + 1) / self.users
+            offset += self._rng.expovariate(rate)
+            if self.duration and offset >= self.duration:
+                break
+            arrivals.append(self.stats.started + offset)
+        return arrivals
+
+    def _failed_login(self, client):
+        self.stats.record_scenario("login", 0.0, Exception(f"Login failed for {client.username}"))
+
+    def _new_client(self):
+        client = self.client_factory()
+        client.metrics = self.stats.calls
+        return client
+
+    # Threaded runners (OdooAPIClient)
+
+    def _run_scenario(self, scenario: Scenario, client, scheduled: float = None):
+        start = scheduled if scheduled is not None else time.perf_counter()
+        try:
+            scenario.func(client)
+        except Exception as e:
+            self.stats.record_scenario(scenario.name, time.perf_counter() - start, e)
+            return
+        self.stats.record_scenario(scenario.name, time.perf_counter() - start)
+
+    def _login(self):
+        client = self._new_client()
+        if not client.authenticate():
+            self._failed_login(client)
+            return None
+        return client
+
+    def _closed_user(self, index: int, seed: int):
+        rng = random.Random(seed)
+        deadline = self._deadline()
+        time.sleep(max(self._user_start(index) - time.perf_counter(), 0.0))
+        client = self._login()
+        if client is None:
+            return
+
+        runs = 0
+        while time.perf_counter() < deadline and (self.iterations is None or runs < self.iterations):
+            self._run_scenario(self._pick(rng), client)
+            runs += 1
+            time.sleep(self._think(rng, deadline))
+
+    def _run_closed(self):
+        seeds = [self._rng.random() for _ in range(self.users)]
+        threads = [
+            threading.Thread(target=self._closed_user, args=(i, seeds[i]), daemon=True)
+            for i in range(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _run_open(self):
+        with ThreadPoolExecutor(max_workers=self.users) as executor:
+            clients = queue.Queue()
+            for client in executor.map(lambda _: self._login(), range(self.users)):
+                if client is not None:
+                    clients.put(client)
+            if clients.empty():
+                return
+
+            def serve(scenario, scheduled):
+                client = clients.get()
+                try:
+                    self._run_scenario(scenario, client, scheduled)
+                finally:
+                    clients.put(client)
+
+            # Logging in is not part of the measured load
+            self.stats.started = time.perf_counter()
+            for scheduled in self._arrivals():
+                time.sleep(max(scheduled - time.perf_counter(), 0.0))
+                executor.submit(serve, self._pick(self._rng), scheduled)
+
+    # asyncio runner (AsyncOdooAPIClient)
+
+    async def _run_scenario_async(self, scenario: Scenario, client, scheduled: float = None):
+        start = scheduled if scheduled is not None else time.perf_counter()
+        try:
+            await scenario.func(client)
+        except Exception as e:
+            self.stats.record_scenario(scenario.name, time.perf_counter() - start, e)
+            return
+        self.stats.record_scenario(scenario.name, time.perf_counter() - start)
+
+    async def _login_async(self, clients: list):
+        client = self._new_client()
+        clients.append(client)
+        if not await client.authenticate():
+            self._failed_login(client)
+            return None
+        return client
+
+    async def _closed_user_async(self, index: int, seed: int, clients: list):
+        rng = random.Random(seed)
+        deadline = self._deadline()
+        await asyncio.sleep(max(self._user_start(index) - time.perf_counter(), 0.0))
+        client = await self._login_async(clients)
+        if client is None:
+            return
+
+        runs = 0
+        while time.perf_counter() < deadline and (self.iterations is None or runs < self.iterations):
+            await self._run_scenario_async(self._pick(rng), client)
+            runs += 1
+            await asyncio.sleep(self._think(rng, deadline))
+
+    async def _open_async(self, clients: list):
+        logged_in = await asyncio.gather(*(self._login_async(clients) for _ in range(self.users)))
+        idle = asyncio.Queue()
+        for client in logged_in:
+            if client is not None:
+                idle.put_nowait(client)
+        if idle.empty():
+            return
+
+        async def serve(scenario, scheduled):
+            client = await idle.get()
+            try:
+                await self._run_scenario_async(scenario, client, scheduled)
+            finally:
+                idle.put_nowait(client)
+
+        self.stats.started = time.perf_counter()
+        tasks = []
+        for scheduled in self._arrivals():
+            await asyncio.sleep(max(scheduled - time.perf_counter(), 0.0))
+            tasks.append(asyncio.create_task(serve(self._pick(self._rng), scheduled)))
+        await asyncio.gather(*tasks)
+
+    async def _run_async(self):
+        clients = []
+        try:
+            if self.arrival_rate:
+                await self._open_async(clients)
+            else:
+                seeds = [self._rng.random() for _ in range(self.users)]
+                await asyncio.gather(*(
+                    self._closed_user_async(i, seeds[i], clients) for i in range(self.users)
+                ))
+        finally:
+            for client in clients:
+                await client.close()
+
+
+# Default scenarios, mirroring the phase 7 test plan
+
+PRODUCT_DOMAIN = [["sale_ok", "=", True]]
+
+
+def login(client):
+    client.authenticate()
+
+
+def create_sale_order(client):
+    partner_ids = client.search("res.partner", [], limit=1)
+    product_ids = client.search("product.product", PRODUCT_DOMAIN, limit=1)
+    client.create("sale.order", {
+        "partner_id": partner_ids[0],
+        "order_line": [[0, 0, {"product_id": product_ids[0], "product_uom_qty": 1}]],
+    })
+
+
+def search_products(client):
+    client.search("product.product", PRODUCT_DOMAIN, fields=["name", "list_price"], limit=80)
+
+
+def list_sale_orders(client):
+    client.search("sale.order", [], fields=["name", "partner_id", "amount_total", "state"],
+                  limit=100, order="id desc")
+
+
+async def login_async(client):
+    await client.authenticate()
+
+
+async def create_sale_order_async(client):
+    partner_ids, product_ids = await asyncio.gather(
+        client.search("res.partner", [], limit=1),
+        client.search("product.product", PRODUCT_DOMAIN, limit=1),
+    )
+    await client.create("sale.order", {
+        "partner_id": partner_ids[0],
+        "order_line": [[0, 0, {"product_id": product_ids[0], "product_uom_qty": 1}]],
+    })
+
+
+async def search_products_async(client):
+    await client.search("product.product", PRODUCT_DOMAIN, fields=["name", "list_price"], limit=80)
+
+
+async def list_sale_orders_async(client):
+    await client.search("sale.order", [], fields=["name", "partner_id", "amount_total", "state"],
+                        limit=100, order="id desc")
+
+
+DEFAULT_SCENARIOS = [
+    Scenario("login", 1, login),
+    Scenario("create sale order", 2, create_sale_order),
+    Scenario("search products", 5, search_products),
+    Scenario("list sale orders", 2, list_sale_orders),
+]
+
+DEFAULT_ASYNC_SCENARIOS = [
+    Scenario("login", 1, login_async),
+    Scenario("create sale order", 2, create_sale_order_async),
+    Scenario("search products", 5, search_products_async),
+    Scenario("list sale orders", 2, list_sale_orders_async),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Odoo URL (defaults to a local stub server)")
+    parser.add_argument("--db", default="stub")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="seconds")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--iterations", type=int,
+                        help="scenario runs per user (closed loop) or in total (open loop)")
+    parser.add_argument("--think-time", type=float, nargs=2, default=(0.0, 0.0),
+                        metavar=("MIN", "MAX"), help="seconds between scenarios per user")
+    parser.add_argument("--rate", type=float, help="open loop: scenario starts per second")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="use AsyncOdooAPIClient")
+    parser.add_argument("--latency", type=float, default=0.005,
+                        help="simulated stub server latency in seconds")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    client_class = AsyncOdooAPIClient if args.use_async else OdooAPIClient
+    scenarios = DEFAULT_ASYNC_SCENARIOS if args.use_async else DEFAULT_SCENARIOS
+
+    def run(url):
+        load = OdooLoadTest(
+            scenarios,
+            lambda: client_class(url, args.db, args.username, args.password),
+            users=args.users, ramp_up=args.ramp_up,
+            duration=None if args.iterations else args.duration,
+            iterations=args.iterations, think_time=tuple(args.think_time),
+            arrival_rate=args.rate, seed=args.seed
+        )
+        return load.run()
+
+    if args.url:
+        stats = run(args.url)
+    else:
+        with OdooStubServer(latency=args.latency).load_fixtures() as server:
+            stats = run(server.url)
+
+    print(stats.report())
+    for message in stats.error_samples:
+        print(f"error: {message}")
+
+
+if __name__ == "__main__":
+    main()
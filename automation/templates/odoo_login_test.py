@@ -6,41 +6,47 @@ This template provides a reusable login test for Odoo applications.
 import pytest
 from playwright.sync_api import Page, expect
 
+from odoo_api_test import OdooAPIClient
+from odoo_fixtures import login_with_stored_session
+
 
 class OdooLoginTest:
     """Base class for Odoo login tests"""
     
-    # Configuration - Update these for your Odoo instance
-    ODOO_URL = "http://localhost:8069"
-    DATABASE = "your_database"
-    USERNAME = "admin"
-    PASSWORD = "admin"
+    # Configuration - Set these to override the ODOO_URL, ODOO_DB, ODOO_USER
+    # and ODOO_PASSWORD environment settings for a subclass's tests
+    ODOO_URL = None
+    DATABASE = None
+    USERNAME = None
+    PASSWORD = None
+    
+    def login_settings(self, odoo_settings: dict) -> dict:
+        """odoo_settings with this class's non-None overrides applied"""
+        overrides = {"url": self.ODOO_URL, "db": self.DATABASE,
+                     "username": self.USERNAME, "password": self.PASSWORD}
+        return dict(odoo_settings, **{k: v for k, v in overrides.items() if v is not None})
     
     @pytest.fixture(scope="function")
-    def login(self, page: Page):
+    def login(self, page: Page, request, odoo_session_store, odoo_settings):
         """
         Fixture to handle Odoo login before each test
         Usage: Add 'login' parameter to your test function
-        """
-        # Navigate to Odoo login page
-        page.goto(self.ODOO_URL)
-        
-        # Wait for login form to load
-        page.wait_for_selector("input[name='login']")
         
-        # Fill in login credentials
-        page.fill("input[name='login']", self.USERNAME)
-        page.fill("input[name='password']", self.PASSWORD)
-        
-        # Click login button
-        page.click("button[type='submit']")
-        
-        # Wait for successful login (main menu should appear)
-        page.wait_for_selector(".o_main_navbar", timeout=10000)
+        The session cookie saved by the shared session store is reused, so
+        the server-side login runs once per run instead of once per test.
+        """
+        settings = self.login_settings(odoo_settings)
+        if settings == odoo_settings:
+            odoo_api = request.getfixturevalue("odoo_api")
+        else:
+            # Another server, database or user than the shared client's
+            odoo_api = OdooAPIClient(session_store=odoo_session_store, **settings)
+            assert odoo_api.authenticate(), "Odoo authentication failed"
+        login_with_stored_session(page, odoo_api, odoo_session_store, settings)
         
         yield page
         
-        # Logout after test (optional)
+        # Logout after test (optional - this ends the shared session)
         # page.click(".o_user_menu")
         # page.click("a[data-menu='logout']")
 
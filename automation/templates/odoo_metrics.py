@@ -0,0 +1,284 @@
+"""
+Odoo Metrics - Latency histograms for every JSON-RPC call
+OdooAPIClient and AsyncOdooAPIClient record each request into an
+OdooMetrics registry: an HDR-style latency histogram, payload byte counts
+and error counts per (model, method). The pytest plugin prints the table
+at the end of the session and can write it as JSON to compare runs.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Values below 2**SUB_BUCKET_BITS microseconds get one bucket each; above
+# that every power of two is split in half as many buckets, which bounds
+# the relative error of any percentile to 1 / 2**(SUB_BUCKET_BITS - 1).
+SUB_BUCKET_BITS = 7
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_HALF = _SUB_BUCKETS >> 1
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return _SUB_BUCKETS + (shift - 1) * _HALF + (value >> shift) - _HALF
+
+
+def _bucket_upper(index: int) -> int:
+    """Highest value that falls into bucket index"""
+    if index < _SUB_BUCKETS:
+        return index
+    shift, offset = divmod(index - _SUB_BUCKETS, _HALF)
+    shift += 1
+    return ((offset + _HALF + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of latencies in microseconds
+
+    Memory depends on the range of latencies seen, not the number of
+    samples, so it can stay on for whole suites and long load tests.
+    Histograms from several runs or xdist workers can be merged.
+    """
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def record(self, seconds: float):
+        value = max(int(seconds * 1_000_000), 0)
+        index = _bucket_index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, pct: float) -> float:
+        """Latency in seconds at the given percentile (0-100)"""
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(pct / 100 * self.count), 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(_bucket_upper(index), self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds"""
+        return self.total / self.count / 1_000_000 if self.count else 0.0
+
+    def merge(self, other: "LatencyHistogram"):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_us": self.total,
+            "min_us": self.min,
+            "max_us": self.max,
+            "buckets": {str(index): count for index, count in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.buckets = {int(index): count for index, count in data["buckets"].items()}
+        histogram.count = data["count"]
+        histogram.total = data["total_us"]
+        histogram.min = data["min_us"]
+        histogram.max = data["max_us"]
+        return histogram
+
+
+class _CallStats:
+    __slots__ = ("latency", "errors", "request_bytes", "response_bytes")
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class OdooMetrics:
+    """
+    Thread-safe per-(model, method) call statistics
+
+    Requests that are not model calls are recorded under a pseudo model:
+    ("session", "authenticate") for logins and ("batch", "call_kw") for
+    JSON-RPC batch arrays.
+
+    Usage:
+        metrics = OdooMetrics()
+        client = OdooAPIClient(url, db, user, password, metrics=metrics)
+        ...
+        print(metrics.report())
+        metrics.write_json("test-results/odoo-metrics.json")
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, method: str, seconds: float, request_bytes: int = 0,
+               response_bytes: int = 0, error: bool = False):
+        """Add one request to the (model, method) statistics"""
+        with self._lock:
+            stats = self._stats.get((model, method))
+            if stats is None:
+                stats = self._stats[(model, method)] = _CallStats()
+            stats.latency.record(seconds)
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            if error:
+                stats.errors += 1
+
+    @contextmanager
+    def measure(self, model: str, method: str):
+        """Time the block, counting it as an error if it raises"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.record(model, method, time.perf_counter() - start, error=True)
+            raise
+        self.record(model, method, time.perf_counter() - start)
+
+    def histogram(self, model: str, method: str) -> LatencyHistogram:
+        """Latency histogram for one (model, method), empty if never called"""
+        stats = self._stats.get((model, method))
+        return stats.latency if stats else LatencyHistogram()
+
+    def __bool__(self):
+        return bool(self._stats)
+
+    def summary(self) -> list:
+        """
+        Per-(model, method) statistics sorted by total time spent
+
+        Returns:
+            List of dicts with model, method, count, errors, request and
+            response bytes, and mean/p50/p95/p99/max latency in milliseconds
+        """
+        with self._lock:
+            items = list(self._stats.items())
+
+        rows = []
+        for (model, method), stats in items:
+            latency = stats.latency
+            rows.append({
+                "model": model,
+                "method": method,
+                "count": latency.count,
+                "errors": stats.errors,
+                "request_bytes": stats.request_bytes,
+                "response_bytes": stats.response_bytes,
+                "total_ms": latency.total / 1000,
+                "mean_ms": latency.mean * 1000,
+                "p50_ms": latency.percentile(50) * 1000,
+                "p95_ms": latency.percentile(95) * 1000,
+                "p99_ms": latency.percentile(99) * 1000,
+                "max_ms": (latency.max or 0) / 1000,
+            })
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+
+    def report(self) -> str:
+        """Summary as a plain-text table"""
+        lines = [
+            f"{'Model.method':<40} {'Calls':>7} {'Errors':>6} {'p50 ms':>8} {'p95 ms':>8} "
+            f"{'p99 ms':>8} {'Max ms':>8} {'Sent KB':>9} {'Recv KB':>9}",
+            "-" * 111,
+        ]
+        for row in self.summary():
+            lines.append(
+                f"{row['model'] + '.' + row['method']:<40} {row['count']:>7} {row['errors']:>6} "
+                f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} "
+                f"{row['max_ms']:>8.1f} {row['request_bytes'] / 1024:>9.1f} "
+                f"{row['response_bytes'] / 1024:>9.1f}"
+            )
+        return "\n".join(lines)
+
+    def merge(self, other: "OdooMetrics"):
+        """Add another registry's statistics (e.g. from an xdist worker)"""
+        with other._lock:
+            items = list(other._stats.items())
+        with self._lock:
+            self.started = min(self.started, other.started)
+            for key, theirs in items:
+                ours = self._stats.get(key)
+                if ours is None:
+                    ours = self._stats[key] = _CallStats()
+                ours.latency.merge(theirs.latency)
+                ours.errors += theirs.errors
+                ours.request_bytes += theirs.request_bytes
+                ours.response_bytes += theirs.response_bytes
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form with full histograms and summary rows"""
+        with self._lock:
+            calls = [
+                {
+                    "model": model,
+                    "method": method,
+                    "errors": stats.errors,
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "latency": stats.latency.to_dict(),
+                }
+                for (model, method), stats in sorted(self._stats.items())
+            ]
+        return {
+            "started": self.started,
+            "sub_bucket_bits": SUB_BUCKET_BITS,
+            "calls": calls,
+            "summary": self.summary(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "OdooMetrics":
+        if data.get("sub_bucket_bits", SUB_BUCKET_BITS) != SUB_BUCKET_BITS:
+            raise ValueError("Histogram layout differs from this version of odoo_metrics")
+        metrics = cls()
+        metrics.started = data["started"]
+        for call in data["calls"]:
+            stats = metrics._stats[(call["model"], call["method"])] = _CallStats()
+            stats.latency = LatencyHistogram.from_dict(call["latency"])
+            stats.errors = call["errors"]
+            stats.request_bytes = call["request_bytes"]
+            stats.response_bytes = call["response_bytes"]
+        return metrics
+
+    def write_json(self, path: str):
+        """Write to_dict() to path atomically"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load_json(cls, path: str) -> "OdooMetrics":
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
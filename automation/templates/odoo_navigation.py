@@ -0,0 +1,107 @@
+"""
+Odoo Navigation - Direct action URLs instead of click-through menus
+Resolves a menu path like ['Sales', 'Orders', 'Quotations'] to its window
+action once through the API and caches the mapping on disk per database.
+"""
+
+import json
+import os
+from pathlib import Path
+
+
+class OdooMenuResolver:
+    """
+    Maps menu paths to action deep links
+
+    Usage:
+        resolver = OdooMenuResolver(odoo_client)
+        page.goto(resolver.url(["Sales", "Orders", "Quotations"]))
+    """
+
+    def __init__(self, client, cache_dir: str = None):
+        """
+        Args:
+            client: Authenticated OdooAPIClient
+            cache_dir: Directory for the menu cache (defaults to
+                $ODOO_CACHE_DIR or .odoo_cache)
+        """
+        self.client = client
+        directory = Path(cache_dir or os.getenv("ODOO_CACHE_DIR", ".odoo_cache"))
+        directory.mkdir(parents=True, exist_ok=True)
+        self.cache_file = directory / f"menus_{client.db}.json"
+        self._entries = self._load()
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        tmp_path = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._entries, indent=2))
+        os.replace(tmp_path, self.cache_file)
+
+    @staticmethod
+    def _key(menu_path: list) -> str:
+        return " / ".join(menu_path)
+
+    def resolve(self, menu_path: list) -> dict:
+        """
+        Return the cached action for a menu path, looking it up on a miss
+
+        Returns:
+            Dictionary with menu_id, action_id, model and view_type
+        """
+        key = self._key(menu_path)
+        if key not in self._entries:
+            self._entries[key] = self._lookup(menu_path)
+            self._save()
+        return self._entries[key]
+
+    def invalidate(self, menu_path: list):
+        """Forget a cached mapping (e.g., after the database was rebuilt)"""
+        if self._entries.pop(self._key(menu_path), None) is not None:
+            self._save()
+
+    def url(self, menu_path: list) -> str:
+        """Deep link that opens the menu's action directly"""
+        entry = self.resolve(menu_path)
+        url = f"{self.client.url}/web#action={entry['action_id']}&menu_id={entry['menu_id']}"
+        if entry["model"]:
+            url += f"&model={entry['model']}&view_type={entry['view_type']}"
+        return url
+
+    def _lookup(self, menu_path: list) -> dict:
+        parent_id = False
+        menu = None
+        for name in menu_path:
+            menus = self.client.search_read(
+                "ir.ui.menu",
+                [["name", "=", name], ["parent_id", "=", parent_id]],
+                ["action"],
+                limit=1
+            )
+            if not menus:
+                raise LookupError(f"Menu not found: {self._key(menu_path)} (at '{name}')")
+            menu = menus[0]
+            parent_id = menu["id"]
+
+        if not menu["action"]:
+            raise LookupError(f"Menu has no action: {self._key(menu_path)}")
+
+        # Reference fields come back as "ir.actions.act_window,123"
+        action_model, action_id = menu["action"].split(",")
+        entry = {
+            "menu_id": menu["id"],
+            "action_id": int(action_id),
+            "model": None,
+            "view_type": None,
+        }
+        if action_model == "ir.actions.act_window":
+            action = self.client.read(action_model, [int(action_id)], ["res_model", "view_mode"])[0]
+            entry["model"] = action["res_model"]
+            view_type = action["view_mode"].split(",")[0]
+            # Older versions call the list view "tree" in view_mode
+            entry["view_type"] = "list" if view_type == "tree" else view_type
+        return entry
@@ -0,0 +1,123 @@
+"""
+Odoo Record Cache - Read-through cache for OdooAPIClient
+Keeps reference data (partners, products, UoMs...) in memory so repeated
+reads do not cost a network round trip each time.
+"""
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+
+# Methods that never modify data; any other call invalidates the model
+READ_ONLY_METHODS = {
+    "read", "search", "search_read", "search_count", "name_search", "name_get",
+    "fields_get", "read_group", "default_get", "check_access_rights",
+}
+
+_MISSING = object()
+
+
+class OdooRecordCache:
+    """
+    Bounded LRU cache with per-model TTL
+
+    Usage:
+        cache = OdooRecordCache(max_size=2048, ttl=300, model_ttls={"res.partner": 60})
+        client = OdooAPIClient(url, db, user, password, cache=cache)
+        ...
+        print(cache.stats())
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300.0, model_ttls: dict = None):
+        """
+        Args:
+            max_size: Maximum number of cached results
+            ttl: Default time-to-live in seconds
+            model_ttls: Per-model TTL overrides (0 disables caching for that model)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.model_ttls = model_ttls or {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, ids, fields: list = None, context: dict = None) -> tuple:
+        """
+        Build a cache key from (model, ids, fields, context)
+
+        ids may be a list of record IDs or any JSON-serializable query
+        description (e.g. a search_read domain with paging arguments).
+        """
+        return (
+            model,
+            json.dumps(ids, sort_keys=True, default=str),
+            tuple(sorted(fields)) if fields else None,
+            json.dumps(context, sort_keys=True, default=str) if context else None,
+        )
+
+    def get(self, key: tuple, default=None):
+        """Return a copy of the cached value, or default on miss/expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        # Callers may mutate returned records; never hand out the cached object
+        return copy.deepcopy(value)
+
+    def put(self, key: tuple, value):
+        """Store a value, evicting the least recently used entries if needed"""
+        ttl = self.model_ttls.get(key[0], self.ttl)
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_fetch(self, key: tuple, fetch):
+        """Return the cached value for key, calling fetch() on a miss"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = fetch()
+            self.put(key, value)
+        return value
+
+    def invalidate(self, model: str = None):
+        """Drop cached entries for one model, or everything if model is None"""
+        with self._lock:
+            if model is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == model]:
+                del self._entries[key]
+
+    def invalidate_for_call(self, model: str, method: str):
+        """Invalidate model unless method is known to be read-only"""
+        if method not in READ_ONLY_METHODS:
+            self.invalidate(model)
+
+    def stats(self) -> dict:
+        """Hit/miss counters for confirming the cache pays off"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
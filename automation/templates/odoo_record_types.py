@@ -0,0 +1,139 @@
+"""
+Odoo Record Types - Compact __slots__ classes for large scans
+Generates one class per (model, fields) signature on first use and caches
+it. Instances carry only their values: no per-row dict and no repeated
+key strings, which keeps million-row iter_search exports small in memory.
+"""
+
+import keyword
+import threading
+
+_CLASSES = {}
+_LOCK = threading.Lock()
+
+
+def _class_name(model: str) -> str:
+    return "".join(part.capitalize() for part in model.replace("_", ".").split(".")) + "Record"
+
+
+def _is_attribute(field: str) -> bool:
+    # Public identifiers only: slots and _-prefixed helpers must not collide
+    return field.isidentifier() and not keyword.iskeyword(field) and not field.startswith("_")
+
+
+def _rebuild(model: str, fields: tuple, values: tuple):
+    # Pickle support: generated classes are not importable by name
+    return record_class(model, fields)(*values)
+
+
+class _RecordBase:
+    __slots__ = ()
+
+    def __getitem__(self, field: str):
+        try:
+            return getattr(self, field)
+        except AttributeError:
+            raise KeyError(field) from None
+
+    def __iter__(self):
+        return (getattr(self, field) for field in self._fields)
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            return self._asdict() == other
+        if isinstance(other, _RecordBase):
+            return self._model == other._model and self._asdict() == other._asdict()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return _rebuild, (self._model, self._fields, tuple(self))
+
+    def __repr__(self):
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def _asdict(self) -> dict:
+        return {field: getattr(self, field) for field in self._fields}
+
+
+def record_class(model: str, fields) -> type:
+    """
+    Return the cached record class for (model, fields), creating it once
+
+    Instances expose fields as attributes and also support record["field"]
+    so code written for dicts keeps working. Helper names follow
+    namedtuple's underscore convention to stay clear of Odoo field names.
+
+    Args:
+        model: Odoo model name (e.g. 'sale.order.line')
+        fields: Field names; 'id' is added first if missing
+
+    Returns:
+        Class with __slots__ = fields and a _from_dict(record) constructor
+    """
+    fields = tuple(fields)
+    if "id" not in fields:
+        fields = ("id",) + fields
+    key = (model, fields)
+
+    with _LOCK:
+        cls = _CLASSES.get(key)
+        if cls is not None:
+            return cls
+
+        for field in fields:
+            if not _is_attribute(field):
+                raise ValueError(f"Field '{field}' cannot be used as a record attribute")
+
+        # Generated like namedtuple's __new__: plain attribute stores, no loops
+        args = ", ".join(fields)
+        source = (
+            f"def __init__(self, {args}):\n"
+            + "".join(f"    self.{field} = {field}\n" for field in fields)
+            + "def _from_dict(cls, record):\n"
+            + "    get = record.get\n"
+            + f"    return cls({', '.join(f'get({field!r}, False)' for field in fields)})\n"
+        )
+        namespace = {}
+        exec(source, namespace)
+
+        cls = type(_class_name(model), (_RecordBase,), {
+            "__slots__": fields,
+            "__init__": namespace["__init__"],
+            "_from_dict": classmethod(namespace["_from_dict"]),
+            "_model": model,
+            "_fields": fields,
+        })
+        _CLASSES[key] = cls
+        return cls
+
+
+def to_records(model: str, records, fields=None):
+    """
+    Convert record dictionaries to compact records one at a time
+
+    Equal many2one values ([id, "Name"]) are shared between the records
+    of one conversion instead of repeated per row, so treat them as
+    read-only.
+
+    Args:
+        model: Odoo model name
+        records: Iterable of record dictionaries
+        fields: Field names (defaults to the keys of the first record
+            that can be attributes, so e.g. the __last_update that
+            Odoo 16 and older add to every read is dropped)
+
+    Yields:
+        Instances of record_class(model, fields)
+    """
+    cls = None
+    many2ones = {}
+    for record in records:
+        if cls is None:
+            cls = record_class(model, fields or [f for f in record if _is_attribute(f)])
+        for field, value in record.items():
+            if type(value) is list and len(value) == 2 and type(value[1]) is str:
+                record[field] = many2ones.setdefault((value[0], value[1]), value)
+        yield cls._from_dict(record)
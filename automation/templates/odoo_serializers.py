@@ -0,0 +1,165 @@
+"""
+Odoo Serializers - Pluggable JSON encoding for the API clients
+Uses the fastest installed backend (orjson, then ujson, then the stdlib
+json module) and can stream a JSON-RPC "result" array record by record
+with ijson, so huge reads are never held as raw text and parsed objects
+at the same time.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+class StreamedError(Exception):
+    """A streamed response carried a JSON-RPC error instead of a result"""
+
+    def __init__(self, error):
+        super().__init__(error)
+        self.error = error
+
+
+class JSONSerializer:
+    """Standard library json (always available)"""
+
+    name = "json"
+
+    @staticmethod
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    @staticmethod
+    def loads(data):
+        return json.loads(data)
+
+
+class OrjsonSerializer:
+    """orjson: Rust implementation, returns bytes directly"""
+
+    name = "orjson"
+
+    @staticmethod
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    @staticmethod
+    def loads(data):
+        return orjson.loads(data)
+
+
+class UjsonSerializer:
+    """ujson: C implementation"""
+
+    name = "ujson"
+
+    @staticmethod
+    def dumps(obj) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False).encode()
+
+    @staticmethod
+    def loads(data):
+        return ujson.loads(data)
+
+
+SERIALIZERS = {
+    "orjson": (OrjsonSerializer, lambda: orjson is not None),
+    "ujson": (UjsonSerializer, lambda: ujson is not None),
+    "json": (JSONSerializer, lambda: True),
+}
+
+
+def get_serializer(serializer=None):
+    """
+    Resolve a serializer
+
+    Args:
+        serializer: None for the fastest installed backend, a backend name
+            ("orjson", "ujson", "json"), or an object with dumps()/loads()
+
+    Returns:
+        Serializer whose dumps() returns bytes and loads() accepts bytes
+    """
+    if serializer is None:
+        return next(cls for cls, available in SERIALIZERS.values() if available())
+    if not isinstance(serializer, str):
+        return serializer
+    if serializer not in SERIALIZERS:
+        raise ValueError(f"Unknown serializer '{serializer}' (choose from {', '.join(SERIALIZERS)})")
+    cls, available = SERIALIZERS[serializer]
+    if not available():
+        raise ImportError(f"Serializer '{serializer}' is not installed")
+    return cls
+
+
+def stream_result(fileobj):
+    """
+    Incrementally parse a JSON-RPC response whose result is an array
+
+    Args:
+        fileobj: Binary file-like object with the response body, e.g.
+            requests' response.raw with decode_content enabled
+
+    Yields:
+        One decoded item of the "result" array at a time
+
+    Raises:
+        StreamedError: The response carried an "error" member instead
+        ValueError: The body is not JSON, has neither member, or its
+            "result" is not an array
+    """
+    if ijson is None:
+        raise ImportError("Streaming results requires ijson (pip install ijson)")
+
+    events = ijson.parse(fileobj, use_float=True)
+    try:
+        for prefix, event, value in events:
+            if prefix == "result":
+                if event != "start_array":
+                    raise ValueError(f"Expected a result array, got {event}")
+                yield from _array_items(events, "result.item")
+                return
+            if prefix == "error" and event == "start_map":
+                raise StreamedError(_build(events, event, value))
+    except ijson.JSONError as e:
+        # Same exception type as a failed loads() of a whole body
+        raise ValueError(f"Malformed JSON-RPC response: {e}") from e
+    raise ValueError("JSON-RPC response has neither a result nor an error")
+
+
+def _build(events, event, value):
+    """Build the container that starts with (event, value) from the event stream"""
+    builder = ijson.ObjectBuilder()
+    depth = 0
+    while True:
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+        if depth == 0:
+            return builder.value
+        _, event, value = next(events)
+
+
+def _array_items(events, item_prefix: str):
+    for prefix, event, value in events:
+        if prefix != item_prefix:
+            # end_array of the result itself
+            return
+        if event in ("start_map", "start_array"):
+            yield _build(events, event, value)
+        else:
+            yield value
@@ -0,0 +1,120 @@
+"""
+Odoo Session Store - Share authenticated sessions across tests
+Persists the Odoo session cookie on disk, keyed by (url, db, user), so API
+clients and Playwright contexts authenticate once and reuse the session
+across tests and pytest-xdist workers.
+"""
+
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to best-effort, unlocked access
+    fcntl = None
+
+
+class OdooSessionStore:
+    """
+    On-disk store of Odoo session cookies
+
+    Usage:
+        store = OdooSessionStore()
+        client = OdooAPIClient(url, db, user, password, session_store=store)
+        client.authenticate()  # only hits /web/session/authenticate once
+    """
+
+    def __init__(self, directory: str = None, max_age: float = 8 * 3600):
+        """
+        Args:
+            directory: Where session files live (defaults to $ODOO_SESSION_DIR
+                or .odoo_sessions in the working directory)
+            max_age: Seconds after which a stored session is considered stale
+        """
+        self.directory = Path(directory or os.getenv("ODOO_SESSION_DIR", ".odoo_sessions"))
+        self.max_age = max_age
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str, db: str, user: str) -> Path:
+        digest = hashlib.sha1(f"{url}|{db}|{user}".encode()).hexdigest()[:16]
+        return self.directory / f"session_{digest}.json"
+
+    @contextmanager
+    def lock(self, url: str, db: str, user: str):
+        """Hold an exclusive lock so only one worker authenticates at a time"""
+        lock_path = self._path(url, db, user).with_suffix(".lock")
+        with open(lock_path, "w") as handle:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def load(self, url: str, db: str, user: str):
+        """
+        Return the stored session, or None if missing or older than max_age
+
+        Returns:
+            Dictionary with session_id, uid and created timestamp
+        """
+        path = self._path(url, db, user)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("created", 0) > self.max_age:
+            return None
+        return entry
+
+    def save(self, url: str, db: str, user: str, session_id: str, uid: int):
+        """Atomically write a session so concurrent readers never see a partial file"""
+        path = self._path(url, db, user)
+        entry = {
+            "url": url,
+            "db": db,
+            "user": user,
+            "session_id": session_id,
+            "uid": uid,
+            "created": time.time(),
+        }
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry))
+        os.replace(tmp_path, path)
+        return entry
+
+    def clear(self, url: str, db: str, user: str):
+        """Forget a stored session (e.g., after it expired server-side)"""
+        try:
+            self._path(url, db, user).unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def storage_state(entry: dict) -> dict:
+        """
+        Build a Playwright storage_state from a stored session
+
+        Pass it to browser.new_context(storage_state=...) to start a
+        context that is already logged in.
+        """
+        parsed = urlparse(entry["url"])
+        return {
+            "cookies": [{
+                "name": "session_id",
+                "value": entry["session_id"],
+                "domain": parsed.hostname,
+                "path": "/",
+                "expires": -1,
+                "httpOnly": True,
+                "secure": parsed.scheme == "https",
+                "sameSite": "Lax",
+            }],
+            "origins": [],
+        }
@@ -0,0 +1,287 @@
+"""
+Odoo Shard Plugin - Balanced test shards from recorded durations
+Records how long every test took (setup + call + teardown) in a JSON file
+and uses those durations to split the run into shards of similar total
+time, instead of xdist's round-robin or an even split by test count.
+
+Tests that share login state stay in the same shard, so a session is set
+up once per shard rather than once per worker that happens to get one of
+its tests:
+    - tests marked @pytest.mark.odoo_session("name") share a shard per name
+    - tests using a class- or module-scoped fixture (e.g. a module-scoped
+      logged-in page) share a shard per class or module
+    - an existing xdist_group mark is kept as a group as well
+
+Usage:
+    pytest -n 4 --dist loadgroup          # one balanced shard per xdist worker
+    pytest --odoo-shard=2/3               # run the second of three CI shards
+    pytest --odoo-durations=ci/durations.json
+    python odoo_shard_plugin.py            # merge the shard files afterwards
+
+Loaded as a pytest plugin from conftest.py. Each run updates the durations
+file with the tests it ran; tests without a recorded duration count as the
+average recorded test. A --odoo-shard run never touches the durations file
+every shard plans from, otherwise a shard run after another one on the same
+workspace would split the tests differently and run some twice and others
+never. It records into a per-shard file next to it instead
+(.odoo_durations.shard-2-of-3.json), merged into the durations file once
+all shards are done.
+"""
+
+import argparse
+import heapq
+import json
+import os
+from collections import namedtuple
+from pathlib import Path
+
+import pytest
+
+# Tests that must run in the same shard, with their predicted total time
+ShardGroup = namedtuple("ShardGroup", ["key", "items", "seconds"])
+
+GROUP_PREFIX = "odoo-shard-"
+
+# Predicted time for tests when no duration has been recorded yet
+DEFAULT_SECONDS = 1.0
+
+_PLAN_KEY = pytest.StashKey[str]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("odoo")
+    group.addoption("--odoo-durations", metavar="PATH",
+                    default=os.getenv("ODOO_DURATIONS_FILE", ".odoo_durations.json"),
+                    help="per-test durations used to balance shards "
+                         "(default: $ODOO_DURATIONS_FILE or .odoo_durations.json)")
+    group.addoption("--odoo-shard", metavar="K/N",
+                    help="run only shard K of N (1-based), balanced by recorded durations")
+
+
+def parse_shard(value: str) -> tuple:
+    """Parse 'K/N' into (K, N), validating 1 <= K <= N"""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--odoo-shard expects K/N, got '{value}'") from None
+    if not 1 <= index <= count:
+        raise pytest.UsageError(f"--odoo-shard {value}: K must be between 1 and N")
+    return index, count
+
+
+def load_durations(path: str) -> dict:
+    """Recorded durations by node id ({} when the file is missing or broken)"""
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(path: str, durations: dict):
+    """Merge durations into the file at path, replacing older values"""
+    merged = load_durations(path)
+    merged.update(durations)
+    path = Path(path)
+    if path.parent != Path():
+        path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(merged, indent=1, sort_keys=True))
+    os.replace(tmp_path, path)
+
+
+def shard_durations_path(path: str, index: int, count: int) -> Path:
+    """Where shard index of count records its durations, next to path"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.shard-{index}-of-{count}{path.suffix}")
+
+
+def merge_durations(path: str, sources: list = None) -> list:
+    """
+    Merge per-shard durations files into path and delete them
+
+    Args:
+        path: The durations file shards are planned from
+        sources: Shard files (default: every shard file next to path)
+
+    Returns:
+        The merged shard file paths
+    """
+    path = Path(path)
+    if sources is None:
+        sources = sorted(path.parent.glob(f"{path.stem}.shard-*-of-*{path.suffix}"))
+    merged = {}
+    for source in sources:
+        merged.update(load_durations(source))
+    if merged:
+        save_durations(path, merged)
+    for source in sources:
+        Path(source).unlink(missing_ok=True)
+    return [str(source) for source in sources]
+
+
+def session_group(item) -> str:
+    """Key of the tests item must share a shard with (its own node id if none)"""
+    marker = item.get_closest_marker("odoo_session")
+    if marker is not None:
+        return f"session:{marker.args[0] if marker.args else 'default'}"
+
+    marker = item.get_closest_marker("xdist_group")
+    if marker is not None:
+        return f"group:{marker.kwargs.get('name', marker.args[0] if marker.args else '')}"
+
+    # A class or module fixture is set up once per worker that runs any of its tests
+    fixtureinfo = getattr(item, "_fixtureinfo", None)
+    scopes = set()
+    for name in getattr(item, "fixturenames", ()):
+        fixturedefs = fixtureinfo.name2fixturedefs.get(name) if fixtureinfo else None
+        if fixturedefs:
+            scopes.add(fixturedefs[-1].scope)
+    for scope, node_type in (("package", pytest.Package), ("module", pytest.Module),
+                             ("class", pytest.Class)):
+        node = item.getparent(node_type) if scope in scopes else None
+        if node is not None:
+            return f"{scope}:{node.nodeid}"
+    return item.nodeid
+
+
+def build_groups(items: list, durations: dict) -> list:
+    """
+    Group items by session_group() and predict each group's total time
+
+    Returns:
+        ShardGroup list in first-collected order; items keep their
+        collection order within a group
+    """
+    known = [durations[item.nodeid] for item in items if item.nodeid in durations]
+    default = sum(known) / len(known) if known else DEFAULT_SECONDS
+
+    members = {}
+    for item in items:
+        members.setdefault(session_group(item), []).append(item)
+    return [
+        ShardGroup(key, group, sum(durations.get(item.nodeid, default) for item in group))
+        for key, group in members.items()
+    ]
+
+
+def plan_shards(groups: list, count: int) -> list:
+    """
+    Split groups into count shards with the longest-processing-time rule
+
+    Groups are placed longest first, each on the currently shortest shard,
+    which keeps the longest shard (the run's makespan) within 4/3 of the
+    best possible split.
+
+    Returns:
+        List of count (seconds, [ShardGroup, ...]) tuples
+    """
+    heap = [(0.0, index) for index in range(count)]
+    shards = [[] for _ in range(count)]
+    totals = [0.0] * count
+    for group in sorted(groups, key=lambda g: (-g.seconds, g.key)):
+        total, index = heapq.heappop(heap)
+        shards[index].append(group)
+        totals[index] = total + group.seconds
+        heapq.heappush(heap, (totals[index], index))
+    return list(zip(totals, shards))
+
+
+def _describe(plan: list, selected: int = None) -> str:
+    longest = max(seconds for seconds, _ in plan)
+    ideal = sum(seconds for seconds, _ in plan) / len(plan)
+    parts = [f"{len(plan)} shards, predicted {longest:.1f}s (ideal {ideal:.1f}s)"]
+    if selected is not None:
+        seconds, groups = plan[selected - 1]
+        tests = sum(len(group.items) for group in groups)
+        parts.append(f"running shard {selected}: {tests} tests, {seconds:.1f}s")
+    return "; ".join(parts)
+
+
+def pytest_configure(config):
+    path = config.getoption("odoo_durations")
+    if config.getoption("odoo_shard"):
+        # Later shards must plan from the same durations as this one
+        path = shard_durations_path(path, *parse_shard(config.getoption("odoo_shard")))
+    # xdist forwards every worker report to the controller, which records them all
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(path), "odoo_duration_recorder")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Runs before xdist turns xdist_group marks into @group node id suffixes
+    option = config.getoption("odoo_shard")
+    workerinput = getattr(config, "workerinput", None)
+    loadgroup = workerinput is not None and config.getoption("dist", None) == "loadgroup"
+    if not items or not (option or loadgroup):
+        return
+
+    durations = load_durations(config.getoption("odoo_durations"))
+    groups = build_groups(items, durations)
+
+    if option:
+        index, count = parse_shard(option)
+        plan = plan_shards(groups, count)
+        keep = {id(item) for group in plan[index - 1][1] for item in group.items}
+        config.hook.pytest_deselected(items=[item for item in items if id(item) not in keep])
+        items[:] = [item for item in items if id(item) in keep]
+        config.stash[_PLAN_KEY] = _describe(plan, index)
+        if not loadgroup:
+            return
+        groups = build_groups(items, durations)
+
+    # Every worker collects the same items and durations, so all of them
+    # compute the same plan; loadgroup then sends one shard to each worker
+    plan = plan_shards(groups, workerinput["workercount"])
+    for number, (_, shard_groups) in enumerate(plan, 1):
+        mark = pytest.mark.xdist_group(name=f"{GROUP_PREFIX}{number}")
+        for group in shard_groups:
+            for item in group.items:
+                item.add_marker(mark, append=False)
+
+
+class DurationRecorder:
+    """Sums setup, call and teardown time per test and saves them at the end"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.durations = {}
+        self.skipped = set()
+
+    def pytest_runtest_logreport(self, report):
+        # Under loadgroup, xdist reports carry an @odoo-shard-N suffix
+        nodeid = report.nodeid.split(f"@{GROUP_PREFIX}")[0]
+        if report.skipped and report.when in ("setup", "call"):
+            self.skipped.add(nodeid)
+        self.durations[nodeid] = self.durations.get(nodeid, 0.0) + report.duration
+
+    def pytest_sessionfinish(self, session):
+        durations = {nodeid: round(seconds, 3) for nodeid, seconds in self.durations.items()
+                     if nodeid not in self.skipped}
+        if durations:
+            save_durations(self.path, durations)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    plan = config.stash.get(_PLAN_KEY, None)
+    if plan:
+        terminalreporter.write_sep("=", "Odoo shards")
+        terminalreporter.write_line(plan)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge per-shard durations files "
+                                                 "into the durations file shards plan from")
+    parser.add_argument("shard_files", nargs="*",
+                        help="shard files to merge (default: all next to --durations)")
+    parser.add_argument("--durations",
+                        default=os.getenv("ODOO_DURATIONS_FILE", ".odoo_durations.json"),
+                        help="durations file (default: $ODOO_DURATIONS_FILE or .odoo_durations.json)")
+    args = parser.parse_args()
+
+    merged = merge_durations(args.durations, args.shard_files or None)
+    print(f"Merged {len(merged)} shard file(s) into {args.durations}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Tests for the Odoo pytest plugins: odoo_shard_plugin and how the
+examples load it together with odoo_fixtures
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from odoo_shard_plugin import merge_durations, shard_durations_path
+
+TEMPLATES_DIR = Path(__file__).resolve().parent
+EXAMPLES_DIR = TEMPLATES_DIR.parent / "examples"
+
+
+def run_pytest(*args, cwd):
+    """Run pytest in a subprocess without any ini file from this tree"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [str(TEMPLATES_DIR), os.environ.get("PYTHONPATH")])))
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "no:cacheprovider", *map(str, args)],
+        cwd=cwd, env=env, capture_output=True, text=True, timeout=120
+    )
+
+
+def passed_tests(result) -> set:
+    """Node ids reported PASSED in the -rA short summary"""
+    return set(re.findall(r"^PASSED (\S+)", result.stdout, re.MULTILINE))
+
+
+def test_examples_load_both_plugins(tmp_path):
+    """Test that the examples get the options and fixtures of both plugins"""
+    result = run_pytest(
+        "--setup-plan", "-q", EXAMPLES_DIR,
+        "--no-context-pool", "--context-pool-size", "3",
+        "--odoo-metrics-json", tmp_path / "metrics.json",
+        "--odoo-shard", "1/1", "--odoo-durations", tmp_path / "durations.json",
+        cwd=tmp_path
+    )
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "test_create_and_confirm_sale_order" in result.stdout
+    # Underscore fixtures are registered too, not only star-importable names
+    assert "SETUP    F _odoo_db_reset" in result.stdout
+    assert "SETUP    F pooled_page" in result.stdout
+
+
+def test_shards_are_disjoint_and_complete(tmp_path):
+    """Test that shards run one after another split the tests exactly once"""
+    (tmp_path / "test_many.py").write_text("".join(
+        f"def test_{n}():\n    pass\n\n" for n in range(12)
+    ))
+    # Recorded durations far from the real ones: a shard that rewrote them
+    # would change how the next shard splits the tests
+    durations = tmp_path / "durations.json"
+    durations.write_text(json.dumps({f"test_many.py::test_{n}": 1.0 + n for n in range(12)}))
+    before = durations.read_text()
+
+    runs = []
+    for index in (1, 2, 3):
+        result = run_pytest(
+            "-q", "-rA", "-p", "odoo_shard_plugin", f"--rootdir={tmp_path}",
+            f"--odoo-shard={index}/3", f"--odoo-durations={durations}",
+            cwd=tmp_path
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
+        runs.append(passed_tests(result))
+
+    assert all(runs)
+    assert sum(len(run) for run in runs) == 12
+    assert set().union(*runs) == {f"test_many.py::test_{n}" for n in range(12)}
+    assert durations.read_text() == before
+
+    # Each shard recorded its own tests; merging folds them into the plan file
+    assert shard_durations_path(durations, 2, 3).exists()
+    assert len(merge_durations(durations)) == 3
+    assert not list(tmp_path.glob("durations.shard-*"))
+    assert all(seconds < 1.0 for seconds in json.loads(durations.read_text()).values())
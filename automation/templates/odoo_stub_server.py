@@ -0,0 +1,358 @@
+"""
+Odoo Stub Server - Local JSON-RPC Stand-in
+A tiny in-process server that speaks enough of Odoo's JSON-RPC protocol
+to exercise the API clients without a live Odoo instance.
+"""
+
+import gzip
+import itertools
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _match(record: dict, term) -> bool:
+    """Evaluate a single [field, operator, value] domain term"""
+    field, operator, value = term
+    current = record.get(field)
+    if isinstance(current, list) and current:
+        # many2one values are stored as [id, display_name]
+        current = current[0]
+    if operator == "=":
+        return current == value
+    if operator == "!=":
+        return current != value
+    if operator == ">":
+        return current is not None and current > value
+    if operator == ">=":
+        return current is not None and current >= value
+    if operator == "<":
+        return current is not None and current < value
+    if operator == "<=":
+        return current is not None and current <= value
+    if operator == "in":
+        return current in value
+    if operator == "not in":
+        return current not in value
+    if operator == "ilike":
+        return str(value).lower() in str(current or "").lower()
+    raise ValueError(f"Unsupported domain operator: {operator}")
+
+
+class OdooStubServer:
+    """
+    Threaded HTTP server answering /web/session/authenticate and
+    /web/dataset/call_kw from an in-memory record store
+
+    Usage:
+        with OdooStubServer(latency=0.005).load_fixtures() as server:
+            client = OdooAPIClient(server.url, "stub", "admin", "admin")
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 users: dict = None, accept_batch: bool = False, jitter: float = 0.0,
+                 payload_size: int = 0, denied_models: set = ()):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Seconds of artificial delay added to every request
+            users: Mapping of login to password (defaults to admin/admin)
+            accept_batch: Answer JSON-RPC batch arrays instead of rejecting them
+            jitter: Up to this many extra seconds of random delay per request
+            payload_size: Bytes of filler added to every record returned by
+                read/search_read, to simulate wide records
+            denied_models: Models every call on fails with an AccessError,
+                as for a user without access rights to them
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.payload_size = payload_size
+        self.users = users or {"admin": "admin"}
+        self.accept_batch = accept_batch
+        self.denied_models = set(denied_models)
+        self.records = {}
+        self.request_count = 0
+        self._sessions = set()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def expire_sessions(self):
+        """Forget every session, as after an Odoo restart or session timeout"""
+        with self._lock:
+            self._sessions.clear()
+
+    def load_fixtures(self, partners: int = 100, products: int = 50, orders: int = 200,
+                      lines_per_order: int = 3, seed: int = 0):
+        """
+        Fill the store with res.partner, product.product, sale.order and
+        sale.order.line records shaped like Odoo's
+
+        Returns:
+            self, so it can be chained before start() or a with block
+        """
+        rng = random.Random(seed)
+        with self._lock:
+            partner_table = self.records.setdefault("res.partner", {})
+            product_table = self.records.setdefault("product.product", {})
+            order_table = self.records.setdefault("sale.order", {})
+            line_table = self.records.setdefault("sale.order.line", {})
+
+            partner_ids = [self._create(partner_table, {
+                "name": f"Partner {i:04d}",
+                "email": f"partner{i}@example.com",
+                "phone": f"+1 555 {i:04d}",
+                "city": rng.choice(["Brussels", "Lyon", "Austin", "Pune"]),
+                "is_company": i % 3 == 0,
+                "customer_rank": 1,
+                "active": True,
+            }) for i in range(partners)]
+
+            product_ids = [self._create(product_table, {
+                "name": f"Product {i:04d}",
+                "default_code": f"PRD{i:04d}",
+                "list_price": round(rng.uniform(5, 500), 2),
+                "sale_ok": True,
+                "active": True,
+            }) for i in range(products)]
+
+            for i in range(orders):
+                partner = partner_table[rng.choice(partner_ids)]
+                order_id = self._create(order_table, {
+                    "name": f"S{i + 1:05d}",
+                    "partner_id": [partner["id"], partner["name"]],
+                    "date_order": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 10:00:00",
+                    "state": rng.choice(["draft", "sent", "sale", "cancel"]),
+                    "order_line": [],
+                })
+                total = 0.0
+                for _ in range(lines_per_order if product_ids else 0):
+                    product = product_table[rng.choice(product_ids)]
+                    quantity = rng.randint(1, 10)
+                    subtotal = round(quantity * product["list_price"], 2)
+                    total += subtotal
+                    order_table[order_id]["order_line"].append(self._create(line_table, {
+                        "order_id": [order_id, order_table[order_id]["name"]],
+                        "product_id": [product["id"], product["name"]],
+                        "product_uom_qty": quantity,
+                        "price_unit": product["list_price"],
+                        "price_subtotal": subtotal,
+                    }))
+                order_table[order_id]["amount_total"] = round(total, 2)
+        return self
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    # Request handling
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length)
+                if self.headers.get("Content-Encoding") == "gzip":
+                    raw = gzip.decompress(raw)
+                body = json.loads(raw or b"null")
+                cookies = self.headers.get("Cookie", "")
+                status, response, set_cookie = server._dispatch(self.path, body, cookies)
+                data = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                if set_cookie:
+                    self.send_header("Set-Cookie", f"session_id={set_cookie}; Path=/")
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def _dispatch(self, path: str, body, cookies: str):
+        with self._lock:
+            self.request_count += 1
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        if isinstance(body, list):
+            if not self.accept_batch or path != "/web/dataset/call_kw":
+                # Stock Odoo fails on request.get() and answers without an id
+                return 200, self._error(None, "'list' object has no attribute 'get'",
+                                        name="builtins.AttributeError"), None
+            return 200, [self._call_kw(req, cookies) for req in body], None
+
+        if path == "/web/session/authenticate":
+            return self._authenticate(body)
+        if path == "/web/dataset/call_kw":
+            return 200, self._call_kw(body, cookies), None
+        return 404, self._error(body.get("id"), f"Unknown endpoint {path}"), None
+
+    def _authenticate(self, body: dict):
+        params = body.get("params", {})
+        if self.users.get(params.get("login")) != params.get("password"):
+            return 200, self._error(body.get("id"), "Access Denied"), None
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self._sessions.add(session_id)
+        result = {"uid": 2, "db": params.get("db"), "session_id": session_id}
+        return 200, {"jsonrpc": "2.0", "id": body.get("id"), "result": result}, session_id
+
+    def _call_kw(self, body: dict, cookies: str) -> dict:
+        request_id = body.get("id")
+        if not any(f"session_id={sid}" in cookies for sid in self._sessions):
+            return self._error(request_id, "Session expired", code=100,
+                               name="odoo.http.SessionExpiredException")
+        params = body.get("params", {})
+        if params.get("model") in self.denied_models:
+            return self._error(request_id, f"You are not allowed to access '{params['model']}'",
+                               name="odoo.exceptions.AccessError")
+        try:
+            with self._lock:
+                result = self._execute(params["model"], params["method"],
+                                       params.get("args", []), params.get("kwargs", {}))
+        except Exception as e:
+            return self._error(request_id, str(e))
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    @staticmethod
+    def _error(request_id, message: str, code: int = 200,
+               name: str = "odoo.exceptions.UserError") -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message, "data": {"name": name, "message": message}}
+        }
+
+    # Model methods
+
+    def _execute(self, model: str, method: str, args: list, kwargs: dict):
+        # Called with self._lock held
+        table = self.records.setdefault(model, {})
+
+        if method == "create":
+            values = args[0]
+            if isinstance(values, list):
+                return [self._create(table, vals) for vals in values]
+            return self._create(table, values)
+        if method == "write":
+            ids, values = args
+            for record_id in ids:
+                table[record_id].update(values)
+            return True
+        if method == "unlink":
+            for record_id in args[0]:
+                table.pop(record_id, None)
+            return True
+        if method == "read":
+            return [self._read(table[i], kwargs.get("fields")) for i in args[0] if i in table]
+        if method == "search":
+            return [r["id"] for r in self._search(table, args[0], kwargs)]
+        if method == "search_count":
+            domain = args[0] if args else kwargs.get("domain", [])
+            return len(self._search(table, domain, {}))
+        if method == "search_read":
+            domain = args[0] if args else kwargs.get("domain", [])
+            return [self._read(r, kwargs.get("fields")) for r in self._search(table, domain, kwargs)]
+        if method == "fields_get":
+            return self._fields_get(table)
+        raise ValueError(f"The method '{method}' does not exist on the model '{model}'")
+
+    def _create(self, table: dict, values: dict) -> int:
+        record_id = next(self._ids)
+        table[record_id] = dict(values, id=record_id)
+        return record_id
+
+    def _read(self, record: dict, fields: list = None) -> dict:
+        if not fields:
+            values = dict(record)
+        else:
+            values = {"id": record["id"], **{f: record.get(f, False) for f in fields}}
+        if self.payload_size:
+            values["x_payload"] = "x" * self.payload_size
+        return values
+
+    @staticmethod
+    def _fields_get(table: dict) -> dict:
+        """Field definitions inferred from the values stored so far"""
+        fields = {
+            "id": {"type": "integer", "string": "ID", "store": True},
+            "display_name": {"type": "char", "string": "Display Name", "store": False},
+        }
+        for record in table.values():
+            for name, value in record.items():
+                if name in fields or value is False or value is None:
+                    continue
+                if isinstance(value, bool):
+                    field_type = "boolean"
+                elif isinstance(value, int):
+                    field_type = "integer"
+                elif isinstance(value, float):
+                    field_type = "float"
+                elif isinstance(value, list):
+                    field_type = "many2one" if len(value) == 2 and isinstance(value[1], str) else "one2many"
+                else:
+                    field_type = "char"
+                fields[name] = {"type": field_type, "string": name.replace("_", " ").title(),
+                                "store": True}
+        return fields
+
+    @staticmethod
+    def _search(table: dict, domain: list, kwargs: dict) -> list:
+        if any(isinstance(term, str) for term in domain):
+            raise ValueError("The stub server only supports AND-ed domain terms")
+        records = [r for r in table.values() if all(_match(r, t) for t in domain)]
+
+        for spec in reversed((kwargs.get("order") or "id").split(",")):
+            parts = spec.split()
+            reverse = len(parts) > 1 and parts[1].lower() == "desc"
+            records.sort(key=lambda r: (r.get(parts[0]) is None, r.get(parts[0])), reverse=reverse)
+
+        offset = kwargs.get("offset") or 0
+        limit = kwargs.get("limit")
+        return records[offset:offset + limit if limit else None]
+
+
+if __name__ == "__main__":
+    with OdooStubServer().load_fixtures() as stub:
+        print(f"Odoo stub server listening on {stub.url} (Ctrl+C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,6 @@
+"""
+Pytest configuration for the GitHub Models lessons
+"""
+
+# A setup check script, not a test module: it exits when GITHUB_TOKEN is unset
+collect_ignore = ["test_token.py"]
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Conversation History - Chat history kept under a token budget
+Stores the chat as turns (a user message and the assistant's reply), keeps
+a running token estimate, and drops the oldest whole turns once the
+history no longer fits the budget, so every request stays about the same
+size however long the session runs. Optionally the dropped turns are
+folded into a short summary that is sent in their place; the summary is
+only recomputed when turns are dropped, not on every request.
+
+Usage:
+    history = ConversationHistory(max_tokens=2000)
+    history.add_user("What is a decorator?")
+    completion = client.stream_model(model, messages=history.messages())
+    history.add_assistant(completion.read())
+"""
+
+from prompt_runner import estimate_tokens
+
+# Per-message overhead of the chat format (role, separators)
+MESSAGE_OVERHEAD = 4
+
+SUMMARY_PROMPT = (
+    "Summarize this conversation for your own later reference in at most "
+    "{words} words. Keep names, decisions, numbers and open questions.\n\n"
+    "{summary}{transcript}"
+)
+
+
+def model_summarizer(client, model: str = "gpt-4o-mini", max_tokens: int = 200):
+    """
+    Summarizer that asks a model to fold evicted turns into the summary
+
+    Args:
+        client: GitHubModelsClient
+        model: Model used for summaries (a cheap one is enough)
+        max_tokens: Length limit of the summary
+
+    Returns:
+        Callable(previous_summary, turns) -> str for ConversationHistory
+    """
+    def summarize(previous: str, turns: list) -> str:
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for turn in turns for m in turn)
+        prompt = SUMMARY_PROMPT.format(
+            words=max_tokens * 3 // 4,
+            summary=f"Earlier summary: {previous}\n\n" if previous else "",
+            transcript=transcript,
+        )
+        response = client.call_model(model=model, prompt=prompt, temperature=0,
+                                     max_tokens=max_tokens)
+        return client.get_response_text(response) or previous
+    return summarize
+
+
+class ConversationHistory:
+    """Turn-based chat history with a token budget"""
+
+    def __init__(self, max_tokens: int = 2000, system_prompt: str = None,
+                 summarizer=None, low_water: float = 0.75, count_tokens=estimate_tokens):
+        """
+        Args:
+            max_tokens: Budget for the messages sent with each request
+            system_prompt: Optional system message, always sent first
+            summarizer: Optional callable(previous_summary, turns) -> str,
+                e.g. model_summarizer(client); without one, evicted turns
+                are simply forgotten
+            low_water: With a summarizer, evict down to this fraction of
+                the budget so summaries are made every few turns, not on
+                every request
+            count_tokens: Token estimate for a message's text
+        """
+        self.max_tokens = max_tokens
+        self.summarizer = summarizer
+        self.low_water = low_water
+        self.count_tokens = count_tokens
+        self.system = None
+        self.summary = None
+        self.evicted_turns = 0
+        self.summary_error = None
+        self._system_tokens = 0
+        self._summary_tokens = 0
+        self._turns = []
+        self._turn_tokens = []
+        self._total = 0
+        if system_prompt:
+            self.system = {"role": "system", "content": system_prompt}
+            self._system_tokens = self._tokens(system_prompt)
+
+    def _tokens(self, content: str) -> int:
+        return self.count_tokens(content) + MESSAGE_OVERHEAD
+
+    @property
+    def token_count(self) -> int:
+        """Estimated tokens of messages(), updated as messages are added"""
+        return self._system_tokens + self._summary_tokens + self._total
+
+    def __len__(self):
+        """Number of turns kept"""
+        return len(self._turns)
+
+    def add_user(self, content: str):
+        """Start a new turn with the user's message"""
+        self._append_turn([{"role": "user", "content": content}])
+
+    def add_assistant(self, content: str):
+        """Complete the current turn with the reply, then fit the budget"""
+        message = {"role": "assistant", "content": content}
+        if self._turns and self._turns[-1][-1]["role"] == "user":
+            tokens = self._tokens(content)
+            self._turns[-1].append(message)
+            self._turn_tokens[-1] += tokens
+            self._total += tokens
+        else:
+            self._append_turn([message])
+        self._fit()
+
+    def _append_turn(self, messages: list):
+        tokens = sum(self._tokens(m["content"]) for m in messages)
+        self._turns.append(messages)
+        self._turn_tokens.append(tokens)
+        self._total += tokens
+        self._fit()
+
+    def messages(self) -> list:
+        """Messages to send: system prompt, summary, then the kept turns"""
+        messages = [self.system] if self.system else []
+        if self.summary:
+            messages.append({"role": "system",
+                             "content": f"Summary of the earlier conversation: {self.summary}"})
+        for turn in self._turns:
+            messages.extend(turn)
+        return messages
+
+    def clear(self):
+        """Forget all turns and the summary (the system prompt stays)"""
+        self._turns, self._turn_tokens, self._total = [], [], 0
+        self.summary, self._summary_tokens = None, 0
+
+    def _fit(self):
+        if self.token_count <= self.max_tokens:
+            return
+        target = self.max_tokens * self.low_water if self.summarizer else self.max_tokens
+
+        # Whole turns only, oldest first; the newest turn is always kept
+        evicted = []
+        while len(self._turns) > 1 and self.token_count > target:
+            evicted.append(self._turns.pop(0))
+            self._total -= self._turn_tokens.pop(0)
+        self.evicted_turns += len(evicted)
+
+        if evicted and self.summarizer:
+            try:
+                self.summary = self.summarizer(self.summary, evicted)
+                self.summary_error = None
+            except Exception as e:
+                # Keep the previous summary; the turns are dropped either way
+                self.summary_error = e
+            # A summary longer than asked for must not use up the headroom
+            if self._system_tokens + self._total < target:
+                self._fit_summary(target)
+        if self.token_count > self.max_tokens:
+            # Only the newest turn is left to evict
+            self._fit_summary(self.max_tokens)
+
+    def _fit_summary(self, budget: float):
+        """Cut the summary to what the system prompt and kept turns leave of budget"""
+        room = int(budget) - self._system_tokens - self._total - MESSAGE_OVERHEAD
+        self.summary = self._truncate(self.summary, room)
+        self._summary_tokens = self._tokens(self.summary) if self.summary else 0
+
+    def _truncate(self, text: str, tokens: int):
+        """text cut at a word boundary to at most tokens, or None if nothing fits"""
+        while text and self.count_tokens(text) > tokens:
+            if tokens <= 0:
+                return None
+            cut = text[:min(len(text) - 1, len(text) * tokens // self.count_tokens(text))]
+            text = cut.rsplit(None, 1)[0] if " " in cut.strip() else cut
+        return text or None
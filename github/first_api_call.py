@@ -13,7 +13,8 @@ This script demonstrates:
 
 import os
 import sys
-import json
+import argparse
+import time
 from pathlib import Path
 from datetime import datetime
 
@@ -40,13 +41,29 @@ except ImportError:
     print("   Install with: pip install azure-ai-inference azure-core")
     sys.exit(1)
 
+from prompt_runner import PromptRunner
+from request_log import RequestLog
+from response_cache import ResponseCache
+from streaming import StreamedCompletion
+
 
 class GitHubModelsClient:
     """Client for interacting with GitHub Models API"""
     
-    def __init__(self):
-        """Initialize the API client"""
-        self.endpoint = "https://models.inference.ai.azure.com"
+    def __init__(self, log_dir: str = None, endpoint: str = None, cache=None):
+        """
+        Initialize the API client
+        
+        Args:
+            log_dir: Directory for the JSONL request log (default: api_logs/
+                next to this script)
+            endpoint: API endpoint (default: $GITHUB_MODELS_ENDPOINT or the
+                GitHub Models endpoint; point it at stub_chat_server.py to test)
+            cache: ResponseCache for repeatable calls (default: one in
+                .response_cache caching temperature 0 calls; False disables it)
+        """
+        self.endpoint = endpoint or os.getenv("GITHUB_MODELS_ENDPOINT",
+                                              "https://models.inference.ai.azure.com")
         self.api_key = os.getenv("GITHUB_TOKEN")
         
         if not self.api_key:
@@ -57,9 +74,29 @@ class GitHubModelsClient:
             credential=AzureKeyCredential(self.api_key)
         )
         print(f"✅ Client initialized with endpoint: {self.endpoint}")
+        
+        # Append-only and rotated; read it back with RequestLogReader
+        self.request_log = RequestLog(log_dir or Path(__file__).parent / "api_logs")
+        
+        self.cache = ResponseCache() if cache is None else (cache or None)
+    
+    def _cache_key(self, model: str, prompt: str, temperature: float, max_tokens: int,
+                   cache: bool, kwargs: dict):
+        """Cache key for a call, or None when the caching policy skips it"""
+        if self.cache is None or not self.cache.should_cache(temperature, cache):
+            return None
+        messages = [{"role": "user", "content": prompt}]
+        return self.cache.key(self.endpoint, model, messages, temperature, max_tokens, kwargs)
+    
+    def cached_response(self, model: str, prompt: str, temperature: float = 0.7,
+                        max_tokens: int = 1000, cache: bool = None, **kwargs):
+        """Cached response call_model would return for these arguments, or None"""
+        key = self._cache_key(model, prompt, temperature, max_tokens, cache, kwargs)
+        return self.cache.get(key) if key else None
     
     def call_model(self, model: str, prompt: str, temperature: float = 0.7, 
-                   max_tokens: int = 1000, **kwargs):
+                   max_tokens: int = 1000, cache: bool = None, lookup: bool = True,
+                   **kwargs):
         """
         Make an API call to GitHub Models
         
@@ -68,11 +105,22 @@ class GitHubModelsClient:
             prompt: User prompt/message
             temperature: Sampling temperature (0.0-2.0)
             max_tokens: Maximum tokens in response
+            cache: True/False to force or skip the response cache; None
+                caches temperature 0 calls only
+            lookup: Check the cache before calling; False when the caller
+                just did through cached_response() (the response is still stored)
             **kwargs: Additional parameters (top_p, frequency_penalty, etc.)
         
         Returns:
             Response object with model output
         """
+        key = self._cache_key(model, prompt, temperature, max_tokens, cache, kwargs)
+        if key and lookup:
+            response = self.cache.get(key)
+            if response is not None:
+                print(f"\n💾 Cached response for model: {model}")
+                return response
+        
         try:
             print(f"\n📤 Making API call to model: {model}")
             print(f"   Prompt: {prompt[:50]}..." if len(prompt) > 50 else f"   Prompt: {prompt}")
@@ -88,6 +136,8 @@ class GitHubModelsClient:
             )
             
             print("✅ API call successful!")
+            if key:
+                self.cache.put(key, response)
             return response
             
         except AzureError as e:
@@ -97,6 +147,47 @@ class GitHubModelsClient:
             print(f"❌ Unexpected error: {type(e).__name__}: {e}")
             raise
     
+    def stream_model(self, model: str, prompt: str = None, messages: list = None,
+                     temperature: float = 0.7, max_tokens: int = 1000, **kwargs):
+        """
+        Make a streaming API call: content arrives in pieces as it is generated
+        
+        Args:
+            model: Model name (e.g., 'gpt-4o-mini')
+            prompt: User prompt/message (or pass messages instead)
+            messages: Full conversation, e.g. an interactive chat history
+            temperature: Sampling temperature (0.0-2.0)
+            max_tokens: Maximum tokens in response
+            **kwargs: Additional parameters (top_p, frequency_penalty, etc.)
+        
+        Returns:
+            StreamedCompletion: iterate for content deltas, then read .text
+            and .stats() (time-to-first-token, tokens/sec)
+        """
+        if messages is None:
+            messages = [{"role": "user", "content": prompt}]
+        
+        # Ask for a final usage event so tokens/sec counts real tokens
+        model_extras = dict(kwargs.pop("model_extras", None) or {})
+        model_extras.setdefault("stream_options", {"include_usage": True})
+        
+        try:
+            started = time.perf_counter()
+            updates = self.client.complete(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                model_extras=model_extras,
+                **kwargs
+            )
+            return StreamedCompletion(updates, started)
+            
+        except AzureError as e:
+            print(f"❌ Azure API Error: {e}")
+            raise
+    
     def get_response_text(self, response):
         """Extract text from API response"""
         try:
@@ -107,8 +198,13 @@ class GitHubModelsClient:
             return None
     
     def log_request(self, model: str, prompt: str, response_text: str, 
-                    parameters: dict = None):
-        """Log the request and response for debugging"""
+                    parameters: dict = None, metrics: dict = None):
+        """
+        Log the request and response for debugging
+        
+        Args:
+            metrics: Optional call timings, e.g. StreamedCompletion.stats()
+        """
         log_entry = {
             "timestamp": datetime.now().isoformat(),
             "model": model,
@@ -117,32 +213,57 @@ class GitHubModelsClient:
             "response": response_text,
             "response_length": len(response_text) if response_text else 0
         }
+        if metrics:
+            log_entry["metrics"] = metrics
         
-        log_file = Path(__file__).parent / "api_logs.json"
-        
-        # Load existing logs
-        logs = []
-        if log_file.exists():
-            try:
-                with open(log_file, 'r') as f:
-                    logs = json.load(f)
-            except json.JSONDecodeError:
-                logs = []
-        
-        # Add new log entry
-        logs.append(log_entry)
+        # Buffered: a background thread appends it to the active segment
+        self.request_log.write(log_entry)
         
-        # Save logs (keep last 50 entries)
-        logs = logs[-50:]
+        print(f"📝 Request logged to: {self.request_log.path}")
+
+
+def run_batch(client: GitHubModelsClient, test_prompts: list, workers: int):
+    """Run the prompts concurrently, printing each result as it completes"""
+    runner = PromptRunner(client, max_workers=workers)
+    start = time.perf_counter()
+    
+    for result in runner.run(test_prompts):
+        test = test_prompts[result.index]
+        print(f"\n{'=' * 60}")
+        attempts = f"{result.attempts} attempt{'s' if result.attempts > 1 else ''}"
+        print(f"Test {result.index + 1}/{len(test_prompts)} finished in {result.seconds:.2f}s "
+              f"({attempts if result.attempts else 'cached'})")
+        print(f"{'=' * 60}")
         
-        with open(log_file, 'w') as f:
-            json.dump(logs, f, indent=2)
+        if result.error:
+            print(f"❌ Test {result.index + 1} failed: {result.error}")
+            continue
         
-        print(f"📝 Request logged to: {log_file}")
+        print(f"\n📥 Response:")
+        print(f"{'-' * 60}")
+        print(result.text)
+        print(f"{'-' * 60}")
+        client.log_request(
+            model=result.model,
+            prompt=result.prompt,
+            response_text=result.text,
+            parameters={
+                "temperature": test["temperature"],
+                "max_tokens": test["max_tokens"]
+            }
+        )
+    
+    print(f"\n⏱️  {len(test_prompts)} prompts in {time.perf_counter() - start:.2f}s "
+          f"with {workers} workers")
 
 
 def main():
     """Main function to demonstrate API usage"""
+    parser = argparse.ArgumentParser(description="GitHub Models API - First API Call")
+    parser.add_argument("--endpoint", help="API endpoint (e.g. a local stub_chat_server.py)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="run the test prompts concurrently on this many threads")
+    args = parser.parse_args()
     
     print("=" * 60)
     print("GitHub Models API - First API Call")
@@ -151,7 +272,7 @@ def main():
     
     # Initialize client
     try:
-        client = GitHubModelsClient()
+        client = GitHubModelsClient(endpoint=args.endpoint)
     except Exception as e:
         print(f"❌ Failed to initialize client: {e}")
         return 1
@@ -180,45 +301,55 @@ def main():
     
     print(f"\n🧪 Running {len(test_prompts)} test prompts...\n")
     
-    for i, test in enumerate(test_prompts, 1):
-        print(f"\n{'=' * 60}")
-        print(f"Test {i}/{len(test_prompts)}")
-        print(f"{'=' * 60}")
-        
-        try:
-            # Make API call
-            response = client.call_model(
-                model=test["model"],
-                prompt=test["prompt"],
-                temperature=test["temperature"],
-                max_tokens=test["max_tokens"]
-            )
+    if args.workers > 1:
+        run_batch(client, test_prompts, args.workers)
+    else:
+        for i, test in enumerate(test_prompts, 1):
+            print(f"\n{'=' * 60}")
+            print(f"Test {i}/{len(test_prompts)}")
+            print(f"{'=' * 60}")
             
-            # Extract response text
-            response_text = client.get_response_text(response)
-            
-            if response_text:
-                print(f"\n📥 Response:")
-                print(f"{'-' * 60}")
-                print(response_text)
-                print(f"{'-' * 60}")
-                
-                # Log the request
-                client.log_request(
+            try:
+                # Make API call
+                response = client.call_model(
                     model=test["model"],
                     prompt=test["prompt"],
-                    response_text=response_text,
-                    parameters={
-                        "temperature": test["temperature"],
-                        "max_tokens": test["max_tokens"]
-                    }
+                    temperature=test["temperature"],
+                    max_tokens=test["max_tokens"]
                 )
-            else:
-                print("⚠️  No response text received")
+                
+                # Extract response text
+                response_text = client.get_response_text(response)
+                
+                if response_text:
+                    print(f"\n📥 Response:")
+                    print(f"{'-' * 60}")
+                    print(response_text)
+                    print(f"{'-' * 60}")
+                    
+                    # Log the request
+                    client.log_request(
+                        model=test["model"],
+                        prompt=test["prompt"],
+                        response_text=response_text,
+                        parameters={
+                            "temperature": test["temperature"],
+                            "max_tokens": test["max_tokens"]
+                        }
+                    )
+                else:
+                    print("⚠️  No response text received")
+            
+            except Exception as e:
+                print(f"❌ Test {i} failed: {e}")
+                continue
         
-        except Exception as e:
-            print(f"❌ Test {i} failed: {e}")
-            continue
+    client.request_log.close()
+    
+    if client.cache:
+        stats = client.cache.stats()
+        print(f"\n💾 Response cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['stores']} stored, hit rate {stats['hit_rate']:.0%}")
     
     print(f"\n{'=' * 60}")
     print("✅ All tests completed!")
@@ -2,35 +2,38 @@
 """
 Interactive API Call - Chat with GitHub Models
 Ask questions and get responses interactively
+
+Answers are streamed: text is printed as it is generated, followed by the
+time to first token and the generation speed.
+Set GITHUB_MODELS_ENDPOINT (e.g. to a local stub_chat_server.py) to test.
+
+The history sent with each question is kept under --context-tokens by
+dropping the oldest whole turns; --summarize folds them into a short
+summary instead of forgetting them.
 """
 
-import os
+import argparse
 import sys
-from pathlib import Path
 
-# Load environment variables
-parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
+from conversation_history import ConversationHistory, model_summarizer
+from first_api_call import GitHubModelsClient
 
-from dotenv import load_dotenv
-load_dotenv(parent_dir / '.env')
+MODEL = "gpt-4o-mini"
 
-from azure.ai.inference import ChatCompletionsClient
-from azure.core.credentials import AzureKeyCredential
+parser = argparse.ArgumentParser(description="Chat with GitHub Models")
+parser.add_argument("--context-tokens", type=int, default=2000,
+                    help="token budget for the history sent with each question")
+parser.add_argument("--summarize", action="store_true",
+                    help="summarize dropped turns instead of forgetting them")
+args = parser.parse_args()
 
 # Initialize client
-endpoint = "https://models.inference.ai.azure.com"
-api_key = os.getenv("GITHUB_TOKEN")
-
-if not api_key:
-    print("❌ GITHUB_TOKEN not found!")
+try:
+    client = GitHubModelsClient()
+except ValueError as e:
+    print(f"❌ {e}")
     sys.exit(1)
 
-client = ChatCompletionsClient(
-    endpoint=endpoint,
-    credential=AzureKeyCredential(api_key)
-)
-
 print("=" * 60)
 print("GitHub Models - Interactive Chat")
 print("=" * 60)
@@ -39,7 +42,10 @@ print("=" * 60)
 print()
 
 # Conversation history
-conversation_history = []
+conversation_history = ConversationHistory(
+    max_tokens=args.context_tokens,
+    summarizer=model_summarizer(client, MODEL) if args.summarize else None
+)
 
 while True:
     try:
@@ -55,29 +61,49 @@ while True:
             break
         
         # Add to conversation history
-        conversation_history.append({"role": "user", "content": user_input})
+        conversation_history.add_user(user_input)
         
         # Make API call
         print("🤔 Thinking...", end="\r")
-        response = client.complete(
-            model="gpt-4o-mini",
-            messages=conversation_history,
+        completion = client.stream_model(
+            model=MODEL,
+            messages=conversation_history.messages(),
             temperature=0.7,
             max_tokens=500
         )
         
-        # Get response
-        assistant_message = response.choices[0].message.content
+        # Print the response as it arrives
+        for i, delta in enumerate(completion):
+            if i == 0:
+                print("\n🤖 Assistant: ", end="")
+            print(delta, end="", flush=True)
         
-        # Add to conversation history
-        conversation_history.append({"role": "assistant", "content": assistant_message})
+        # Assembled message for the history and the log
+        assistant_message = completion.text
+        stats = completion.stats()
+        conversation_history.add_assistant(assistant_message)
         
-        # Print response
-        print(f"\n🤖 Assistant: {assistant_message}\n")
+        if stats["time_to_first_token"] is not None:
+            if stats["tokens_per_second"] is not None:
+                rate = f"{stats['tokens_per_second']:.1f} tokens/s"
+            else:
+                # No usage reported: a delta may hold several tokens
+                rate = f"{stats['deltas_per_second'] or 0:.1f} deltas/s (no usage reported)"
+            print(f"\n   ⏱️  first token {stats['time_to_first_token']:.2f}s, "
+                  f"{rate}, {stats['seconds']:.2f}s total")
+        else:
+            print("\n⚠️  No response text received")
         
-        # Keep only last 10 messages to avoid token limit
-        if len(conversation_history) > 10:
-            conversation_history = conversation_history[-10:]
+        client.log_request(
+            model=MODEL,
+            prompt=user_input,
+            response_text=assistant_message,
+            parameters={"temperature": 0.7, "max_tokens": 500, "stream": True},
+            metrics=stats
+        )
+        print(f"   📚 History: {len(conversation_history)} turns, "
+              f"~{conversation_history.token_count} tokens"
+              f"{' + summary' if conversation_history.summary else ''}\n")
     
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Prompt Runner - Run a batch of prompts concurrently
+Fans prompts out over a bounded thread pool while a per-model rate limiter
+keeps requests/min and tokens/min under the account's limits. A 429 pauses
+every worker using that model for the Retry-After time (or an exponential
+backoff) before the prompt is retried. Results are yielded as soon as each
+prompt finishes and carry the prompt's index in the original list.
+
+Usage:
+    runner = PromptRunner(client, max_workers=4,
+                          limits={"gpt-4o-mini": {"requests_per_minute": 15}})
+    for result in runner.run(prompts):
+        print(result.index, result.text or result.error)
+"""
+
+import math
+import random
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from azure.core.exceptions import HttpResponseError
+
+PromptResult = namedtuple("PromptResult", [
+    "index", "model", "prompt", "text", "response", "error", "attempts", "seconds",
+])
+
+# GitHub Models free tier for low tier models; override per model with limits=
+DEFAULT_LIMITS = {"requests_per_minute": 15, "tokens_per_minute": None}
+
+# Statuses worth retrying; only 429 also pauses the model's limiter
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for limiter reservations: about four characters per token"""
+    return max(1, math.ceil(len(text or "") / 4))
+
+
+class RateLimiter:
+    """Request and token limits for one model
+
+    Requests are counted in a sliding window, so no window of that length
+    ever holds more than requests_per_minute of them (a bucket would allow
+    a full burst plus its refill). Tokens use a continuously refilled
+    bucket, since reservations are settled once the real usage is known.
+    """
+
+    def __init__(self, requests_per_minute: int = None, tokens_per_minute: int = None,
+                 window: float = 60.0):
+        """
+        Args:
+            requests_per_minute: Requests allowed per window (None = unlimited)
+            tokens_per_minute: Prompt + completion tokens per window (None = unlimited)
+            window: Length of the limit window in seconds (a minute, unless
+                the service counts differently)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window = window
+        self._sent = deque()
+        self._tokens = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._updated = now
+        while self._sent and self._sent[0] <= now - self.window:
+            self._sent.popleft()
+        if self.tokens_per_minute:
+            self._tokens = min(self.tokens_per_minute,
+                               self._tokens + elapsed * self.tokens_per_minute / self.window)
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until one request and tokens may be sent, then take them
+
+        A reservation larger than tokens_per_minute waits for a full bucket.
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wanted = min(tokens, self.tokens_per_minute or 0)
+                wait = self._paused_until - now
+                if wait <= 0:
+                    waits = [0.0]
+                    if self.requests_per_minute and len(self._sent) >= self.requests_per_minute:
+                        waits.append(self._sent[0] + self.window - now)
+                    if self.tokens_per_minute and self._tokens < wanted:
+                        waits.append((wanted - self._tokens) * self.window / self.tokens_per_minute)
+                    wait = max(waits)
+                if wait <= 0:
+                    if self.requests_per_minute:
+                        self._sent.append(now)
+                    if self.tokens_per_minute:
+                        self._tokens -= wanted
+                    return now - start
+            time.sleep(wait)
+
+    def settle(self, reserved: int, used: int):
+        """Return the unused part of a token reservation (or charge the excess)"""
+        if not self.tokens_per_minute:
+            return
+        with self._lock:
+            self._tokens = min(self.tokens_per_minute,
+                               self._tokens + min(reserved, self.tokens_per_minute) - used)
+
+    def pause(self, seconds: float):
+        """Hold back every request for this model for seconds (after a 429)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class PromptRunner:
+    """Runs prompts through GitHubModelsClient.call_model from a thread pool"""
+
+    def __init__(self, client, max_workers: int = 4, limits: dict = None,
+                 default_limits: dict = None, max_retries: int = 5,
+                 backoff: float = 1.0, max_backoff: float = 60.0):
+        """
+        Args:
+            client: GitHubModelsClient (anything with call_model/get_response_text)
+            max_workers: Prompts in flight at once
+            limits: Per-model limiter settings, e.g.
+                {"gpt-4o": {"requests_per_minute": 10, "tokens_per_minute": 50000}}
+            default_limits: Settings for models missing from limits
+                (defaults to DEFAULT_LIMITS)
+            max_retries: Retries per prompt after 429 or 5xx responses
+            backoff: First retry delay when the response has no Retry-After
+            max_backoff: Upper bound for the exponential backoff delay
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.limits = limits or {}
+        self.default_limits = default_limits or DEFAULT_LIMITS
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, model: str) -> RateLimiter:
+        """The shared RateLimiter for model"""
+        with self._lock:
+            if model not in self._limiters:
+                self._limiters[model] = RateLimiter(**self.limits.get(model, self.default_limits))
+            return self._limiters[model]
+
+    def run(self, prompts: list):
+        """
+        Run prompts concurrently, yielding results in completion order
+
+        Args:
+            prompts: Dictionaries with "model" and "prompt", plus optional
+                "temperature", "max_tokens" and other call_model kwargs
+
+        Yields:
+            PromptResult per prompt; failures have error set instead of text
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                      thread_name_prefix="prompt-runner")
+        try:
+            futures = [executor.submit(self._run_one, index, spec)
+                       for index, spec in enumerate(prompts)]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Stop queued prompts if the caller stops iterating early
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def run_all(self, prompts: list) -> list:
+        """Run prompts and return the results in the original order"""
+        return sorted(self.run(prompts), key=lambda result: result.index)
+
+    def _retry_delay(self, error: HttpResponseError, attempt: int) -> float:
+        retry_after = error.response.headers.get("Retry-After") if error.response else None
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            # Full jitter spreads out workers that were throttled together
+            return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _run_one(self, index: int, spec: dict) -> PromptResult:
+        kwargs = dict(spec)
+        model = kwargs.pop("model")
+        prompt = kwargs.pop("prompt")
+        kwargs.setdefault("max_tokens", 1000)
+        limiter = self.limiter(model)
+        reserved = estimate_tokens(prompt) + kwargs["max_tokens"]
+        start = time.perf_counter()
+
+        # Cached responses cost no quota, so they skip the limiter
+        lookup = getattr(self.client, "cached_response", None)
+        response = lookup(model=model, prompt=prompt, **kwargs) if lookup else None
+        if response is not None:
+            return PromptResult(index, model, prompt, self.client.get_response_text(response),
+                                response, None, 0, time.perf_counter() - start)
+        if lookup:
+            # Already looked up: call_model must not count a second miss
+            kwargs["lookup"] = False
+
+        for attempt in range(1, self.max_retries + 2):
+            limiter.acquire(reserved)
+            try:
+                # retry_status=0: this runner, not the SDK, decides how long to wait
+                response = self.client.call_model(model=model, prompt=prompt,
+                                                  retry_status=0, **kwargs)
+            except HttpResponseError as e:
+                limiter.settle(reserved, 0)
+                if e.status_code not in RETRY_STATUSES or attempt > self.max_retries:
+                    return PromptResult(index, model, prompt, None, None, e, attempt,
+                                        time.perf_counter() - start)
+                delay = self._retry_delay(e, attempt - 1)
+                if e.status_code == 429:
+                    limiter.pause(delay)
+                else:
+                    time.sleep(delay)
+                continue
+            except Exception as e:
+                limiter.settle(reserved, 0)
+                return PromptResult(index, model, prompt, None, None, e, attempt,
+                                    time.perf_counter() - start)
+
+            usage = getattr(response, "usage", None)
+            limiter.settle(reserved, usage.total_tokens if usage else reserved)
+            return PromptResult(index, model, prompt, self.client.get_response_text(response),
+                                response, None, attempt, time.perf_counter() - start)
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Request Log - Append-only JSONL log of API requests
+Entries are buffered in memory and appended to the active segment by a
+background thread, one write per batch. When the active segment reaches
+its size or entry limit it is renamed to a numbered segment and a new one
+is started; only the newest segments are kept.
+
+    logs/
+        requests.jsonl           active segment (appended to)
+        requests.000012.jsonl    newest rotated segment
+        requests.000011.jsonl    ...
+
+Several processes can log to the same directory: appends use O_APPEND,
+and rollover happens under a file lock, so nothing is rewritten in place.
+RequestLogReader reads segments from the end, so tail() and recent
+queries do not load the whole history.
+
+Usage:
+    log = RequestLog("logs")
+    log.write({"model": "gpt-4o-mini", "prompt": "Hi"})
+    log.close()                              # or rely on the atexit flush
+
+    reader = RequestLogReader("logs")
+    reader.tail(5)                           # last 5 entries, oldest first
+    reader.query(model="gpt-4o-mini", limit=20)
+"""
+
+import atexit
+import json
+import os
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: rollover is not coordinated between processes
+    fcntl = None
+
+
+def _segment_pattern(prefix: str):
+    return re.compile(rf"^{re.escape(prefix)}\.(\d+)\.jsonl$")
+
+
+def list_segments(directory, prefix: str = "requests") -> list:
+    """Segment paths from oldest to newest, active segment last"""
+    directory = Path(directory)
+    pattern = _segment_pattern(prefix)
+    numbered = []
+    for path in directory.glob(f"{prefix}.*.jsonl"):
+        match = pattern.match(path.name)
+        if match:
+            numbered.append((int(match.group(1)), path))
+    segments = [path for _, path in sorted(numbered)]
+    active = directory / f"{prefix}.jsonl"
+    if active.exists():
+        segments.append(active)
+    return segments
+
+
+class RequestLog:
+    """Buffered, rotating JSONL writer"""
+
+    def __init__(self, directory, prefix: str = "requests", max_bytes: int = 1024 * 1024,
+                 max_entries: int = None, keep_segments: int = 5,
+                 flush_interval: float = 1.0, buffer_size: int = 100):
+        """
+        Args:
+            directory: Directory holding the segments (created if missing)
+            prefix: Segment file name prefix
+            max_bytes: Roll over once the active segment reaches this size
+            max_entries: Also roll over after this many entries (None = no limit)
+            keep_segments: Rotated segments to keep; older ones are deleted
+            flush_interval: Seconds between background flushes
+            buffer_size: Flush early once this many entries are buffered
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.prefix = prefix
+        self.path = self.directory / f"{prefix}.jsonl"
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.keep_segments = keep_segments
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+
+        self._buffer = []
+        self._buffer_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._fd = None
+        self._inode = None
+        self._entries = 0
+        self._wakeup = threading.Event()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-log-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, entry: dict):
+        """Buffer one entry; it reaches disk on the next flush"""
+        if self._closed.is_set():
+            raise ValueError("RequestLog is closed")
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        with self._buffer_lock:
+            self._buffer.append(line)
+            full = len(self._buffer) >= self.buffer_size
+        if full:
+            self._wakeup.set()
+
+    def flush(self):
+        """Append all buffered entries to the active segment now"""
+        with self._write_lock:
+            with self._buffer_lock:
+                lines, self._buffer = self._buffer, []
+            if not lines:
+                return
+            self._ensure_open()
+            os.write(self._fd, "".join(lines).encode())
+            self._entries += len(lines)
+            if self._over_limit(os.fstat(self._fd).st_size, self._entries):
+                self._rollover()
+
+    def close(self):
+        """Flush remaining entries and stop the background thread"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._wakeup.set()
+        self._thread.join()
+        self.flush()
+        with self._write_lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def reader(self) -> "RequestLogReader":
+        return RequestLogReader(self.directory, self.prefix)
+
+    def _run(self):
+        while not self._closed.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except OSError as e:
+                # Keep the thread alive; the next flush retries with new entries
+                print(f"⚠️  Request log flush failed: {e}")
+
+    def _over_limit(self, size: int, entries: int) -> bool:
+        return size >= self.max_bytes or (self.max_entries is not None
+                                          and entries >= self.max_entries)
+
+    def _ensure_open(self):
+        # Another process may have rotated the active segment since our last write
+        try:
+            current = os.stat(self.path).st_ino
+        except FileNotFoundError:
+            current = None
+        if self._fd is not None and current == self._inode:
+            return
+        if self._fd is not None:
+            os.close(self._fd)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._inode = os.fstat(self._fd).st_ino
+        self._entries = self._count_lines(self.path) if self.max_entries else 0
+
+    @staticmethod
+    def _count_lines(path: Path) -> int:
+        count = 0
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                count += block.count(b"\n")
+        return count
+
+    @contextmanager
+    def _locked(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.directory / f".{self.prefix}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _rollover(self):
+        with self._locked():
+            # Re-check under the lock: another process may have rotated already
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                stat = None
+            if stat is not None and stat.st_ino == self._inode:
+                entries = self._count_lines(self.path) if self.max_entries else 0
+                if self._over_limit(stat.st_size, entries):
+                    segments = list_segments(self.directory, self.prefix)[:-1]
+                    number = 1
+                    if segments:
+                        number = int(_segment_pattern(self.prefix).match(segments[-1].name).group(1)) + 1
+                    # Atomic: readers see the entries under one name or the other
+                    os.rename(self.path, self.directory / f"{self.prefix}.{number:06d}.jsonl")
+                    self._prune()
+            os.close(self._fd)
+            self._fd = None
+            self._ensure_open()
+
+    def _prune(self):
+        rotated = list_segments(self.directory, self.prefix)
+        if rotated and rotated[-1] == self.path:
+            rotated.pop()
+        for path in rotated[:max(len(rotated) - self.keep_segments, 0)]:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class RequestLogReader:
+    """Reads a RequestLog directory newest entry first, segment by segment"""
+
+    def __init__(self, directory, prefix: str = "requests", block_size: int = 64 * 1024):
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.block_size = block_size
+
+    def _open_segments(self) -> list:
+        # Open every segment before reading so a rollover in between
+        # cannot hide the newest entries (open files survive a rename)
+        for _ in range(3):
+            files = []
+            paths = list_segments(self.directory, self.prefix)
+            for path in paths:
+                try:
+                    files.append(open(path, "rb"))
+                except FileNotFoundError:
+                    continue
+            if len(files) == len(paths):
+                return files
+            for f in files:
+                f.close()
+        return [open(path, "rb") for path in list_segments(self.directory, self.prefix)]
+
+    def _reverse_lines(self, f):
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b""
+        while position > 0:
+            size = min(self.block_size, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + remainder).split(b"\n")
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line:
+                    yield line
+        if remainder:
+            yield remainder
+
+    def iter_entries(self, reverse: bool = True):
+        """
+        Yield entries newest first (or oldest first with reverse=False)
+
+        Lines that are not valid JSON (e.g. cut short by a crash) are skipped.
+        """
+        files = self._open_segments()
+        try:
+            for f in (reversed(files) if reverse else files):
+                lines = self._reverse_lines(f) if reverse else f
+                for line in lines:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        finally:
+            for f in files:
+                f.close()
+
+    def tail(self, n: int = 10) -> list:
+        """The last n entries, oldest first"""
+        entries = []
+        for entry in self.iter_entries():
+            if len(entries) >= n:
+                break
+            entries.append(entry)
+        return entries[::-1]
+
+    def query(self, since=None, model: str = None, where=None, limit: int = None) -> list:
+        """
+        Recent entries matching all given filters, newest first
+
+        Args:
+            since: datetime or ISO timestamp; older entries are excluded and
+                reading stops at the first entry older than since
+            model: Only entries for this model
+            where: Callable(entry) -> bool for any other condition
+            limit: Stop after this many matches
+
+        Returns:
+            List of entry dictionaries
+        """
+        if isinstance(since, str):
+            since = datetime.fromisoformat(since)
+        matches = []
+        for entry in self.iter_entries():
+            if since is not None and "timestamp" in entry:
+                if datetime.fromisoformat(entry["timestamp"]) < since:
+                    break
+            if model is not None and entry.get("model") != model:
+                continue
+            if where is not None and not where(entry):
+                continue
+            matches.append(entry)
+            if limit is not None and len(matches) >= limit:
+                break
+        return matches
+
+
+def main():
+    """Print the most recent log entries: python request_log.py [N] [DIRECTORY]"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    directory = sys.argv[2] if len(sys.argv) > 2 else Path(__file__).parent / "api_logs"
+    for entry in RequestLogReader(directory).tail(count):
+        print(f"{entry.get('timestamp', '')}  {entry.get('model', '')}  "
+              f"{entry.get('response_length', 0):>6} chars  {entry.get('prompt', '')[:60]}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
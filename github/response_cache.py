@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Response Cache - On-disk cache for deterministic chat completions
+Stores each response in a file named after a hash of everything that
+determines it (endpoint, model, messages, temperature, max_tokens and the
+other request parameters), so re-running the same regression prompts
+costs no quota. By policy only temperature 0 calls are cached unless a
+call or the whole cache opts in. Entries expire after a TTL and the least
+recently used ones are deleted once the cache grows past its size limit.
+
+Cached responses come back as ChatCompletions objects, so
+get_response_text() and other callers work unchanged.
+
+Usage:
+    client = GitHubModelsClient(cache=ResponseCache(ttl=24 * 3600))
+    client.call_model("gpt-4o-mini", "2 + 2?", temperature=0)   # API call, stored
+    client.call_model("gpt-4o-mini", "2 + 2?", temperature=0)   # from disk
+    client.cache.stats()
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from azure.ai.inference.models import ChatCompletions
+
+# Request options that change how a call is sent, not what it returns
+TRANSPORT_KWARGS = {
+    "retry_total", "retry_status", "retry_connect", "retry_read", "retry_backoff_factor",
+    "timeout", "connection_timeout", "read_timeout", "headers", "logging_enable",
+}
+
+
+class ResponseCache:
+    """Content-addressed response files with TTL and LRU size eviction"""
+
+    def __init__(self, directory=None, ttl: float = 7 * 24 * 3600,
+                 max_bytes: int = 50 * 1024 * 1024, always: bool = False):
+        """
+        Args:
+            directory: Cache directory (default: $GITHUB_MODELS_CACHE_DIR or
+                .response_cache next to this script)
+            ttl: Seconds a response stays valid (None = forever)
+            max_bytes: Delete least recently used entries beyond this size
+            always: Cache every call, not only temperature 0 ones
+        """
+        # Created by the first put(), not here: most clients never cache anything
+        self.directory = Path(directory or os.getenv(
+            "GITHUB_MODELS_CACHE_DIR", Path(__file__).parent / ".response_cache"))
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.always = always
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.expired = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._size = sum(path.stat().st_size for path in self._files())
+
+    def should_cache(self, temperature: float, opt_in: bool = None) -> bool:
+        """
+        Caching policy for one call
+
+        Args:
+            temperature: The call's sampling temperature
+            opt_in: Per-call override: True always caches, False never does,
+                None applies the cache's policy (temperature 0 or always)
+        """
+        if opt_in is not None:
+            return opt_in
+        return self.always or temperature == 0
+
+    @staticmethod
+    def key(endpoint: str, model: str, messages: list, temperature: float,
+            max_tokens: int, kwargs: dict = None) -> str:
+        """SHA-256 of the canonical JSON of everything that shapes the response"""
+        params = {name: value for name, value in (kwargs or {}).items()
+                  if name not in TRANSPORT_KWARGS}
+        request = {
+            "endpoint": endpoint,
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "params": params,
+        }
+        canonical = json.dumps(request, sort_keys=True, separators=(",", ":"),
+                               ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _files(self):
+        return self.directory.glob("??/*.json")
+
+    def get(self, key: str):
+        """Cached ChatCompletions for key, or None if missing or expired"""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            entry = None
+        if entry is not None and self.ttl is not None and time.time() - entry["created"] > self.ttl:
+            self._remove(path)
+            with self._lock:
+                self.expired += 1
+            entry = None
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            # Access time for LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return ChatCompletions(entry["response"])
+
+    def put(self, key: str, response):
+        """Store a response (ChatCompletions or its dict) under key"""
+        data = response.as_dict() if hasattr(response, "as_dict") else dict(response)
+        payload = json.dumps({"created": time.time(), "response": data}, ensure_ascii=False)
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(payload)
+        try:
+            previous = path.stat().st_size
+        except FileNotFoundError:
+            previous = 0
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.stores += 1
+            self._size += path.stat().st_size - previous
+            over = self._size > self.max_bytes
+        if over:
+            self._evict()
+
+    def _remove(self, path: Path) -> int:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return 0
+        with self._lock:
+            self._size -= size
+        return size
+
+    def _evict(self):
+        """Delete least recently used entries until 90% of max_bytes is left"""
+        entries = []
+        for path in self._files():
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        for _, path in sorted(entries):
+            if self._size <= self.max_bytes * 0.9:
+                break
+            if self._remove(path):
+                with self._lock:
+                    self.evictions += 1
+
+    def clear(self):
+        """Delete every cached response"""
+        for path in list(self._files()):
+            self._remove(path)
+
+    @property
+    def size(self) -> int:
+        """Bytes used by cached responses"""
+        return self._size
+
+    def stats(self) -> dict:
+        """Lookup hits and misses, hit rate, stores, expirations, evictions and size"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "bytes": self._size,
+        }
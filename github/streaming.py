@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Streaming - Content deltas and timing for streamed chat completions
+Wraps the SDK's StreamingChatCompletions so callers can print each piece
+of the answer as it arrives, then read the assembled message and the
+call's time-to-first-token and tokens/sec once the stream ends.
+
+tokens/sec comes from the usage the server reports in the last event
+(GitHubModelsClient.stream_model asks for it). A server that sends no
+usage only gets a deltas/sec rate: a delta can hold several tokens.
+
+Usage:
+    completion = client.stream_model("gpt-4o-mini", "Tell me a story")
+    for delta in completion:
+        print(delta, end="", flush=True)
+    print(completion.text, completion.stats())
+"""
+
+import time
+
+
+class StreamedCompletion:
+    """One streamed chat completion, consumed once by iterating over it"""
+
+    def __init__(self, updates, started: float = None):
+        """
+        Args:
+            updates: Iterable of StreamingChatCompletionsUpdate (the SDK's
+                complete(stream=True) result)
+            started: time.perf_counter() when the request was sent
+        """
+        self._updates = updates
+        self.started = started if started is not None else time.perf_counter()
+        self.first_token_at = None
+        self.finished_at = None
+        self.finish_reason = None
+        self.usage = None
+        self.chunks = 0
+        self._parts = []
+
+    def __iter__(self):
+        """Yield content deltas (strings) as they arrive"""
+        try:
+            for update in self._updates:
+                if getattr(update, "usage", None):
+                    self.usage = update.usage
+                if not update.choices:
+                    continue
+                choice = update.choices[0]
+                if choice.finish_reason:
+                    self.finish_reason = choice.finish_reason
+                delta = choice.delta.content if choice.delta else None
+                if not delta:
+                    continue
+                if self.first_token_at is None:
+                    self.first_token_at = time.perf_counter()
+                self.chunks += 1
+                self._parts.append(delta)
+                yield delta
+        finally:
+            self.finished_at = time.perf_counter()
+            self.close()
+
+    def read(self) -> str:
+        """Consume the rest of the stream and return the whole message"""
+        for _ in self:
+            pass
+        return self.text
+
+    def close(self):
+        close = getattr(self._updates, "close", None)
+        if close:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def text(self) -> str:
+        """The message assembled from the deltas received so far"""
+        return "".join(self._parts)
+
+    @property
+    def time_to_first_token(self) -> float:
+        """Seconds from sending the request to the first content delta"""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started
+
+    @property
+    def seconds(self) -> float:
+        """Total seconds for the call (so far, while still streaming)"""
+        return (self.finished_at or time.perf_counter()) - self.started
+
+    @property
+    def completion_tokens(self) -> int:
+        """Completion tokens reported in the stream's usage, None if none was sent"""
+        if self.usage is None:
+            return None
+        return self.usage.completion_tokens
+
+    def _rate(self, count: int) -> float:
+        """count per second of generation, after the first delta arrived"""
+        if self.first_token_at is None or count is None:
+            return None
+        generating = (self.finished_at or time.perf_counter()) - self.first_token_at
+        return count / generating if generating > 0 else None
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Generation rate from the reported usage (None without usage)"""
+        return self._rate(self.completion_tokens)
+
+    @property
+    def deltas_per_second(self) -> float:
+        """Content deltas received per second, whatever their token count"""
+        return self._rate(self.chunks)
+
+    def stats(self) -> dict:
+        """Timing summary for logs: ttft, total seconds, tokens and tokens/sec"""
+        ttft = self.time_to_first_token
+        tokens_rate = self.tokens_per_second
+        deltas_rate = self.deltas_per_second
+        return {
+            "time_to_first_token": round(ttft, 4) if ttft is not None else None,
+            "seconds": round(self.seconds, 4),
+            "completion_tokens": self.completion_tokens,
+            "tokens_per_second": round(tokens_rate, 2) if tokens_rate is not None else None,
+            "content_deltas": self.chunks,
+            "deltas_per_second": round(deltas_rate, 2) if deltas_rate is not None else None,
+            "finish_reason": getattr(self.finish_reason, "value", self.finish_reason),
+        }
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Stub Chat Server - Local stand-in for the GitHub Models endpoint
+Answers POST /chat/completions the way the Azure AI Inference SDK expects,
+with optional latency and a per-model request limit that returns 429 with
+Retry-After, so the clients can be exercised without a token or quota.
+Requests with "stream": true get the reply word by word as server-sent
+events over a chunked response.
+
+Usage:
+    with StubChatServer(latency=0.2, requests_per_minute=30) as server:
+        client = GitHubModelsClient(endpoint=server.url)
+"""
+
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _pieces(text: str) -> list:
+    # Streamed deltas: one word plus its trailing whitespace each
+    return re.findall(r"\S+\s*|\s+", text)
+
+
+def _count_tokens(text: str) -> int:
+    # About four characters per token, like the real tokenizer on English text
+    return max(1, math.ceil(len(text or "") / 4))
+
+
+class StubChatServer:
+    """Threaded HTTP server answering chat completions with an echo reply"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 jitter: float = 0.0, requests_per_minute: int = None,
+                 window: float = 60.0, reply=None, token_delay: float = 0.0):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Seconds of artificial delay before the first token
+            jitter: Up to this many extra seconds of random delay
+            requests_per_minute: Requests accepted per model and window
+                before answering 429 (None = unlimited)
+            window: Length of the rate limit window in seconds
+            reply: Callable(model, messages) -> str (defaults to an echo)
+            token_delay: Seconds per generated word, between streamed
+                deltas (or added to the latency when not streaming)
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.requests_per_minute = requests_per_minute
+        self.window = window
+        self.token_delay = token_delay
+        self.reply = reply or (lambda model, messages: f"Echo from {model}: {messages[-1]['content']}")
+        self.request_count = 0
+        self.rate_limited = 0
+        self.active = 0
+        self.max_active = 0
+        self._requests = {}
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+    # Request handling
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if not self.path.split("?")[0].endswith("/chat/completions"):
+                    return self._send(404, {"error": {"code": "NotFound", "message": self.path}})
+                status, response, headers = server._complete(body)
+                if status == 200 and body.get("stream"):
+                    return self._send_stream(response, body)
+                self._send(status, response, headers)
+
+            def _send_stream(self, response: dict, body: dict):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                content = response["choices"][0]["message"]["content"]
+                for index, piece in enumerate(_pieces(content)):
+                    if index and server.token_delay:
+                        time.sleep(server.token_delay)
+                    delta = {"content": piece}
+                    if index == 0:
+                        delta["role"] = "assistant"
+                    self._send_event(server._chunk(response, delta))
+                self._send_event(server._chunk(response, {}, "stop"))
+                if (body.get("stream_options") or {}).get("include_usage"):
+                    self._send_event(dict(server._chunk(response, {}), choices=[],
+                                          usage=response["usage"]))
+                self._send_event("[DONE]")
+                self.wfile.write(b"0\r\n\r\n")
+
+            def _send_event(self, event):
+                data = event if isinstance(event, str) else json.dumps(event)
+                payload = f"data: {data}\n\n".encode()
+                self.wfile.write(f"{len(payload):X}\r\n".encode() + payload + b"\r\n")
+                self.wfile.flush()
+
+            def _send(self, status: int, response: dict, headers: dict = None):
+                data = json.dumps(response).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def _retry_after(self, model: str) -> float:
+        """Seconds until model may send again, 0 if the request is accepted"""
+        if self.requests_per_minute is None:
+            return 0.0
+        now = time.monotonic()
+        with self._lock:
+            sent = self._requests.setdefault(model, deque())
+            while sent and sent[0] <= now - self.window:
+                sent.popleft()
+            if len(sent) >= self.requests_per_minute:
+                self.rate_limited += 1
+                return sent[0] + self.window - now
+            sent.append(now)
+            return 0.0
+
+    def _complete(self, body: dict):
+        model = body.get("model", "unknown")
+        with self._lock:
+            self.request_count += 1
+
+        wait = self._retry_after(model)
+        if wait:
+            return 429, {"error": {
+                "code": "RateLimitReached",
+                "message": f"Rate limit of {self.requests_per_minute} per "
+                           f"{self.window:g}s exceeded for {model}",
+            }}, {"Retry-After": str(max(1, math.ceil(wait)))}
+
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.latency or self.jitter:
+                time.sleep(self.latency + random.uniform(0, self.jitter))
+            messages = body.get("messages", [])
+            content = self.reply(model, messages)
+            max_tokens = body.get("max_tokens")
+            if max_tokens:
+                content = content[:max_tokens * 4]
+            if self.token_delay and not body.get("stream"):
+                time.sleep(self.token_delay * len(_pieces(content)))
+        finally:
+            with self._lock:
+                self.active -= 1
+
+        prompt_tokens = sum(_count_tokens(m.get("content", "")) for m in messages)
+        completion_tokens = _count_tokens(content)
+        return 200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }, {}
+
+    @staticmethod
+    def _chunk(response: dict, delta: dict, finish_reason: str = None) -> dict:
+        """A chat.completion.chunk event carrying delta"""
+        return {
+            "id": response["id"],
+            "object": "chat.completion.chunk",
+            "created": response["created"],
+            "model": response["model"],
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+
+
+if __name__ == "__main__":
+    with StubChatServer(port=8765, latency=0.3, token_delay=0.05) as stub:
+        print(f"Stub chat server listening on {stub.url} (Ctrl+C to stop)")
+        print(f"   Try: python first_api_call.py --endpoint {stub.url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
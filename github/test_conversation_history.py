@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for conversation_history.py: whole-turn eviction and the token budget
+"""
+
+from conversation_history import ConversationHistory
+
+
+def chat(history: ConversationHistory, turns: int):
+    for n in range(turns):
+        history.add_user(f"question {n} " + "word " * 20)
+        history.add_assistant(f"answer {n} " + "word " * 20)
+
+
+def test_evicts_oldest_whole_turns():
+    """Test that the oldest turns go first and messages() fits the budget"""
+    history = ConversationHistory(max_tokens=200, system_prompt="Be brief.")
+    chat(history, 10)
+
+    messages = history.messages()
+    assert history.token_count <= 200
+    assert history.evicted_turns > 0
+    assert messages[0] == {"role": "system", "content": "Be brief."}
+    assert messages[1]["role"] == "user"
+    assert messages[-1]["content"].startswith("answer 9")
+
+
+def test_oversized_summary_stays_within_budget():
+    """Test that a summary longer than asked for is cut to fit the budget"""
+    calls = []
+
+    def summarize(previous, turns):
+        calls.append(len(turns))
+        return "summary " * 500
+
+    history = ConversationHistory(max_tokens=200, summarizer=summarize)
+    chat(history, 10)
+
+    assert calls
+    assert history.summary.startswith("summary")
+    assert history.token_count <= 200
+    assert len(history.messages()) > 1
+
+
+def test_summary_dropped_when_no_room():
+    """Test that a summary is dropped when the kept turns fill the budget"""
+    history = ConversationHistory(max_tokens=40, summarizer=lambda previous, turns: "summary")
+    history.add_user("hello")
+    history.add_assistant("hi")
+    # The newest turn is always kept, even when it alone is over the budget
+    history.add_user("word " * 60)
+
+    assert history.evicted_turns == 1
+    assert history.summary is None
+    assert len(history.messages()) == 1
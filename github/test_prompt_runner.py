@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for prompt_runner.py against the local stub chat server
+"""
+
+import time
+
+import pytest
+
+from first_api_call import GitHubModelsClient
+from prompt_runner import PromptRunner, RateLimiter
+from response_cache import ResponseCache
+from stub_chat_server import StubChatServer
+
+MODEL = "gpt-4o-mini"
+
+
+@pytest.fixture
+def make_client(tmp_path, monkeypatch):
+    """Factory for an uncached GitHubModelsClient talking to a stub server"""
+    monkeypatch.setenv("GITHUB_TOKEN", "stub-token")
+
+    def make(server):
+        return GitHubModelsClient(log_dir=tmp_path / "api_logs", endpoint=server.url, cache=False)
+    return make
+
+
+def prompts(count: int) -> list:
+    return [{"model": MODEL, "prompt": f"prompt {n}", "max_tokens": 20} for n in range(count)]
+
+
+def test_retries_429_and_keeps_indexes(make_client):
+    """Test that 429s pause and retry the prompt and results keep their index"""
+    # The runner allows more than the server does, so the server answers 429
+    with StubChatServer(requests_per_minute=3, window=1.0, latency=0.01) as server:
+        runner = PromptRunner(make_client(server), max_workers=4, max_retries=10,
+                              limits={MODEL: {"requests_per_minute": None}})
+        results = list(runner.run(prompts(8)))
+
+    assert sorted(result.index for result in results) == list(range(8))
+    for result in results:
+        assert result.error is None
+        assert result.text.endswith(f"prompt {result.index}")
+    assert server.rate_limited > 0
+    assert sum(result.attempts - 1 for result in results) == server.rate_limited
+    assert server.request_count == 8 + server.rate_limited
+
+
+def test_never_exceeds_model_rate(make_client):
+    """Test that the limiter keeps every window under the server's limit"""
+    # A little longer than the server's window for clock differences
+    with StubChatServer(requests_per_minute=3, window=1.0) as server:
+        runner = PromptRunner(make_client(server), max_workers=6,
+                              limits={MODEL: {"requests_per_minute": 3, "window": 1.1}})
+        results = runner.run_all(prompts(9))
+
+    assert [result.index for result in results] == list(range(9))
+    assert all(result.attempts == 1 for result in results)
+    assert server.rate_limited == 0
+    assert server.request_count == 9
+
+
+def test_cache_counts_one_lookup_per_prompt(tmp_path, monkeypatch):
+    """Test that a cached batch counts one miss per prompt, even with retries"""
+    monkeypatch.setenv("GITHUB_TOKEN", "stub-token")
+    batch = [dict(spec, temperature=0) for spec in prompts(4)]
+    with StubChatServer(requests_per_minute=2, window=1.0) as server:
+        client = GitHubModelsClient(log_dir=tmp_path / "api_logs", endpoint=server.url,
+                                    cache=ResponseCache(tmp_path / "cache"))
+        runner = PromptRunner(client, max_workers=4, max_retries=10,
+                              limits={MODEL: {"requests_per_minute": None}})
+        runner.run_all(batch)
+        cached = runner.run_all(batch)
+
+    assert server.rate_limited > 0
+    assert all(result.attempts == 0 for result in cached)
+    stats = client.cache.stats()
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (4, 4, 4)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_sliding_window_limit():
+    """Test that no window holds more than requests_per_minute requests"""
+    limiter = RateLimiter(requests_per_minute=2, window=0.3)
+
+    sent = []
+    for _ in range(6):
+        limiter.acquire()
+        sent.append(time.monotonic())
+
+    # Two at once, then each pair one window after the previous pair
+    assert sent[1] - sent[0] < 0.05
+    for first, third in zip(sent, sent[2:]):
+        assert third - first >= 0.3
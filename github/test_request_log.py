@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for request_log.py: rotation and appends from several processes
+"""
+
+import json
+import multiprocessing
+
+from request_log import RequestLog, RequestLogReader, list_segments
+
+
+def entry(n: int, writer: int = 0) -> dict:
+    return {"model": "gpt-4o-mini", "writer": writer, "n": n, "prompt": "x" * 40}
+
+
+def test_rotates_at_size_limit(tmp_path):
+    """Test rollover at max_bytes, pruning of old segments and reading back"""
+    with RequestLog(tmp_path, max_bytes=1000, keep_segments=2, flush_interval=60) as log:
+        for n in range(100):
+            log.write(entry(n))
+            if n % 5 == 4:
+                log.flush()
+
+    segments = list_segments(tmp_path)
+    rotated, active = segments[:-1], segments[-1]
+    assert active.name == "requests.jsonl"
+    # Only the two newest rotated segments are kept
+    numbers = [int(path.name.split(".")[1]) for path in rotated]
+    assert len(numbers) == 2 and numbers[0] > 1
+    assert numbers[1] == numbers[0] + 1
+    assert all(path.stat().st_size >= 1000 for path in rotated)
+    assert active.stat().st_size < 1000
+
+    # The kept segments hold the newest entries, in order
+    entries = list(RequestLogReader(tmp_path).iter_entries(reverse=False))
+    numbers = [e["n"] for e in entries]
+    assert numbers == list(range(100 - len(numbers), 100))
+    assert RequestLogReader(tmp_path).tail(3) == [entry(97), entry(98), entry(99)]
+
+
+def test_rotates_at_entry_limit(tmp_path):
+    """Test rollover after max_entries lines"""
+    with RequestLog(tmp_path, max_entries=10, keep_segments=10, flush_interval=60) as log:
+        for n in range(25):
+            log.write(entry(n))
+            log.flush()
+
+    segments = list_segments(tmp_path)
+    assert [len(path.read_text().splitlines()) for path in segments] == [10, 10, 5]
+
+
+def _append(directory, writer: int, count: int):
+    log = RequestLog(directory, max_bytes=4000, keep_segments=1000,
+                     flush_interval=0.01, buffer_size=7)
+    for n in range(count):
+        log.write(entry(n, writer))
+    log.close()
+
+
+def test_concurrent_appends_from_processes(tmp_path):
+    """Test that processes sharing a directory lose and corrupt no entries"""
+    writers, count = 4, 500
+    processes = [multiprocessing.Process(target=_append, args=(tmp_path, writer, count))
+                 for writer in range(writers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    lines = [line for path in list_segments(tmp_path) for line in path.read_text().splitlines()]
+    entries = [json.loads(line) for line in lines]
+    assert len(list_segments(tmp_path)) > 2
+    assert sorted((e["writer"], e["n"]) for e in entries) == [
+        (writer, n) for writer in range(writers) for n in range(count)
+    ]
+    # Each process's entries stay in the order it wrote them
+    for writer in range(writers):
+        assert [e["n"] for e in entries if e["writer"] == writer] == list(range(count))
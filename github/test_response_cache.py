@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for response_cache.py: keys, TTL, LRU eviction and lazy creation
+"""
+
+import os
+import time
+
+from azure.ai.inference.models import ChatCompletions
+
+from response_cache import ResponseCache
+
+MESSAGES = [{"role": "user", "content": "2 + 2?"}]
+
+
+def completion(text: str) -> ChatCompletions:
+    return ChatCompletions({
+        "id": "chatcmpl-test",
+        "created": 1700000000,
+        "model": "gpt-4o-mini",
+        "choices": [{"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": text}}],
+        "usage": {"prompt_tokens": 4, "completion_tokens": 2, "total_tokens": 6},
+    })
+
+
+def key(**overrides) -> str:
+    args = {"endpoint": "https://models.example", "model": "gpt-4o-mini",
+            "messages": MESSAGES, "temperature": 0, "max_tokens": 100, "kwargs": {}}
+    args.update(overrides)
+    return ResponseCache.key(**args)
+
+
+def test_key_is_stable():
+    """Test that keys depend on what shapes the response, and only on that"""
+    assert key() == key()
+    assert len(key()) == 64
+    # Parameter order and transport options do not matter
+    assert key(kwargs={"top_p": 1, "seed": 3}) == key(kwargs={"seed": 3, "top_p": 1})
+    assert key(kwargs={"retry_status": 0, "timeout": 5}) == key()
+
+    for changed in ({"model": "gpt-4o"}, {"temperature": 0.2}, {"max_tokens": 50},
+                    {"endpoint": "http://127.0.0.1:8765"}, {"kwargs": {"seed": 3}},
+                    {"messages": [{"role": "user", "content": "3 + 3?"}]}):
+        assert key(**changed) != key()
+
+
+def test_round_trip_and_lazy_directory(tmp_path):
+    """Test that responses come back as ChatCompletions, stored on first put"""
+    directory = tmp_path / "cache"
+    cache = ResponseCache(directory)
+    assert not directory.exists()
+    assert cache.get(key()) is None
+
+    cache.put(key(), completion("4"))
+
+    cached = cache.get(key())
+    assert isinstance(cached, ChatCompletions)
+    assert cached.choices[0].message.content == "4"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    """Test that entries older than the TTL are misses and get deleted"""
+    cache = ResponseCache(tmp_path, ttl=0.2)
+    cache.put(key(), completion("4"))
+    assert cache.get(key()) is not None
+
+    time.sleep(0.3)
+
+    assert cache.get(key()) is None
+    assert cache.stats()["expired"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.size == 0
+    assert not list(tmp_path.glob("??/*.json"))
+
+
+def test_evicts_least_recently_used(tmp_path):
+    """Test that eviction past max_bytes removes the least recently used entries"""
+    cache = ResponseCache(tmp_path, max_bytes=10 ** 6)
+    keys = [key(max_tokens=n) for n in range(4)]
+    for n, k in enumerate(keys):
+        cache.put(k, completion(f"answer {n}"))
+        # Distinct access times even on coarse filesystem clocks
+        os.utime(cache._path(k), (1000 + n, 1000 + n))
+    entry_size = cache.size // 4
+
+    # Reading the oldest entry makes it the most recently used one
+    assert cache.get(keys[0]) is not None
+    cache.max_bytes = entry_size * 4
+    cache.put(key(max_tokens=99), completion("answer 99"))
+
+    assert cache.stats()["evictions"] >= 1
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(key(max_tokens=99)) is not None
+    assert cache.size <= cache.max_bytes